@@ -1,254 +1,26 @@
 from IMS import *
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-
-class DashboardPanel(QWidget):
-    def __init__(self, conn, parent=None):
-        super().__init__(parent)
-        self.conn = conn
-        self.setGeometry(10, 10, 1140, 500)
-        self.setStyleSheet("background-color: rgb(70, 70, 70); border-radius: 10px;")
-
-        self.main_layout = QVBoxLayout(self)
-
-        # Title
-        title = QLabel("Dashboard")
-        title.setStyleSheet("color: white; font-size: 22px; font-weight: bold;")
-        title.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.main_layout.addWidget(title)
-
-        # Store widgets for refresh later
-        self.summary_layout = QHBoxLayout()
-        self.graph_layout = QHBoxLayout()
-
-        self.main_layout.addLayout(self.summary_layout)
-        self.main_layout.addLayout(self.graph_layout)
-
-        low_stock_header = QHBoxLayout()
-        self.low_stock_label = QLabel("Low Stock Products")
-        self.low_stock_label.setStyleSheet("color: white; font-size: 14px; font-weight: bold;")
-        self.low_stock_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        low_stock_header.addWidget(self.low_stock_label)
-
-        # Refresh button
-        self.refresh_btn = QPushButton("⟳ Refresh")
-        self.refresh_btn.setFixedWidth(100)
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgb(50, 150, 200);
-                color: white;
-                border-radius: 8px;
-                padding: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgb(60, 170, 220);
-            }
-        """)
-        self.refresh_btn.clicked.connect(self.refresh_dashboard)
-        low_stock_header.addWidget(self.refresh_btn, alignment=Qt.AlignmentFlag.AlignRight)
-
-        self.main_layout.addLayout(low_stock_header)
-
-        # Create low stock table
-        self.low_stock_table = QTableWidget()
-        self.low_stock_table.setColumnCount(4)
-        self.low_stock_table.setHorizontalHeaderLabels(["Product Name", "Type", "Quantity", "Reorder Level"])
-        self.low_stock_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.low_stock_table.verticalHeader().setVisible(False)
-        self.low_stock_table.setStyleSheet("""
-            QTableWidget {
-                color: black;
-                background-color: #f8f9fa;
-                alternate-background-color: #e9ecef;
-                gridline-color: #b0b0b0;
-                border-radius: 10px;
-                font-size: 13px;
-                selection-background-color: rgb(70,130,250);
-                selection-color: white;
-            }
-            QHeaderView::section {
-                background-color: rgb(50,150,200);
-                color: white;
-                font-weight: bold;
-                border: none;
-                padding: 6px;
-            }
-            QHeaderView::section:first { border-top-left-radius: 10px; }
-            QHeaderView::section:last { border-top-right-radius: 10px; }
-            QTableCornerButton::section { background-color: rgb(50,150,200); border: none; }
-            QScrollBar:vertical {
-                background: #e2e2e2;
-                width: 10px;
-                margin: 2px 0 2px 0;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgb(130,180,230), stop:1 rgb(90,150,210));
-                border-radius: 20px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgb(150,200,250), stop:1 rgb(100,160,220));
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-                background: none;
-            }
-        """)
-        self.main_layout.addWidget(self.low_stock_table)
-
-        self.refresh_dashboard()
-
-    def refresh_dashboard(self):
-        """Refresh all dashboard data"""
-        for i in reversed(range(self.summary_layout.count())):
-            widget = self.summary_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        for i in reversed(range(self.graph_layout.count())):
-            widget = self.graph_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
-        data = self.fetch_dashboard_data()
-
-        # Summary stats
-        for label, value in [
-            ("Total Categories", data["total_categories"]),
-            ("Total Issued Items", data["total_stockout"]),
-            ("Total Products", data["total_products"]),
-        ]:
-            box = QLabel(f"{label}\n{value}")
-            box.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            box.setStyleSheet("""
-                QLabel {
-                    background-color: rgb(80, 80, 80);
-                    color: white;
-                    border-radius: 10px;
-                    padding: 10px;
-                    font-size: 16px;
-                }
-            """)
-            self.summary_layout.addWidget(box)
-
-        # Graphs
-        from matplotlib import pyplot as plt
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-
-        # Pie Chart – Category Distribution
-        fig1, ax1 = plt.subplots(figsize=(3.8, 3.8))
-        categories, counts = zip(*data["category_distribution"]) if data["category_distribution"] else ([], [])
-        if categories:
-            ax1.pie(counts, labels=categories, autopct='%1.1f%%', startangle=90)
-            ax1.set_title("Category Distribution", fontsize=10)
-        else:
-            ax1.text(0.5, 0.5, "No Data", ha='center', va='center')
-        self.graph_layout.addWidget(FigureCanvas(fig1))
-        plt.close(fig1)
-
-        # Bar Graph – Top 5 Products by Quantity
-        fig2, ax2 = plt.subplots(figsize=(4.5, 2.2))
-        fig2.tight_layout(pad=2.0)
-        product_names, quantities = zip(*data["top_products"]) if data["top_products"] else ([], [])
-        if product_names:
-            bars = ax2.bar(product_names, quantities)
-            ax2.set_title("Top 5 Products by Quantity", fontsize=10)
-            ax2.set_xticks(range(len(product_names)))
-            ax2.set_xticklabels(product_names, rotation=30, ha='right', fontsize=7)
-            for bar in bars:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width() / 2, height + 0.5, str(int(height)),
-                         ha='center', va='bottom', fontsize=7, color='white')
-        else:
-            ax2.text(0.5, 0.5, "No Data", ha='center', va='center')
-        self.graph_layout.addWidget(FigureCanvas(fig2))
-        plt.close(fig2)
-
-        # Line Chart – Stock Movement Trend
-        fig3, ax3 = plt.subplots(figsize=(4.5, 3.8))
-        ax3.plot(data["stock_movement"]["labels"], data["stock_movement"]["stockin"], marker='o', label="Stock In")
-        ax3.plot(data["stock_movement"]["labels"], data["stock_movement"]["stockout"], marker='o', label="Stock Out")
-        ax3.set_title("Stock Movement Trend", fontsize=10)
-        ax3.legend()
-        self.graph_layout.addWidget(FigureCanvas(fig3))
-        plt.close(fig3)
-
-        # Update Low Stock Table
-        low_stock_data = data["low_stock_products"]
-        self.low_stock_table.setRowCount(len(low_stock_data))
-        for row, (product_name, type_name, quantity, reorder_level) in enumerate(low_stock_data):
-            self.low_stock_table.setItem(row, 0, QTableWidgetItem(product_name))
-            self.low_stock_table.setItem(row, 1, QTableWidgetItem(type_name))
-
-            qty_item = QTableWidgetItem(str(quantity))
-            if quantity <= reorder_level:
-                qty_item.setForeground(QColor("red"))
-            elif quantity <= reorder_level + 5:
-                qty_item.setForeground(QColor("orange"))
-            self.low_stock_table.setItem(row, 2, qty_item)
-            self.low_stock_table.setItem(row, 3, QTableWidgetItem(str(reorder_level)))
-
-    def fetch_dashboard_data(self):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM category")
-        total_categories = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM products")
-        total_products = cursor.fetchone()[0]
-        cursor.execute("SELECT IFNULL(SUM(Quantity), 0) FROM stockout")
-        total_stockout = cursor.fetchone()[0]
-        cursor.execute("""
-            SELECT c.CategoryName, COUNT(p.ProductID)
-            FROM category c
-            JOIN type t ON c.CategoryID = t.CategoryID
-            JOIN products p ON t.TypeID = p.TypeID
-            GROUP BY c.CategoryName
-        """)
-        category_distribution = cursor.fetchall()
-        cursor.execute("""
-            SELECT ProductName, Quantity
-            FROM products
-            ORDER BY Quantity DESC LIMIT 5
-        """)
-        top_products = cursor.fetchall()
-        cursor.execute("""
-            SELECT p.ProductID,
-                   IFNULL(SUM(si.Quantity), 0) AS StockIn,
-                   IFNULL(SUM(so.Quantity), 0) AS StockOut
-            FROM products p
-            LEFT JOIN stockin si ON p.ProductID = si.ProductID
-            LEFT JOIN stockout so ON p.ProductID = so.ProductID
-            GROUP BY p.ProductID
-            ORDER BY p.ProductID ASC
-        """)
-        rows = cursor.fetchall()
-        labels = [str(r[0]) for r in rows]
-        stockin = [r[1] for r in rows]
-        stockout = [r[2] for r in rows]
-        cursor.execute("""
-            SELECT p.ProductName, t.TypeName, p.Quantity, p.ReorderLevel
-            FROM products p
-            JOIN type t ON p.TypeID = t.TypeID
-            WHERE p.Quantity <= p.ReorderLevel + 5
-            ORDER BY p.Quantity ASC
-        """)
-        low_stock_products = cursor.fetchall()
-        cursor.close()
-        return {
-            "total_categories": total_categories,
-            "total_products": total_products,
-            "total_stockout": total_stockout,
-            "category_distribution": category_distribution,
-            "top_products": top_products,
-            "stock_movement": {
-                "labels": labels,
-                "stockin": stockin,
-                "stockout": stockout,
-            },
-            "low_stock_products": low_stock_products,
-        }
+from Models import ProductTableModel, STOCK_COLUMNS, INVENTORY_COLUMNS, CATEGORY_PRODUCT_COLUMNS
+from Inventory import fetch_product, fetch_products, fetch_product_page, INVENTORY_SELECT, STOCK_SELECT
+from Search import SearchController
+from Dashboard import DashboardPanel
+import Summary
+import Stock
+from Stock import StockError
+from StockBatch import BatchStockDialog
+from Importer import ImportTask
+from Reference import reference_cache
+from Alerts import AlertEngine, AlertTray
+from Changes import ChangeFeed, PRODUCT, SUPPLIER, ACCOUNT, UPSERT, DELETE, RELOAD, record_change
+from Export import ExportTask, export_formats
+from Reports import EXPORT_REPORTS, MOVEMENT_REPORT_COLUMNS, count_report, fetch_report_page, name_accounts
+from Audit import audit_writer
+import Archive
+from Archive import ArchiveTask, ARCHIVE_AFTER_DAYS
+from Forecast import ForecastTask, FORECAST_DAYS
+from AuditPanel import AuditPanel
+from OrdersPanel import OrdersPanel
+import os
+from PyQt6.QtCore import QThreadPool, QDate
 
 class ButtonGroupManager:
     def __init__(self):
@@ -304,21 +76,22 @@ class CustomButton(QPushButton):
         self.set_selected(False)
 
 class AdminDashboard(QWidget):
-    def __init__(self, login_widget, username, conn):
+    def __init__(self, login_widget, username, pool):
         super().__init__()
         self.login_widget = login_widget
         self.username = username
-        self.conn = conn
+        self.pool = pool
+        self.refs = reference_cache(pool)
+        self.audit = audit_writer(pool)
+        # Started before any panel loads so nothing committed in between is missed
+        self.change_feed = ChangeFeed(pool, self)
+        self.change_feed.changed.connect(self.apply_changes)
+        self.change_feed.start()
+        self.alerts = AlertEngine(pool, self)
+        self.alerts.start()
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT AccountID FROM accounts WHERE UserName=%s", (self.username,))
-            result = cursor.fetchone()
-            cursor.close()
-            if result:
-                self.current_user_id = result[0]
-            else:
-                self.current_user_id = None
+            self.current_user_id = self.refs.account_id(self.username)
         except Exception as e:
             QMessageBox.critical(self, "Database Error", str(e))
             self.current_user_id = None
@@ -334,6 +107,8 @@ class AdminDashboard(QWidget):
         self.category_panel = None
         self.reports_panel = None
         self.users_panel = None
+        self.audit_panel = None
+        self.orders_panel = None
 
         self.buttonPanel = QWidget(self)
         self.buttonPanel.setGeometry(10, 10, 160, 630)
@@ -352,31 +127,43 @@ class AdminDashboard(QWidget):
         self.dashboard_btn = CustomButton(
             "Dashboard", self.buttonPanel,
             "rgb(60, 146, 193)", "cyan", "cyan", self.button_group)
-        self.dashboard_btn.setGeometry(20, 150, 120, 40)
+        self.dashboard_btn.setGeometry(20, 140, 120, 40)
         self.dashboard_btn.clicked.connect(self.show_dashboard_panel)
 
         self.inventory_btn = CustomButton("Inventory", self.buttonPanel,
                                           "rgb(60, 146, 193)", "cyan", "cyan", self.button_group)
-        self.inventory_btn.setGeometry(20, 230, 120, 40)
+        self.inventory_btn.setGeometry(20, 200, 120, 40)
         self.inventory_btn.clicked.connect(self.show_inventory_panel)
 
         self.category_btn = CustomButton("Category", self.buttonPanel,
                                          "rgb(60, 146, 193)", "cyan", "cyan", self.button_group)
-        self.category_btn.setGeometry(20, 310, 120, 40)
+        self.category_btn.setGeometry(20, 260, 120, 40)
         self.category_btn.clicked.connect(self.show_category_panel)
 
         self.reports_btn = CustomButton(
             "Reports", self.buttonPanel,
             "rgb(60, 146, 193)", "cyan", "cyan", self.button_group)
-        self.reports_btn.setGeometry(20, 390, 120, 40)
+        self.reports_btn.setGeometry(20, 320, 120, 40)
         self.reports_btn.clicked.connect(self.show_reports_panel)
 
+        self.orders_btn = CustomButton(
+            "Orders", self.buttonPanel,
+            "rgb(60, 146, 193)", "cyan", "cyan", self.button_group)
+        self.orders_btn.setGeometry(20, 380, 120, 40)
+        self.orders_btn.clicked.connect(self.show_orders_panel)
+
         self.users_btn = CustomButton(
             "Users", self.buttonPanel,
             "rgb(60, 146, 193)", "cyan", "cyan", self.button_group)
-        self.users_btn.setGeometry(20, 470, 120, 40)
+        self.users_btn.setGeometry(20, 440, 120, 40)
         self.users_btn.clicked.connect(self.show_users_panel)
 
+        self.audit_btn = CustomButton(
+            "Audit Log", self.buttonPanel,
+            "rgb(60, 146, 193)", "cyan", "cyan", self.button_group)
+        self.audit_btn.setGeometry(20, 500, 120, 40)
+        self.audit_btn.clicked.connect(self.show_audit_panel)
+
         self.back_btn = CustomButton(
             "←", self.buttonPanel,
             "rgb(70, 70, 70)", "rgb(40,40,40)", "rgb(40,40,40)", self.button_group,
@@ -389,21 +176,19 @@ class AdminDashboard(QWidget):
         self.topPanel.setStyleSheet("background-color: rgb(70, 70, 70)")
         self.topPanel.show()
 
+        # Low stock notifications
+        self.alert_tray = AlertTray(self.alerts, self.topPanel)
+        self.alert_tray.setGeometry(960, 30, 180, 40)
+
         self.analyticPanel = QWidget(self)
         self.analyticPanel.setGeometry(180, 120, 1160, 520)
         self.analyticPanel.setStyleSheet("background-color: rgb(70, 70, 70)")
         self.analyticPanel.show()
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT fname, lname FROM accounts WHERE username=%s",
-                (self.username,)
-            )
-            result = cursor.fetchone()
-            cursor.close()
+            account = self.refs.account(self.username)
 
-            if result:
-                fname, lname = result
+            if account:
+                fname, lname = account[2:4]
                 title_label = QLabel(f"CompForge Inventory Admin: {fname} {lname}", self.topPanel)
                 title_label.setGeometry(20, 30, 600, 40)
                 title_label.setStyleSheet("color: white; font-size: 24px; font-weight: bold;")
@@ -422,16 +207,32 @@ class AdminDashboard(QWidget):
 
     def hide_all_panels(self):
         for panel in [self.dashboard_panel, self.inventory_panel, self.category_panel,
-                      self.reports_panel, self.users_panel]:
+                      self.reports_panel, self.users_panel, self.audit_panel, self.orders_panel]:
             if panel:
                 panel.hide()
 
     def show_dashboard_panel(self):
         self.hide_all_panels()
         if not self.dashboard_panel:
-            self.dashboard_panel = DashboardPanel(self.conn, self.analyticPanel)
+            self.dashboard_panel = DashboardPanel(self.pool, self.alerts, self.analyticPanel)
         self.dashboard_panel.show()
 
+    def show_audit_panel(self):
+        self.hide_all_panels()
+        if not self.audit_panel:
+            self.audit_panel = AuditPanel(self.pool, self.analyticPanel)
+        else:
+            self.audit_panel.load_entries()
+        self.audit_panel.show()
+
+    def show_orders_panel(self):
+        self.hide_all_panels()
+        if not self.orders_panel:
+            self.orders_panel = OrdersPanel(self.pool, self.current_user_id, self.analyticPanel)
+        else:
+            self.orders_panel.load_orders()
+        self.orders_panel.show()
+
     def show_inventory_panel(self):
         self.hide_all_panels()
 
@@ -482,17 +283,20 @@ class AdminDashboard(QWidget):
             self.search_btn.clicked.connect(self.search_product)
 
             # Table setup
-            self.table = QTableWidget(self.inventory_panel)
+            self.table = QTableView(self.inventory_panel)
             self.table.setGeometry(20, 100, 1100, 350)
             # Table setup
-            self.table.setColumnCount(9)
-            self.table.setHorizontalHeaderLabels([
-                "ProductID", "ProductName", "Type", "Supplier",
-                "Price", "Stock", "Total", "ReorderLevel", "DateSupplied"
-            ])
+            self.product_model = ProductTableModel(
+                INVENTORY_COLUMNS, self,
+                page_source=lambda after_id, limit: self.pool.run(fetch_product_page, INVENTORY_SELECT, after_id, limit))
+            self.table.setModel(self.product_model)
+            self.search_controller = SearchController(self.product_model, self.pool, self)
+            self.search_controller.failed.connect(
+                lambda message: QMessageBox.critical(self, "Database Error", message))
+            self.search_controller.load_index()
             self.table.setColumnWidth(1, 200)
             self.table.setStyleSheet("""
-                QTableWidget {
+                QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -592,10 +396,14 @@ class AdminDashboard(QWidget):
             self.update_btn.setGeometry(185, 460, 150, 30)
             self.update_btn.clicked.connect(self.update_product)
 
-            self.delete_btn = QPushButton("Delete", self.inventory_panel)
+            self.delete_btn = QPushButton("Retire", self.inventory_panel)
             self.delete_btn.setGeometry(350, 460, 150, 30)
             self.delete_btn.clicked.connect(self.delete_product)
 
+            self.import_btn = QPushButton("Import", self.inventory_panel)
+            self.import_btn.setGeometry(515, 460, 150, 30)
+            self.import_btn.clicked.connect(self.import_products)
+
             self.stock_in_btn = QPushButton("Stock In", self.inventory_panel)
             self.stock_in_btn.setGeometry(330, 60, 150, 30)
             self.stock_in_btn.clicked.connect(self.stock_in)
@@ -604,13 +412,24 @@ class AdminDashboard(QWidget):
             self.stock_out_btn.setGeometry(500, 60, 150, 30)
             self.stock_out_btn.clicked.connect(self.stock_out)
 
+            self.batch_stock_btn = QPushButton("Batch In/Out", self.inventory_panel)
+            self.batch_stock_btn.setGeometry(670, 60, 150, 30)
+            self.batch_stock_btn.clicked.connect(self.batch_stock)
+
+            self.forecast_btn = QPushButton("Forecast", self.inventory_panel)
+            self.forecast_btn.setGeometry(840, 60, 150, 30)
+            self.forecast_btn.clicked.connect(self.recompute_forecasts)
+
             # Shared button style
             for btn in [
                 self.add_btn,
                 self.update_btn,
                 self.delete_btn,
+                self.import_btn,
                 self.stock_in_btn,
                 self.stock_out_btn,
+                self.batch_stock_btn,
+                self.forecast_btn,
             ]:
                 btn.setStyleSheet("""
                     QPushButton {
@@ -644,35 +463,49 @@ class AdminDashboard(QWidget):
         # -----------------------------------------------------
 
     def load_products(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-                       SELECT p.ProductID,
-                              p.ProductName,
-                              t.TypeName,
-                              s.SupplierName,
-                              p.Price,
-                              p.Quantity,
-                              p.Total,
-                              p.ReorderLevel,
-                              p.DateSupplied
-                       FROM products AS p
-                                LEFT JOIN type AS t ON p.TypeID = t.TypeID
-                                LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
-                       """)
-        rows = cursor.fetchall()
-        cursor.close()
-
-        self.table.setRowCount(0)
-        self.table.setHorizontalHeaderLabels([
-            "Product ID", "Product Name", "Type", "Supplier",
-            "Price", "Stock", "Total", "Reorder Level", "Date Supplied"
-        ])
-
-        for row_data in rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            for column, data in enumerate(row_data):
-                self.table.setItem(row, column, QTableWidgetItem(str(data)))
+        # Only the first keyset page is fetched here, the view pulls the rest while scrolling
+        self.product_model.reload()
+
+    def apply_product_rows(self, rows):
+        # Patch just the rows a write returned into the table and the search index
+        searching = bool(self.search_bar.text().strip())
+        for row in rows:
+            if row is not None:
+                self.product_model.upsert_row(row, insert=not searching)
+                self.search_controller.index_upsert(row)
+
+    def apply_changes(self, changes):
+        # Deltas committed by any terminal since the last poll of the change feed
+        if SUPPLIER in changes:
+            self.refs.invalidate("suppliers")
+        if ACCOUNT in changes:
+            self.refs.invalidate("accounts")
+        products = changes.get(PRODUCT)
+        if not products:
+            return
+        self.alerts.apply_changes(products)
+        if self.dashboard_panel:
+            self.dashboard_panel.apply_changes()
+        if self.inventory_panel is None:
+            return
+        if RELOAD in products.values():
+            self.load_products()
+            self.search_controller.load_index()
+            return
+        for product_id, action in products.items():
+            if action == DELETE:
+                self.product_model.remove_key(product_id)
+                self.search_controller.index_remove(product_id)
+        try:
+            rows = self.pool.run(fetch_products, [pid for pid, action in products.items() if action == UPSERT])
+        except Exception as e:
+            print("Error:", e)
+            return
+        self.apply_product_rows(rows)
+
+    def closeEvent(self, event):
+        self.change_feed.stop()
+        super().closeEvent(event)
 
         # -----------------------------------------------------
         # SEARCH PRODUCT
@@ -683,44 +516,46 @@ class AdminDashboard(QWidget):
 
         # If search bar is empty, reload all products
         if keyword == "":
+            self.search_controller.cancel()
             self.load_products()
             return
 
-        cursor = self.conn.cursor()
-        query = """
-                SELECT p.ProductID, \
-                       p.ProductName, \
-                       t.TypeName, \
-                       s.SupplierName, \
-                       p.Price, \
-                       p.Quantity, \
-                       p.Total, \
-                       p.ReorderLevel
-                FROM products AS p
-                         LEFT JOIN type AS t ON p.TypeID = t.TypeID
-                         LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
-                WHERE CAST(p.ProductID AS CHAR) LIKE %s
-                   OR p.ProductName LIKE %s
-                   OR t.TypeName LIKE %s
-                   OR s.SupplierName LIKE %s \
-                """
-        # We use CAST(ProductID AS CHAR) so we can search it as text
-        cursor.execute(query, (
-            f"%{keyword}%",
-            f"%{keyword}%",
-            f"%{keyword}%",
-            f"%{keyword}%"
-        ))
-        rows = cursor.fetchall()
-        cursor.close()
-
-        # Clear table and show results
-        self.table.setRowCount(0)
-        for row_data in rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            for column, data in enumerate(row_data):
-                self.table.setItem(row, column, QTableWidgetItem(str(data)))
+        # Debounced; the query runs on a worker thread and streams into the model
+        self.search_controller.search(keyword)
+
+        # -----------------------------------------------------
+        # IMPORT PRODUCTS FROM CSV / XLSX
+        # -----------------------------------------------------
+
+    def import_products(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Products", "",
+                                              "Product files (*.csv *.xlsx);;CSV (*.csv);;Excel (*.xlsx)")
+        if not path:
+            return
+
+        progress = QProgressDialog("Importing products...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Import Products")
+        progress.setMinimumDuration(0)
+        task = ImportTask(self.pool, path)
+        # Keep the signals alive until the task reports back
+        self.import_signals = task.signals
+        progress.canceled.connect(task.cancel)
+        task.signals.progress.connect(lambda count: progress.setLabelText(f"{count} products imported..."))
+
+        def finished(count):
+            progress.reset()
+            self.audit.log(self.current_user_id, None, f"Imported {count} products from {os.path.basename(path)}")
+            QMessageBox.information(self, "Success", f"{count} products imported.")
+            self.refs.invalidate("suppliers")
+            # The import recorded a RELOAD; the change feed reloads the products and the index
+
+        def failed(message):
+            progress.reset()
+            QMessageBox.critical(self, "Import Error", f"Nothing was imported:\n{message}")
+
+        task.signals.finished.connect(finished)
+        task.signals.failed.connect(failed)
+        QThreadPool.globalInstance().start(task)
 
         # -----------------------------------------------------
         # ADD PRODUCT (placeholder)
@@ -833,9 +668,7 @@ class AdminDashboard(QWidget):
 
         # Load dropdowns from DB
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT TypeID, TypeName FROM type")
-            for tid, tname in cursor.fetchall():
+            for tid, tname in self.refs.types():
                 type_combo.addItem(tname, tid)
 
         except Exception as e:
@@ -894,19 +727,9 @@ class AdminDashboard(QWidget):
 
             # Check if supplier exists
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT SupplierID FROM suppliers WHERE SupplierName=%s", (supplier_name,))
-                result = cursor.fetchone()
-
-                if result:
-                    supplier_id = result[0]  # existing supplier
-                else:
-                    # Insert new supplier
-                    cursor.execute("INSERT INTO suppliers (SupplierName) VALUES (%s)", (supplier_name,))
-                    self.conn.commit()
-                    supplier_id = cursor.lastrowid  # get the newly inserted SupplierID
-
-                cursor.close()
+                with self.pool.transaction() as conn, conn.cursor() as cursor:
+                    # Existing suppliers come from the cache, new ones are inserted
+                    supplier_id = self.refs.resolve_supplier(cursor, supplier_name)
             except Exception as e:
                 QMessageBox.critical(dialog, "Database Error", f"Failed to check/insert supplier:\n{str(e)}")
                 return
@@ -940,17 +763,20 @@ class AdminDashboard(QWidget):
 
             # Insert into DB
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                               INSERT INTO products (ProductName, TypeID, SupplierID, Price, Quantity, Total,
-                                                     ReorderLevel, DateSupplied)
-                               VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                               """, (name, type_id, supplier_id, price, quantity, total, reorder, date_supplied))
-                self.conn.commit()
-                cursor.close()
+                with self.pool.transaction() as conn, conn.cursor() as cursor:
+                    cursor.execute("""
+                                   INSERT INTO products (ProductName, TypeID, SupplierID, Price, Quantity, Total,
+                                                         ReorderLevel, DateSupplied)
+                                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                                   """, (name, type_id, supplier_id, price, quantity, total, reorder, date_supplied))
+                    product_id = cursor.lastrowid
+                    Summary.product_added(cursor, type_id)
+                    record_change(cursor, PRODUCT, product_id)
+                    product_row = fetch_product(conn, product_id)
+                self.audit.log(self.current_user_id, product_id, f"Added product '{name}' with {quantity} in stock")
                 QMessageBox.information(dialog, "Success", "Product added successfully.")
                 dialog.accept()
-                self.load_products()  # refresh table
+                self.apply_product_rows([product_row])
             except Exception as e:
                 QMessageBox.critical(dialog, "Database Error", f"Failed to insert product:\n{str(e)}")
 
@@ -962,21 +788,21 @@ class AdminDashboard(QWidget):
         # -----------------------------------------------------
 
     def update_product(self):
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row == -1:
             QMessageBox.warning(self, "No product selected", "Select a product to update first.")
             return
 
         # Fetch current product details
-        product_id = self.table.item(row, 0).text()
-        product_name = self.table.item(row, 1).text()
-        product_type = self.table.item(row, 2).text()
-        supplier_name = self.table.item(row, 3).text()
-        price = self.table.item(row, 4).text()
-        quantity = self.table.item(row, 5).text()
-        total = self.table.item(row, 6).text()
-        reorder = self.table.item(row, 7).text()
-        date_supplied = self.table.item(row, 8).text()  # fetch current DateSupplied
+        product_id = self.product_model.text(row, 0)
+        product_name = self.product_model.text(row, 1)
+        product_type = self.product_model.text(row, 2)
+        supplier_name = self.product_model.text(row, 3)
+        price = self.product_model.text(row, 4)
+        quantity = self.product_model.text(row, 5)
+        total = self.product_model.text(row, 6)
+        reorder = self.product_model.text(row, 7)
+        date_supplied = self.product_model.text(row, 8)  # fetch current DateSupplied
 
         dialog = QDialog(self)
         dialog.setWindowTitle(f"Update Product ID: {product_id}")
@@ -1029,13 +855,13 @@ class AdminDashboard(QWidget):
         type_label = QLabel("Type:")
         type_combo = QComboBox()
         # Load types from DB
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT TypeID, TypeName FROM type")
         type_mapping = {}
-        for tid, tname in cursor.fetchall():
-            type_combo.addItem(tname, tid)
-            type_mapping[tname] = tid
-        cursor.close()
+        try:
+            for tid, tname in self.refs.types():
+                type_combo.addItem(tname, tid)
+                type_mapping[tname] = tid
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
         if product_type in type_mapping:
             type_combo.setCurrentText(product_type)
 
@@ -1108,16 +934,8 @@ class AdminDashboard(QWidget):
 
             # Check or insert supplier
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT SupplierID FROM suppliers WHERE SupplierName=%s", (supplier_name_val,))
-                result = cursor.fetchone()
-                if result:
-                    supplier_id = result[0]
-                else:
-                    cursor.execute("INSERT INTO suppliers (SupplierName) VALUES (%s)", (supplier_name_val,))
-                    self.conn.commit()
-                    supplier_id = cursor.lastrowid
-                cursor.close()
+                with self.pool.transaction() as conn, conn.cursor() as cursor:
+                    supplier_id = self.refs.resolve_supplier(cursor, supplier_name_val)
             except Exception as e:
                 QMessageBox.critical(dialog, "Database Error", f"Failed to check/insert supplier:\n{str(e)}")
                 return
@@ -1151,25 +969,29 @@ class AdminDashboard(QWidget):
 
             # Update DB
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                               UPDATE products
-                               SET ProductName=%s,
-                                   TypeID=%s,
-                                   SupplierID=%s,
-                                   Price=%s,
-                                   Quantity=%s,
-                                   Total=%s,
-                                   ReorderLevel=%s,
-                                   DateSupplied=%s
-                               WHERE ProductID = %s
-                               """, (name, type_id, supplier_id, price_val, quantity_val, total_val, reorder_val,
-                                     date_supplied_val, product_id))
-                self.conn.commit()
-                cursor.close()
+                with self.pool.transaction() as conn, conn.cursor() as cursor:
+                    Summary.product_retyped(cursor, product_id, type_id)
+                    cursor.execute("""
+                                   UPDATE products
+                                   SET ProductName=%s,
+                                       TypeID=%s,
+                                       SupplierID=%s,
+                                       Price=%s,
+                                       Quantity=%s,
+                                       Total=%s,
+                                       ReorderLevel=%s,
+                                       DateSupplied=%s
+                                   WHERE ProductID = %s
+                                   """, (name, type_id, supplier_id, price_val, quantity_val, total_val, reorder_val,
+                                         date_supplied_val, product_id))
+                    record_change(cursor, PRODUCT, product_id)
+                    product_row = fetch_product(conn, product_id)
+                self.audit.log(self.current_user_id, product_id,
+                               f"Updated product '{name}': price {price_val}, quantity {quantity_val}, "
+                               f"reorder level {reorder_val}")
                 QMessageBox.information(dialog, "Success", f"Product {product_id} updated successfully.")
                 dialog.accept()
-                self.load_products()
+                self.apply_product_rows([product_row])
             except Exception as e:
                 QMessageBox.critical(dialog, "Database Error", f"Failed to update product:\n{str(e)}")
 
@@ -1177,23 +999,24 @@ class AdminDashboard(QWidget):
         dialog.exec()
 
         # -----------------------------------------------------
-        # DELETE PRODUCT
+        # RETIRE PRODUCT
         # -----------------------------------------------------
 
     def delete_product(self):
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row == -1:
-            QMessageBox.warning(self, "No product selected", "Select a product to delete.")
+            QMessageBox.warning(self, "No product selected", "Select a product to retire.")
             return
 
-        product_id = self.table.item(row, 0).text()
+        product_id = self.product_model.text(row, 0)
+        product_name = self.product_model.text(row, 1)
 
-        # Confirm deletion
+        # Confirm retirement
         confirm = QMessageBox.question(
             self,
-            "Confirm Delete",
-            f"Are you sure you want to permanently delete Product ID {product_id}?\n"
-            "This will also delete all related stock-in and stock-out records.",
+            "Confirm Retire",
+            f"Are you sure you want to retire Product ID {product_id}?\n"
+            "It will no longer be listed or stocked; its stock-in and stock-out history is kept for reports.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
 
@@ -1201,28 +1024,24 @@ class AdminDashboard(QWidget):
             return
 
         try:
-            cursor = self.conn.cursor()
-
-            # Delete related records in stockin and stockout first
-            cursor.execute("DELETE FROM stockin WHERE ProductID = %s", (product_id,))
-            cursor.execute("DELETE FROM stockout WHERE ProductID = %s", (product_id,))
-
-            # Now delete the product itself
-            cursor.execute("DELETE FROM products WHERE ProductID = %s", (product_id,))
-            self.conn.commit()
-            cursor.close()
+            with self.pool.transaction() as conn:
+                retired = Archive.retire_product(conn, product_id)
+            if retired:
+                self.audit.log(self.current_user_id, int(product_id), f"Retired product '{product_name}'")
 
-            # Remove from table
-            self.table.removeRow(row)
+            # Remove from table and search index
+            self.product_model.remove_key(int(product_id))
+            self.search_controller.index_remove(int(product_id))
 
             QMessageBox.information(
                 self,
-                "Deleted",
-                f"Product ID {product_id} and its related stock-in/out records have been deleted successfully."
+                "Retired",
+                f"Product ID {product_id} has been retired." if retired
+                else f"Product ID {product_id} was already retired or removed."
             )
 
         except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"Failed to delete product:\n{str(e)}")
+            QMessageBox.critical(self, "Database Error", f"Failed to retire product:\n{str(e)}")
 
         # -----------------------------------------------------
         # STOCK IN
@@ -1239,7 +1058,7 @@ class AdminDashboard(QWidget):
             QPushButton { background-color: rgb(50,150,200); color: white; font-weight: bold; border-radius: 6px; padding: 6px; }
             QPushButton:hover { background-color: rgb(70,170,220); }
             QPushButton:pressed { background-color: rgb(30,130,180); }
-            QTableWidget {
+            QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -1334,10 +1153,11 @@ class AdminDashboard(QWidget):
         layout.addWidget(top_panel)
 
         # === Product Table ===
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels(
-            ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level"])
+        table = QTableView()
+        model = ProductTableModel(
+            STOCK_COLUMNS, dialog,
+            page_source=lambda after_id, limit: self.pool.run(fetch_product_page, STOCK_SELECT, after_id, limit))
+        table.setModel(model)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -1348,59 +1168,26 @@ class AdminDashboard(QWidget):
         layout.addWidget(table)
 
         # Load products
-        cursor = self.conn.cursor()
-        cursor.execute("""
-                       SELECT p.ProductID,
-                              p.ProductName,
-                              t.TypeName,
-                              s.SupplierName,
-                              p.Quantity,
-                              p.Price,
-                              p.ReorderLevel
-                       FROM products AS p
-                                LEFT JOIN type AS t ON p.TypeID = t.TypeID
-                                LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
-                       """)
-        rows = cursor.fetchall()
-        cursor.close()
-
-        table.setRowCount(0)
-        for row_data in rows:
-            row = table.rowCount()
-            table.insertRow(row)
-            for col, data in enumerate(row_data):
-                table.setItem(row, col, QTableWidgetItem(str(data)))
+        model.reload()
 
         # === Table selection updates top panel ===
         def update_top_panel():
-            row = table.currentRow()
+            row = table.currentIndex().row()
             if row == -1:
                 for f in fields.values():
                     f.clear()
                 return
             for i, key in enumerate(
-                    ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level"]):
-                fields[key].setText(table.item(row, i).text())
-
-            # Fetch DateSupplied from DB
-            product_id = table.item(row, 0).text()
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT DateSupplied, Quantity*Price FROM products WHERE ProductID=%s", (product_id,))
-                result = cursor.fetchone()
-                cursor.close()
-                if result:
-                    date_supplied, total = result
-                    fields["Date Supplied"].setText(str(date_supplied))
-                    fields["Total"].setText(f"{total:.2f}")
-            except Exception as e:
-                QMessageBox.critical(dialog, "Database Error", str(e))
+                    ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level",
+                     "Date Supplied"]):
+                fields[key].setText(model.text(row, i))
+            fields["Total"].setText(f"{model.value(row, 4) * model.value(row, 5):.2f}")
 
-        table.itemSelectionChanged.connect(update_top_panel)
+        table.selectionModel().selectionChanged.connect(update_top_panel)
 
         # === Confirm Stock In ===
         def confirm_stock_in():
-            row = table.currentRow()
+            row = table.currentIndex().row()
             if row == -1:
                 QMessageBox.warning(dialog, "Warning", "Select a product from the table first.")
                 return
@@ -1417,32 +1204,14 @@ class AdminDashboard(QWidget):
                 QMessageBox.warning(dialog, "Input Error", "Quantity must be a positive integer.")
                 return
 
-            product_id = table.item(row, 0).text()
-            current_qty = int(fields["Quantity"].text())
-            new_qty = current_qty + qty_received
-            new_total = float(fields["Price"].text()) * new_qty
-            new_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            product_id = model.text(row, 0)
 
             try:
-                # --- Update products table ---
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                               UPDATE products
-                               SET Quantity=%s,
-                                   Total=%s,
-                                   DateSupplied=%s
-                               WHERE ProductID = %s
-                               """, (new_qty, new_total, new_date, product_id))
-
-                # --- Insert into stockin table ---
-                cursor.execute("""
-                               INSERT INTO stockin (ProductID, AccountID, Quantity)
-                               VALUES (%s, %s, %s)
-                               """, (product_id, self.current_user_id,
-                                     qty_received))  # <-- Use your logged-in staff's AccountID
-
-                self.conn.commit()
-                cursor.close()
+                with self.pool.transaction() as conn:
+                    new_qty = Stock.stock_in(conn, product_id, self.current_user_id, qty_received)
+                    product_row = fetch_product(conn, product_id)
+                self.audit.log(self.current_user_id, int(product_id),
+                               f"Stock in: {qty_received} received, {new_qty} on hand")
 
                 # Success message
                 msg = QMessageBox(dialog)
@@ -1458,7 +1227,7 @@ class AdminDashboard(QWidget):
                 msg.exec()
 
                 dialog.accept()
-                self.load_products()
+                self.apply_product_rows([product_row])
             except Exception as e:
                 QMessageBox.critical(dialog, "Database Error", str(e))
 
@@ -1489,7 +1258,7 @@ class AdminDashboard(QWidget):
             QPushButton { background-color: rgb(50,150,200); color: white; font-weight: bold; border-radius: 6px; padding: 6px; }
             QPushButton:hover { background-color: rgb(70,170,220); }
             QPushButton:pressed { background-color: rgb(30,130,180); }
-            QTableWidget {
+            QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -1582,11 +1351,11 @@ class AdminDashboard(QWidget):
         layout.addWidget(top_panel)
 
         # === Product Table ===
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels(
-            ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level"]
-        )
+        table = QTableView()
+        model = ProductTableModel(
+            STOCK_COLUMNS, dialog,
+            page_source=lambda after_id, limit: self.pool.run(fetch_product_page, STOCK_SELECT, after_id, limit))
+        table.setModel(model)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -1597,59 +1366,27 @@ class AdminDashboard(QWidget):
         layout.addWidget(table)
 
         # === Load products ===
-        cursor = self.conn.cursor()
-        cursor.execute("""
-                       SELECT p.ProductID,
-                              p.ProductName,
-                              t.TypeName,
-                              s.SupplierName,
-                              p.Quantity,
-                              p.Price,
-                              p.ReorderLevel
-                       FROM products AS p
-                                LEFT JOIN type AS t ON p.TypeID = t.TypeID
-                                LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
-                       """)
-        rows = cursor.fetchall()
-        cursor.close()
-
-        table.setRowCount(0)
-        for row_data in rows:
-            row = table.rowCount()
-            table.insertRow(row)
-            for col, data in enumerate(row_data):
-                table.setItem(row, col, QTableWidgetItem(str(data)))
+        model.reload()
 
         # === Update top panel on selection ===
         def update_top_panel():
-            row = table.currentRow()
+            row = table.currentIndex().row()
             if row == -1:
                 for f in fields.values():
                     f.clear()
                 return
 
             for i, key in enumerate(
-                    ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level"]):
-                fields[key].setText(table.item(row, i).text())
-
-            product_id = table.item(row, 0).text()
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT DateSupplied, Quantity*Price FROM products WHERE ProductID=%s", (product_id,))
-                result = cursor.fetchone()
-                cursor.close()
-                if result:
-                    date_supplied, total = result
-                    fields["Date Supplied"].setText(str(date_supplied))
-                    fields["Total"].setText(f"{total:.2f}")
-            except Exception as e:
-                QMessageBox.critical(dialog, "Database Error", str(e))
+                    ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level",
+                     "Date Supplied"]):
+                fields[key].setText(model.text(row, i))
+            fields["Total"].setText(f"{model.value(row, 4) * model.value(row, 5):.2f}")
 
-        table.itemSelectionChanged.connect(update_top_panel)
+        table.selectionModel().selectionChanged.connect(update_top_panel)
 
         # === Confirm Stock Out ===
         def confirm_stock_out():
-            row = table.currentRow()
+            row = table.currentIndex().row()
             if row == -1:
                 QMessageBox.warning(dialog, "Warning", "Select a product from the table first.")
                 return
@@ -1666,46 +1403,17 @@ class AdminDashboard(QWidget):
                 QMessageBox.warning(dialog, "Input Error", "Quantity must be a positive integer.")
                 return
 
-            product_id = table.item(row, 0).text()
-            current_qty = int(fields["Quantity"].text())
-
-            if qty_issued > current_qty:
-                QMessageBox.warning(dialog, "Input Error", "Cannot issue more than current stock.")
+            product_id = model.text(row, 0)
+            if self.current_user_id is None:
+                QMessageBox.warning(dialog, "Warning", "Unable to find current user account.")
                 return
 
-            new_qty = current_qty - qty_issued
-            new_total = float(fields["Price"].text()) * new_qty
-            date_issued = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
             try:
-                cursor = self.conn.cursor()
-
-                # Update products
-                cursor.execute("""
-                    UPDATE products
-                    SET Quantity=%s,
-                        Total=%s,
-                        DateSupplied=%s
-                    WHERE ProductID = %s
-                """, (new_qty, new_total, date_issued, product_id))
-
-                # Get the current user’s AccountID
-                cursor.execute("SELECT AccountID FROM accounts WHERE Username = %s", (self.username,))
-                account = cursor.fetchone()
-                if account:
-                    account_id = account[0]
-
-                    cursor.execute("""
-                        INSERT INTO stockout (ProductID, AccountID, Quantity)
-                        VALUES (%s, %s, %s)
-                    """, (product_id, account_id, qty_issued))
-                else:
-                    QMessageBox.warning(dialog, "Warning", "Unable to find current user account.")
-                    cursor.close()
-                    return
-
-                self.conn.commit()
-                cursor.close()
+                with self.pool.transaction() as conn:
+                    new_qty = Stock.stock_out(conn, product_id, self.current_user_id, qty_issued)
+                    product_row = fetch_product(conn, product_id)
+                self.audit.log(self.current_user_id, int(product_id),
+                               f"Stock out: {qty_issued} issued, {new_qty} on hand")
 
                 # Success message
                 msg = QMessageBox(dialog)
@@ -1721,8 +1429,10 @@ class AdminDashboard(QWidget):
                 msg.exec()
 
                 dialog.accept()
-                self.load_products()
+                self.apply_product_rows([product_row])
 
+            except StockError as e:
+                QMessageBox.warning(dialog, "Input Error", str(e))
             except Exception as e:
                 QMessageBox.critical(dialog, "Database Error", str(e))
 
@@ -1738,6 +1448,12 @@ class AdminDashboard(QWidget):
 
         dialog.exec()
 
+    def batch_stock(self):
+        dialog = BatchStockDialog(self.pool, self.current_user_id, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        self.apply_product_rows(dialog.rows)
+
     def show_category_panel(self):
         self.hide_all_panels()
 
@@ -1753,7 +1469,7 @@ class AdminDashboard(QWidget):
 
             # === Common table style ===
             table_style = """
-                QTableWidget {
+                QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -1865,12 +1581,11 @@ class AdminDashboard(QWidget):
             self.type_table.verticalHeader().setVisible(False)
 
             # === Product Table ===
-            self.product_table = QTableWidget(self.category_panel)
+            self.product_table = QTableView(self.category_panel)
             self.product_table.setGeometry(660, 60, 460, 420)
-            self.product_table.setColumnCount(5)
+            self.product_table_model = ProductTableModel(CATEGORY_PRODUCT_COLUMNS, self)
+            self.product_table.setModel(self.product_table_model)
             self.product_table.setStyleSheet(table_style)
-            self.product_table.setHorizontalHeaderLabels(
-                ["ProductID", "ProductName", "Price", "Quantity", "ReorderLevel"])
             self.product_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
             self.product_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
             self.product_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -1880,10 +1595,7 @@ class AdminDashboard(QWidget):
 
             # === Load categories from DB ===
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT CategoryID, CategoryName FROM category ORDER BY CategoryName")
-                categories = cursor.fetchall()
-                cursor.close()
+                categories = self.refs.categories()
 
                 self.category_table.setRowCount(0)
                 for row_data in categories:
@@ -1899,18 +1611,14 @@ class AdminDashboard(QWidget):
                 row = self.category_table.currentRow()
                 if row == -1:
                     self.type_table.setRowCount(0)
-                    self.product_table.setRowCount(0)
+                    self.product_table_model.clear()
                     return
                 category_id = self.category_table.item(row, 0).text()
                 try:
-                    cursor = self.conn.cursor()
-                    cursor.execute("SELECT TypeID, TypeName FROM type WHERE CategoryID=%s ORDER BY TypeName",
-                                   (category_id,))
-                    types = cursor.fetchall()
-                    cursor.close()
+                    types = self.refs.types(category_id)
 
                     self.type_table.setRowCount(0)
-                    self.product_table.setRowCount(0)
+                    self.product_table_model.clear()
                     for row_data in types:
                         row_idx = self.type_table.rowCount()
                         self.type_table.insertRow(row_idx)
@@ -1925,26 +1633,20 @@ class AdminDashboard(QWidget):
             def type_selected():
                 row = self.type_table.currentRow()
                 if row == -1:
-                    self.product_table.setRowCount(0)
+                    self.product_table_model.clear()
                     return
                 type_id = self.type_table.item(row, 0).text()
                 try:
-                    cursor = self.conn.cursor()
-                    cursor.execute("""
-                                   SELECT ProductID, ProductName, Price, Quantity, ReorderLevel
-                                   FROM products
-                                   WHERE TypeID = %s
-                                   ORDER BY ProductName
-                                   """, (type_id,))
-                    products = cursor.fetchall()
-                    cursor.close()
-
-                    self.product_table.setRowCount(0)
-                    for row_data in products:
-                        row_idx = self.product_table.rowCount()
-                        self.product_table.insertRow(row_idx)
-                        for col, data in enumerate(row_data):
-                            self.product_table.setItem(row_idx, col, QTableWidgetItem(str(data)))
+                    with self.pool.connection() as conn, conn.cursor() as cursor:
+                        cursor.execute("""
+                                       SELECT ProductID, ProductName, Price, Quantity, ReorderLevel
+                                       FROM products
+                                       WHERE TypeID = %s AND RetiredAt IS NULL
+                                       ORDER BY ProductName
+                                       """, (type_id,))
+                        products = cursor.fetchall()
+
+                    self.product_table_model.set_rows(products)
                 except Exception as e:
                     QMessageBox.critical(self, "Database Error", str(e))
 
@@ -1965,9 +1667,36 @@ class AdminDashboard(QWidget):
             header_label.setGeometry(20, 10, 400, 40)
             header_label.setStyleSheet("color: white; font-size: 22px; font-weight: bold;")
 
+            # Export
+            self.export_combo = QComboBox(self.reports_panel)
+            self.export_combo.addItems(list(EXPORT_REPORTS))
+            self.export_combo.setGeometry(780, 15, 150, 30)
+            self.export_combo.setStyleSheet("background-color: white; color: black; border-radius: 6px; padding: 4px;")
+
+            export_btn = QPushButton("Export...", self.reports_panel)
+            export_btn.setGeometry(950, 15, 150, 30)
+            export_btn.setStyleSheet("""
+                QPushButton {
+                    background-color: rgb(50,150,200);
+                    color: white;
+                    font-weight: bold;
+                    border-radius: 8px;
+                    padding: 6px;
+                }
+                QPushButton:hover {
+                    background-color: rgb(70,170,220);
+                }
+            """)
+            export_btn.clicked.connect(self.export_report)
+
+            archive_btn = QPushButton("Archive Old...", self.reports_panel)
+            archive_btn.setGeometry(620, 15, 150, 30)
+            archive_btn.setStyleSheet(export_btn.styleSheet())
+            archive_btn.clicked.connect(self.archive_movements)
+
             # Table Style
             table_style = """
-                QTableWidget {
+                QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -2052,34 +1781,72 @@ class AdminDashboard(QWidget):
                 }
             """
 
+            # --- Filters ---
+            filter_style = "background-color: white; color: black; border-radius: 6px; padding: 2px;"
+            self.report_date_check = QCheckBox("Dates", self.reports_panel)
+            self.report_date_check.setGeometry(20, 55, 70, 30)
+            self.report_date_check.setStyleSheet("color: white; font-weight: bold;")
+
+            self.report_from = QDateEdit(QDate.currentDate().addDays(-30), self.reports_panel)
+            self.report_from.setGeometry(90, 55, 120, 30)
+            self.report_to = QDateEdit(QDate.currentDate(), self.reports_panel)
+            self.report_to.setGeometry(220, 55, 120, 30)
+
+            self.report_product = QLineEdit(self.reports_panel)
+            self.report_product.setPlaceholderText("Product name or ID")
+            self.report_product.setGeometry(350, 55, 200, 30)
+            self.report_product.returnPressed.connect(self.load_reports_data)
+
+            self.report_user = QComboBox(self.reports_panel)
+            self.report_user.setGeometry(560, 55, 180, 30)
+            self.report_supplier = QComboBox(self.reports_panel)
+            self.report_supplier.setGeometry(750, 55, 180, 30)
+            for widget in [self.report_from, self.report_to, self.report_product, self.report_user,
+                           self.report_supplier]:
+                widget.setStyleSheet(filter_style)
+            for widget in [self.report_from, self.report_to]:
+                widget.setCalendarPopup(True)
+                widget.setDisplayFormat("yyyy-MM-dd")
+
+            apply_btn = QPushButton("Apply Filters", self.reports_panel)
+            apply_btn.setGeometry(950, 55, 150, 30)
+            apply_btn.setStyleSheet("""
+                QPushButton {
+                    background-color: rgb(50,150,200);
+                    color: white;
+                    font-weight: bold;
+                    border-radius: 8px;
+                    padding: 6px;
+                }
+                QPushButton:hover {
+                    background-color: rgb(70,170,220);
+                }
+            """)
+            apply_btn.clicked.connect(self.load_reports_data)
+            self.report_filters = {}
+
             # --- Stock In Section ---
-            stockin_label = QLabel("Stock Ins", self.reports_panel)
-            stockin_label.setGeometry(20, 60, 200, 30)
-            stockin_label.setStyleSheet("color: white; font-size: 18px; font-weight: bold;")
-
-            # Table for Stock In
-            self.stockin_table = QTableWidget(self.reports_panel)
-            self.stockin_table.setGeometry(20, 100, 1100, 160)
-            self.stockin_table.setColumnCount(8)
-            self.stockin_table.setHorizontalHeaderLabels([
-                "ID", "ProductID", "ProductName", "Supplier", "Price", "Quantity", "Total", "Stocked By"
-            ])
-            self.stockin_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            self.stockin_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-            self.stockin_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-            self.stockin_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-            self.stockin_table.setAlternatingRowColors(True)
-            self.stockin_table.verticalHeader().setVisible(False)
-            self.stockin_table.setStyleSheet(table_style)
+            self.stockin_label = QLabel("Stock Ins", self.reports_panel)
+            self.stockin_label.setGeometry(20, 95, 400, 30)
+            self.stockin_label.setStyleSheet("color: white; font-size: 18px; font-weight: bold;")
+
+            # Table for Stock In; pages are fetched as the view scrolls
+            self.stockin_table = QTableView(self.reports_panel)
+            self.stockin_table.setGeometry(20, 125, 1100, 150)
+            self.stockin_model = ProductTableModel(
+                MOVEMENT_REPORT_COLUMNS, self,
+                page_source=lambda after_id, limit: name_accounts(self.pool.run(
+                    fetch_report_page, "stockin", self.report_filters, after_id, limit), self.refs.account_names()))
+            self.stockin_table.setModel(self.stockin_model)
 
             # --- Stock Out Section ---
-            stockout_label = QLabel("Stock Outs", self.reports_panel)
-            stockout_label.setGeometry(20, 280, 200, 30)
-            stockout_label.setStyleSheet("color: white; font-size: 18px; font-weight: bold;")
+            self.stockout_label = QLabel("Stock Outs", self.reports_panel)
+            self.stockout_label.setGeometry(20, 285, 400, 30)
+            self.stockout_label.setStyleSheet("color: white; font-size: 18px; font-weight: bold;")
 
             # Refresh button
             refresh_btn = QPushButton("↻ Refresh", self.reports_panel)
-            refresh_btn.setGeometry(950, 280, 150, 30)
+            refresh_btn.setGeometry(950, 285, 150, 30)
             refresh_btn.setStyleSheet("""
                 QPushButton {
                     background-color: rgb(50,150,200);
@@ -2095,81 +1862,176 @@ class AdminDashboard(QWidget):
             refresh_btn.clicked.connect(self.load_reports_data)
 
             # Table for Stock Out
-            self.stockout_table = QTableWidget(self.reports_panel)
-            self.stockout_table.setGeometry(20, 320, 1100, 160)
-            self.stockout_table.setColumnCount(8)
-            self.stockout_table.setHorizontalHeaderLabels([
-                "ID", "ProductID", "ProductName", "Supplier", "Price", "Quantity", "Total", "Stocked By"
-            ])
-            self.stockout_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            self.stockout_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-            self.stockout_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-            self.stockout_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-            self.stockout_table.setAlternatingRowColors(True)
-            self.stockout_table.verticalHeader().setVisible(False)
-            self.stockout_table.setStyleSheet(table_style)
+            self.stockout_table = QTableView(self.reports_panel)
+            self.stockout_table.setGeometry(20, 315, 1100, 170)
+            self.stockout_model = ProductTableModel(
+                MOVEMENT_REPORT_COLUMNS, self,
+                page_source=lambda after_id, limit: name_accounts(self.pool.run(
+                    fetch_report_page, "stockout", self.report_filters, after_id, limit), self.refs.account_names()))
+            self.stockout_table.setModel(self.stockout_model)
+
+            for table in [self.stockin_table, self.stockout_table]:
+                table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+                table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+                table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+                table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+                table.setAlternatingRowColors(True)
+                table.verticalHeader().setVisible(False)
+                table.setStyleSheet(table_style)
+
+            self.load_report_choices()
 
             # Load initial data
             self.load_reports_data()
 
         self.reports_panel.show()
 
-    def load_reports_data(self):
-        """Loads stock in and stock out data into tables."""
+    def load_report_choices(self):
+        self.report_user.clear()
+        self.report_supplier.clear()
+        self.report_user.addItem("All users", None)
+        self.report_supplier.addItem("All suppliers", None)
         try:
-            cursor = self.conn.cursor()
-            # --- Load Stock In Data ---
-            cursor.execute("""
-                           SELECT s.StockInID,
-                                  p.ProductID,
-                                  p.ProductName,
-                                  sup.SupplierName,
-                                  p.Price,
-                                  s.Quantity                    AS QuantityAdded,
-                                  (p.Price * s.Quantity)        AS Total,
-                                  CONCAT(a.FName, ' ', a.LName) AS StockedBy
-                           FROM stockin s
-                                    JOIN products p ON s.ProductID = p.ProductID
-                                    JOIN suppliers sup ON p.SupplierID = sup.SupplierID
-                                    JOIN accounts a ON s.AccountID = a.AccountID
-                           ORDER BY s.StockInID DESC
-                           """)
-            stockins = cursor.fetchall()
-            self.stockin_table.setRowCount(0)
-            for row_data in stockins:
-                row_idx = self.stockin_table.rowCount()
-                self.stockin_table.insertRow(row_idx)
-                for col, data in enumerate(row_data):
-                    self.stockin_table.setItem(row_idx, col, QTableWidgetItem(str(data)))
-
-            # --- Load Stock Out Data ---
-            cursor.execute("""
-                           SELECT s.StockOutID,
-                                  p.ProductID,
-                                  p.ProductName,
-                                  sup.SupplierName,
-                                  p.Price,
-                                  s.Quantity                    AS QuantityRemoved,
-                                  (p.Price * s.Quantity)        AS Total,
-                                  CONCAT(a.FName, ' ', a.LName) AS StockedBy
-                           FROM stockout s
-                                    JOIN products p ON s.ProductID = p.ProductID
-                                    JOIN suppliers sup ON p.SupplierID = sup.SupplierID
-                                    JOIN accounts a ON s.AccountID = a.AccountID
-                           ORDER BY s.StockOutID DESC
-                           """)
-            stockouts = cursor.fetchall()
-            self.stockout_table.setRowCount(0)
-            for row_data in stockouts:
-                row_idx = self.stockout_table.rowCount()
-                self.stockout_table.insertRow(row_idx)
-                for col, data in enumerate(row_data):
-                    self.stockout_table.setItem(row_idx, col, QTableWidgetItem(str(data)))
+            accounts = self.refs.account_names()
+            suppliers = self.refs.suppliers()
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        for account_id, full_name in sorted(accounts.items(), key=lambda item: item[1]):
+            self.report_user.addItem(full_name, account_id)
+        for supplier_id, supplier_name in suppliers:
+            self.report_supplier.addItem(supplier_name, supplier_id)
 
-            cursor.close()
+    def load_reports_data(self):
+        """Applies the filters and loads the first page of stock ins and stock outs."""
+        filters = {
+            "product": self.report_product.text().strip(),
+            "account_id": self.report_user.currentData(),
+            "supplier_id": self.report_supplier.currentData(),
+        }
+        if self.report_date_check.isChecked():
+            filters["start"] = self.report_from.date().toPyDate()
+            filters["end"] = self.report_to.date().addDays(1).toPyDate()
+        self.report_filters = filters
+
+        try:
+            with self.pool.connection() as conn:
+                stockin_count = count_report(conn, "stockin", filters)
+                stockout_count = count_report(conn, "stockout", filters)
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        self.stockin_label.setText(f"Stock Ins ({stockin_count})")
+        self.stockout_label.setText(f"Stock Outs ({stockout_count})")
+        self.stockin_model.reload()
+        self.stockout_model.reload()
+
+    def export_report(self):
+        report = self.export_combo.currentText()
+        path, selected = QFileDialog.getSaveFileName(self, f"Export {report}", report.lower().replace(" ", "_"),
+                                                     ";;".join(export_formats()))
+        if not path:
+            return
+        if not os.path.splitext(path)[1]:
+            path += ".parquet" if selected.startswith("Parquet") else ".csv"
 
+        progress = QProgressDialog(f"Exporting {report}...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Export")
+        progress.setMinimumDuration(0)
+        try:
+            account_names = self.refs.account_names()
         except Exception as e:
             QMessageBox.critical(self, "Database Error", str(e))
+            return
+        task = ExportTask(self.pool, report, path, account_names)
+        # Keep the signals alive until the task reports back
+        self.export_signals = task.signals
+        progress.canceled.connect(task.cancel)
+        task.signals.progress.connect(lambda count: progress.setLabelText(f"{count} rows exported..."))
+
+        def finished(count):
+            progress.reset()
+            QMessageBox.information(self, "Success", f"{count} rows exported to\n{path}")
+
+        def failed(message):
+            progress.reset()
+            QMessageBox.critical(self, "Export Error", message)
+
+        task.signals.finished.connect(finished)
+        task.signals.failed.connect(failed)
+        QThreadPool.globalInstance().start(task)
+
+    def archive_movements(self):
+        days, ok = QInputDialog.getInt(self, "Archive Stock Movements",
+                                       "Move stock ins and outs older than this many days to the archive:",
+                                       ARCHIVE_AFTER_DAYS, 1, 36500)
+        if not ok:
+            return
+        before = QDate.currentDate().addDays(-days).toPyDate()
+        confirm = QMessageBox.question(
+            self, "Confirm Archive",
+            f"Move every stock movement recorded before {before} to the archive tables?\n"
+            "Archived movements stay in the reports and exports but leave the dashboard trend.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+
+        progress = QProgressDialog("Archiving stock movements...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Archive")
+        progress.setMinimumDuration(0)
+        task = ArchiveTask(self.pool, before)
+        # Keep the signals alive until the task reports back
+        self.archive_signals = task.signals
+        progress.canceled.connect(task.cancel)
+        task.signals.progress.connect(lambda count: progress.setLabelText(f"{count} movements archived..."))
+
+        def finished(count):
+            progress.reset()
+            self.audit.log(self.current_user_id, None, f"Archived {count} stock movements recorded before {before}")
+            QMessageBox.information(self, "Success", f"{count} stock movements archived.")
+            self.load_reports_data()
+
+        def failed(message):
+            progress.reset()
+            QMessageBox.critical(self, "Archive Error", message)
+            self.load_reports_data()
+
+        task.signals.finished.connect(finished)
+        task.signals.failed.connect(failed)
+        QThreadPool.globalInstance().start(task)
+
+    def recompute_forecasts(self):
+        confirm = QMessageBox.question(
+            self, "Recompute Forecasts",
+            f"Recompute the reorder point and order quantity of every product from the last "
+            f"{FORECAST_DAYS} days of stock outs?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+
+        progress = QProgressDialog("Forecasting demand...", None, 0, 0, self)
+        progress.setWindowTitle("Forecast")
+        progress.setMinimumDuration(0)
+        self.forecast_btn.setEnabled(False)
+        task = ForecastTask(self.pool)
+        # Keep the signals alive until the task reports back
+        self.forecast_signals = task.signals
+
+        def finished(count, seconds):
+            progress.reset()
+            self.forecast_btn.setEnabled(True)
+            self.audit.log(self.current_user_id, None, f"Recomputed forecasts for {count} products")
+            # The views reload through the change feed
+            QMessageBox.information(self, "Success", f"Forecast {count} products in {seconds:.1f} s.")
+
+        def failed(message):
+            progress.reset()
+            self.forecast_btn.setEnabled(True)
+            QMessageBox.critical(self, "Forecast Error", message)
+
+        task.signals.finished.connect(finished)
+        task.signals.failed.connect(failed)
+        QThreadPool.globalInstance().start(task)
 
     def show_users_panel(self):
         self.hide_all_panels()
@@ -2360,14 +2222,13 @@ class AdminDashboard(QWidget):
 
     def load_users_data(self):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                           SELECT AccountID, Username, Password, Role, CONCAT(FName, ' ', LName) AS FullName
-                           FROM accounts
-                           ORDER BY AccountID ASC
-                           """)
-            users = cursor.fetchall()
-            cursor.close()
+            with self.pool.connection() as conn, conn.cursor() as cursor:
+                cursor.execute("""
+                               SELECT AccountID, Username, Password, Role, CONCAT(FName, ' ', LName) AS FullName
+                               FROM accounts
+                               ORDER BY AccountID ASC
+                               """)
+                users = cursor.fetchall()
 
             self.users_table.setRowCount(0)
             for row_data in users:
@@ -2498,13 +2359,16 @@ class AdminDashboard(QWidget):
                 return
 
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                               INSERT INTO accounts (Username, Password, FName, LName, Role)
-                               VALUES (%s, %s, %s, %s, %s)
-                               """, (username, password, fname, lname, role))
-                self.conn.commit()
-                cursor.close()
+                with self.pool.transaction() as conn, conn.cursor() as cursor:
+                    cursor.execute("""
+                                   INSERT INTO accounts (Username, Password, FName, LName, Role)
+                                   VALUES (%s, %s, %s, %s, %s)
+                                   """, (username, password, fname, lname, role))
+                    new_account_id = cursor.lastrowid
+                    record_change(cursor, ACCOUNT, new_account_id)
+                self.refs.invalidate("accounts")
+                self.audit.log(self.current_user_id, None,
+                               f"Added {role} account #{new_account_id} '{username}'")
 
                 QMessageBox.information(dialog, "Success", "Account added successfully.")
                 self.load_users_data()
@@ -2648,18 +2512,20 @@ class AdminDashboard(QWidget):
                 return
 
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                               UPDATE accounts
-                               SET Username=%s,
-                                   Password=%s,
-                                   FName=%s,
-                                   LName=%s,
-                                   Role=%s
-                               WHERE AccountID = %s
-                               """, (new_username, new_password, new_fname, new_lname, new_role, account_id))
-                self.conn.commit()
-                cursor.close()
+                with self.pool.transaction() as conn, conn.cursor() as cursor:
+                    cursor.execute("""
+                                   UPDATE accounts
+                                   SET Username=%s,
+                                       Password=%s,
+                                       FName=%s,
+                                       LName=%s,
+                                       Role=%s
+                                   WHERE AccountID = %s
+                                   """, (new_username, new_password, new_fname, new_lname, new_role, account_id))
+                    record_change(cursor, ACCOUNT, account_id)
+                self.refs.invalidate("accounts")
+                self.audit.log(self.current_user_id, None,
+                               f"Updated {new_role} account #{account_id} '{new_username}'")
 
                 QMessageBox.information(dialog, "Success", "Account updated successfully.")
                 self.load_users_data()
@@ -2689,10 +2555,11 @@ class AdminDashboard(QWidget):
         try:
             account_id = self.users_table.item(selected, 0).text()
 
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM accounts WHERE AccountID=%s", (account_id,))
-            self.conn.commit()
-            cursor.close()
+            with self.pool.transaction() as conn, conn.cursor() as cursor:
+                cursor.execute("DELETE FROM accounts WHERE AccountID=%s", (account_id,))
+                record_change(cursor, ACCOUNT, account_id, DELETE)
+            self.refs.invalidate("accounts")
+            self.audit.log(self.current_user_id, None, f"Deleted account #{account_id} '{account_uname}'")
 
             QMessageBox.information(self, "Deleted", "Account deleted successfully.")
             self.load_users_data()
@@ -0,0 +1,255 @@
+from PyQt6.QtWidgets import QPushButton, QMenu
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from Changes import RELOAD
+
+# A product is low on stock once Quantity is at most ReorderLevel + LOW_STOCK_MARGIN.
+LOW_STOCK_MARGIN = 5
+# Products listed in the tray menu; the dashboard shows them all.
+TRAY_ITEMS = 15
+# Delay before a failed alert fetch is tried again.
+ALERT_RETRY_MS = 5000
+
+
+# ---------------------------
+# Reorder gap
+# ---------------------------
+# ReorderGap = Quantity - ReorderLevel is stored with the row, so "low on
+# stock" becomes a range on (RetiredAt, ReorderGap) instead of a comparison
+# between two columns of every product.
+def ensure_reorder_gap(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'products' AND COLUMN_NAME = 'ReorderGap'
+        """)
+        if not cursor.fetchone()[0]:
+            cursor.execute("""
+                ALTER TABLE products
+                    ADD COLUMN ReorderGap int(11) AS (Quantity - ReorderLevel) PERSISTENT,
+                    ADD KEY LowStock (RetiredAt, ReorderGap)
+            """)
+
+
+# Rows are (ProductID, ProductName, TypeName, Quantity, ReorderLevel,
+# ReorderPoint, OrderQuantity); the last two come from the latest forecast
+# (Forecast.py) and are None for products it has not covered yet.
+STOCK_LEVEL_SELECT = """
+    SELECT p.ProductID, p.ProductName, t.TypeName, p.Quantity, p.ReorderLevel, f.ReorderPoint, f.OrderQuantity
+    FROM products p
+             LEFT JOIN type t ON p.TypeID = t.TypeID
+             LEFT JOIN product_forecast f ON p.ProductID = f.ProductID
+"""
+
+
+def fetch_low_stock(conn, margin=LOW_STOCK_MARGIN):
+    """Every active product at most ``margin`` units above its reorder level."""
+    with conn.cursor() as cursor:
+        cursor.execute(STOCK_LEVEL_SELECT + " WHERE p.RetiredAt IS NULL AND p.ReorderGap <= %s", (margin,))
+        return cursor.fetchall()
+
+
+def fetch_stock_levels(conn, product_ids):
+    """Rows of the active products among ``product_ids``; retired and missing ones are left out."""
+    if not product_ids:
+        return []
+    placeholders = ", ".join(["%s"] * len(product_ids))
+    with conn.cursor() as cursor:
+        cursor.execute(STOCK_LEVEL_SELECT + f" WHERE p.RetiredAt IS NULL AND p.ProductID IN ({placeholders})",
+                       list(product_ids))
+        return cursor.fetchall()
+
+
+# ---------------------------
+# Alert engine
+# ---------------------------
+class _AlertSignals(QObject):
+    fetched = pyqtSignal(object, object)  # product IDs asked for (None: all), rows
+    failed = pyqtSignal(object, str)  # product IDs asked for, error
+
+
+class _AlertTask(QRunnable):
+    def __init__(self, signals, pool, product_ids, margin):
+        super().__init__()
+        self.signals = signals
+        self.pool = pool
+        self.product_ids = product_ids
+        self.margin = margin
+
+    def run(self):
+        try:
+            if self.product_ids is None:
+                rows = self.pool.run(fetch_low_stock, self.margin)
+            else:
+                rows = self.pool.run(fetch_stock_levels, self.product_ids)
+        except Exception as e:
+            self.signals.failed.emit(self.product_ids, str(e))
+            return
+        self.signals.fetched.emit(self.product_ids, rows)
+
+
+class AlertEngine(QObject):
+    """Keeps the set of low-stock products current from the change feed.
+
+    The whole set is read once, through the LowStock index; after that only
+    the products named by each change are re-read, by primary key, on a
+    worker thread. ``alerts_changed`` carries the full set, lowest stock
+    first, whenever it changes, and ``raised`` the rows of products that
+    have just crossed the threshold.
+    """
+
+    alerts_changed = pyqtSignal(list)
+    raised = pyqtSignal(list)
+
+    def __init__(self, pool, parent=None, margin=LOW_STOCK_MARGIN):
+        super().__init__(parent)
+        self.pool = pool
+        self.margin = margin
+        self._alerts = {}  # ProductID -> row
+        self._loaded = False
+        self._pending = set()  # products changed while a fetch was running
+        self._reload = False
+        self._busy = False
+
+        self.signals = _AlertSignals(self)
+        self.signals.fetched.connect(self._on_fetched)
+        self.signals.failed.connect(self._on_failed)
+        self.workers = QThreadPool(self)
+        self.workers.setMaxThreadCount(1)
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.setInterval(ALERT_RETRY_MS)
+        self.retry_timer.timeout.connect(self._next)
+
+    def alerts(self):
+        """Current low-stock rows, lowest quantity first."""
+        return sorted(self._alerts.values(), key=lambda row: (row[3], row[1]))
+
+    def start(self):
+        self._reload = True
+        self._next()
+
+    def apply_changes(self, products):
+        """Feed the ``{product_id: action}`` part of a ChangeFeed batch."""
+        for product_id, action in products.items():
+            if action == RELOAD:
+                self._reload = True
+            else:
+                # Deletes are re-read too: the product is simply no longer found
+                self._pending.add(product_id)
+        self._next()
+
+    def _next(self):
+        if self._busy:
+            return
+        if self._reload:
+            self._reload = False
+            self._pending.clear()
+            product_ids = None
+        elif self._pending and self._loaded:
+            product_ids = sorted(self._pending)
+            self._pending.clear()
+        else:
+            return
+        self._busy = True
+        self.workers.start(_AlertTask(self.signals, self.pool, product_ids, self.margin))
+
+    @pyqtSlot(object, str)
+    def _on_failed(self, product_ids, message):
+        print("Error:", message)
+        self._busy = False
+        # Ask again for what was lost, with the next feed batch or after a pause
+        if product_ids is None:
+            self._reload = True
+        else:
+            self._pending.update(product_ids)
+        self.retry_timer.start()
+
+    @pyqtSlot(object, object)
+    def _on_fetched(self, product_ids, rows):
+        self._busy = False
+        before = self._alerts
+        if product_ids is None:
+            alerts = {row[0]: row for row in rows}
+        else:
+            alerts = dict(before)
+            levels = {row[0]: row for row in rows}
+            for product_id in product_ids:
+                row = levels.get(product_id)
+                if row is not None and row[3] - row[4] <= self.margin:
+                    alerts[product_id] = row
+                else:
+                    alerts.pop(product_id, None)
+        first_load = not self._loaded
+        self._loaded = True
+        self._alerts = alerts
+
+        if alerts != before or first_load:
+            self.alerts_changed.emit(self.alerts())
+        crossed = [row for product_id, row in alerts.items() if product_id not in before]
+        if crossed and not first_load:
+            self.raised.emit(sorted(crossed, key=lambda row: (row[3], row[1])))
+        self._next()
+
+
+# ---------------------------
+# Notification tray
+# ---------------------------
+class AlertTray(QPushButton):
+    """Top-bar button counting low-stock products; its menu lists them.
+
+    Turns orange when products newly cross the threshold; opening the menu
+    marks them with a dot once and sets the button back to normal.
+    """
+
+    NORMAL_STYLE = """
+        QPushButton { background-color: rgb(50,150,200); color: white; font-weight: bold;
+                      border-radius: 8px; padding: 6px; }
+        QPushButton:hover { background-color: rgb(70,170,220); }
+        QPushButton::menu-indicator { width: 0px; }
+    """
+    UNREAD_STYLE = """
+        QPushButton { background-color: rgb(230,140,40); color: white; font-weight: bold;
+                      border-radius: 8px; padding: 6px; }
+        QPushButton:hover { background-color: rgb(245,160,60); }
+        QPushButton::menu-indicator { width: 0px; }
+    """
+
+    def __init__(self, engine, parent=None):
+        super().__init__("Low stock: …", parent)
+        self.engine = engine
+        self.setStyleSheet(self.NORMAL_STYLE)
+        self.menu = QMenu(self)
+        self.menu.setStyleSheet("QMenu { background-color: white; color: black; font-size: 13px; }")
+        self.menu.aboutToShow.connect(self._populate)
+        self.setMenu(self.menu)
+        self._rows = []
+        self._raised = set()
+        engine.alerts_changed.connect(self.show_alerts)
+        engine.raised.connect(self.notify)
+
+    @pyqtSlot(list)
+    def show_alerts(self, rows):
+        self._rows = rows
+        self.setText(f"Low stock: {len(rows)}")
+
+    @pyqtSlot(list)
+    def notify(self, rows):
+        self._raised.update(row[0] for row in rows)
+        self.setStyleSheet(self.UNREAD_STYLE)
+        names = ", ".join(row[1] for row in rows[:3]) + (" …" if len(rows) > 3 else "")
+        self.setToolTip(f"Now low on stock: {names}")
+
+    def _populate(self):
+        # Built when opened, so the menu always shows the current set
+        self.menu.clear()
+        if not self._rows:
+            self.menu.addAction("No products are low on stock.").setEnabled(False)
+        for product_id, name, type_name, quantity, reorder, reorder_point, order_quantity in self._rows[:TRAY_ITEMS]:
+            marker = "● " if product_id in self._raised else ""
+            suggestion = f", order {order_quantity}" if order_quantity else ""
+            self.menu.addAction(f"{marker}{name} — {quantity} left (reorder at {reorder}{suggestion})").setEnabled(False)
+        if len(self._rows) > TRAY_ITEMS:
+            self.menu.addAction(f"… and {len(self._rows) - TRAY_ITEMS} more on the dashboard").setEnabled(False)
+        self._raised.clear()
+        self.setStyleSheet(self.NORMAL_STYLE)
+        self.setToolTip("")
@@ -0,0 +1,139 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+import Summary
+from Changes import PRODUCT, DELETE, record_change
+
+# Ledger rows moved per transaction by archive_ledgers; each chunk commits on
+# its own so the ledgers are never locked for the whole job.
+ARCHIVE_CHUNK = 5000
+# Default age, in days, of the movements the admin window offers to archive.
+ARCHIVE_AFTER_DAYS = 365
+
+# ledger -> (archive table, ID column)
+ARCHIVES = {
+    "stockin": ("stockin_archive", "StockInID"),
+    "stockout": ("stockout_archive", "StockOutID"),
+}
+
+
+class ArchiveCancelled(Exception):
+    pass
+
+
+# ---------------------------
+# Schema
+# ---------------------------
+# Retired products keep their row, their ledger history and their place in
+# reports; they only drop out of the product lists, searches and dashboards.
+# MySQL has no partial indexes, so the hot queries filter on
+# ``RetiredAt IS NULL`` and (RetiredAt, ProductID) keeps every active product
+# in one contiguous index range, already in keyset order.
+def ensure_archive(conn):
+    """Add RetiredAt and its index to products, and create the archive ledgers."""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'products' AND COLUMN_NAME = 'RetiredAt'
+        """)
+        if not cursor.fetchone()[0]:
+            cursor.execute("""
+                ALTER TABLE products
+                    ADD COLUMN RetiredAt datetime DEFAULT NULL,
+                    ADD KEY Active (RetiredAt, ProductID)
+            """)
+        # LIKE copies the columns and indexes but not the foreign keys, so
+        # archived rows do not hold products in place.
+        for ledger, (archive, _) in ARCHIVES.items():
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {archive} LIKE {ledger}")
+
+
+# ---------------------------
+# Retirement
+# ---------------------------
+def retire_product(conn, product_id):
+    """Flag ``product_id`` as retired; returns False if it was missing or already retired.
+
+    Call inside pool.transaction(). Nothing is deleted, so past stock
+    movements keep pointing at the product.
+    """
+    with conn.cursor() as cursor:
+        Summary.product_retired(cursor, product_id)
+        cursor.execute("UPDATE products SET RetiredAt = NOW() WHERE ProductID = %s AND RetiredAt IS NULL",
+                       (product_id,))
+        if cursor.rowcount != 1:
+            return False
+        record_change(cursor, PRODUCT, product_id, DELETE)
+    return True
+
+
+# ---------------------------
+# Ledger archival
+# ---------------------------
+def archive_ledgers(pool, before, chunk_size=ARCHIVE_CHUNK, progress=None, cancelled=None):
+    """Move ledger rows recorded before ``before`` to the archive tables.
+
+    Rows go over in ID-ordered chunks, each copied and deleted in its own
+    transaction by one INSERT ... SELECT and one DELETE over the same ID
+    range. Returns the number of rows moved. ``progress(count)`` is called
+    after every chunk; a cancel stops between chunks and keeps what is done.
+    """
+    moved = 0
+    for ledger, (archive, id_column) in ARCHIVES.items():
+        while True:
+            if cancelled and cancelled():
+                raise ArchiveCancelled(f"Archiving cancelled after {moved} rows.")
+            with pool.transaction() as conn, conn.cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT {id_column} FROM {ledger}
+                    WHERE MovedAt < %s
+                    ORDER BY {id_column}
+                    LIMIT %s
+                """, (before, chunk_size))
+                ids = [row[0] for row in cursor.fetchall()]
+                if not ids:
+                    break
+                chunk = (ids[0], ids[-1], before)
+                cursor.execute(f"""
+                    INSERT INTO {archive}
+                    SELECT * FROM {ledger}
+                    WHERE {id_column} BETWEEN %s AND %s AND MovedAt < %s
+                """, chunk)
+                cursor.execute(f"DELETE FROM {ledger} WHERE {id_column} BETWEEN %s AND %s AND MovedAt < %s",
+                               chunk)
+                moved += cursor.rowcount
+            if progress:
+                progress(moved)
+            if len(ids) < chunk_size:
+                break
+    return moved
+
+
+class ArchiveSignals(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+
+class ArchiveTask(QRunnable):
+    """Runs archive_ledgers on a worker thread."""
+
+    def __init__(self, pool, before, chunk_size=ARCHIVE_CHUNK):
+        super().__init__()
+        self.pool = pool
+        self.before = before
+        self.chunk_size = chunk_size
+        self.signals = ArchiveSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            count = archive_ledgers(self.pool, self.before, self.chunk_size,
+                                    progress=self.signals.progress.emit,
+                                    cancelled=lambda: self._cancelled)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(count)
@@ -0,0 +1,229 @@
+import threading
+import time
+from datetime import datetime
+from Inventory import PAGE_SIZE
+
+# Seconds between background flushes of the audit buffer.
+AUDIT_FLUSH_SECONDS = 1.0
+# Entries sent per executemany; a fuller buffer wakes the writer early.
+AUDIT_BATCH = 500
+# Entries held while the database is unreachable; the oldest are dropped past this.
+AUDIT_BUFFER = 50000
+
+# (ProductID, Date) and (AccountID, Date) serve the audit viewer filtered by
+# product or user over a time range; Date alone serves the unfiltered view.
+# They replace the single-column ProductID and AccountID keys of the dump.
+AUDIT_INDEXES = [
+    ("ProductID_Date", "ProductID, Date"),
+    ("AccountID_Date", "AccountID, Date"),
+    ("Date", "Date"),
+]
+AUDIT_REPLACED_INDEXES = ("ProductID", "AccountID")
+
+AUDIT_INSERT = "INSERT INTO logs (AccountID, ProductID, Action, Date) VALUES (%s, %s, %s, %s)"
+
+
+def ensure_audit(conn):
+    """Bring the logs table from the original dump up to what the writer needs.
+
+    The audit trail has to outlive the products and accounts it mentions, so
+    the foreign keys are dropped, and ProductID becomes NULLable for entries
+    that are not about a product (account changes).
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT CONSTRAINT_NAME FROM information_schema.REFERENTIAL_CONSTRAINTS
+            WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = 'logs'
+        """)
+        foreign_keys = [name for name, in cursor.fetchall()]
+        if foreign_keys:
+            cursor.execute("ALTER TABLE logs " + ", ".join(f"DROP FOREIGN KEY {name}" for name in foreign_keys))
+
+        changes = []
+        cursor.execute("""
+            SELECT IS_NULLABLE FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'logs' AND COLUMN_NAME = 'ProductID'
+        """)
+        row = cursor.fetchone()
+        if row and row[0] == "NO":
+            changes.append("MODIFY ProductID int(11) NULL")
+        cursor.execute("""
+            SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'logs'
+        """)
+        existing = {name for name, in cursor.fetchall()}
+        changes += [f"ADD KEY {name} ({columns})" for name, columns in AUDIT_INDEXES if name not in existing]
+        changes += [f"DROP KEY {name}" for name in AUDIT_REPLACED_INDEXES if name in existing]
+        if changes:
+            cursor.execute("ALTER TABLE logs " + ", ".join(changes))
+
+
+# ---------------------------
+# Background writer
+# ---------------------------
+class AuditWriter:
+    """Buffers audit entries in memory and inserts them from a daemon thread.
+
+    ``log`` only appends to a list, so auditing adds no round trip to the
+    action being audited. Entries are stamped when logged, not when written.
+    The writer flushes every ``flush_seconds``, or sooner once ``batch_size``
+    entries are waiting; a failed flush keeps the entries for the next one.
+    Call ``close`` at exit to write whatever is still buffered.
+    """
+
+    def __init__(self, pool, flush_seconds=AUDIT_FLUSH_SECONDS, batch_size=AUDIT_BATCH, max_buffer=AUDIT_BUFFER):
+        self.pool = pool
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self._buffer = []
+        self._writing = 0  # entries taken by the thread and not yet committed
+        self._closed = False
+        self._wake = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def log(self, account_id, product_id, action):
+        """Queue one entry; ``product_id`` is None for entries not about a product."""
+        entry = (account_id, product_id, str(action)[:500], datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        with self._wake:
+            if self._closed:
+                return
+            self._buffer.append(entry)
+            if len(self._buffer) > self.max_buffer:
+                del self._buffer[:len(self._buffer) - self.max_buffer]
+            if len(self._buffer) >= self.batch_size:
+                self._wake.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Wait until everything logged so far is written; False if ``timeout`` ran out."""
+        deadline = time.monotonic() + timeout
+        with self._wake:
+            self._wake.notify_all()
+            while self._buffer or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    return False
+                self._wake.wait(remaining)
+        return True
+
+    def close(self, timeout=5.0):
+        with self._wake:
+            self._closed = True
+            self._wake.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        retry_at = None
+        while True:
+            with self._wake:
+                if retry_at is not None:
+                    # The last flush failed: pause a full interval however full the
+                    # buffer is, so a database outage is not retried in a tight loop
+                    while not self._closed and time.monotonic() < retry_at:
+                        self._wake.wait(retry_at - time.monotonic())
+                elif not self._closed and len(self._buffer) < self.batch_size:
+                    self._wake.wait(self.flush_seconds)
+                batch, self._buffer = self._buffer, []
+                self._writing = len(batch)
+                closed = self._closed
+            failed = False
+            if batch:
+                try:
+                    self.pool.run(_insert_entries, batch, self.batch_size)
+                    retry_at = None
+                except Exception as e:
+                    print("Error:", e)
+                    failed = True
+                    retry_at = time.monotonic() + self.flush_seconds
+                    with self._wake:
+                        # Put them back ahead of anything logged meanwhile
+                        self._buffer[:0] = batch
+                        del self._buffer[:max(0, len(self._buffer) - self.max_buffer)]
+            with self._wake:
+                self._writing = 0
+                self._wake.notify_all()
+                # Closing gives up on entries the database refused
+                if closed and (failed or not self._buffer):
+                    return
+
+
+def _insert_entries(conn, entries, chunk_size):
+    with conn.cursor() as cursor:
+        for start in range(0, len(entries), chunk_size):
+            cursor.executemany(AUDIT_INSERT, entries[start:start + chunk_size])
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def audit_writer(pool):
+    """The shared AuditWriter for ``pool``, started on first use."""
+    with _writers_lock:
+        writer = _writers.get(id(pool))
+        if writer is None or writer.pool is not pool:
+            writer = _writers[id(pool)] = AuditWriter(pool)
+        return writer
+
+
+def close_audit_writers():
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+# ---------------------------
+# Audit queries
+# ---------------------------
+# ``filters`` is a dict with any of: "start" (inclusive) and "end" (exclusive)
+# datetimes, "product_id", "account_id" and "text" (part of the action). Pages
+# run newest first and seek below the last LogID shown, like the reports.
+AUDIT_SELECT = "SELECT LogID, Date, AccountID, ProductID, Action FROM logs"
+
+AUDIT_COLUMNS = [("Log ID", int), ("Date", datetime), ("User", str), ("Product ID", str), ("Action", str)]
+# Position of AccountID in the audit rows, for Reports.name_accounts
+AUDIT_ACCOUNT_COLUMN = 2
+
+
+def _audit_where(filters):
+    conditions = []
+    params = []
+    if filters.get("start"):
+        conditions.append("Date >= %s")
+        params.append(filters["start"])
+    if filters.get("end"):
+        conditions.append("Date < %s")
+        params.append(filters["end"])
+    if filters.get("product_id"):
+        conditions.append("ProductID = %s")
+        params.append(filters["product_id"])
+    if filters.get("account_id"):
+        conditions.append("AccountID = %s")
+        params.append(filters["account_id"])
+    if filters.get("text"):
+        conditions.append("Action LIKE %s")
+        params.append(f"%{filters['text']}%")
+    return conditions, params
+
+
+def fetch_audit_page(conn, filters, after_id=0, limit=PAGE_SIZE):
+    """Return up to ``limit`` entries older than ``after_id`` (0: the newest)."""
+    conditions, params = _audit_where(filters)
+    if after_id:
+        conditions.append("LogID < %s")
+        params.append(after_id)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    with conn.cursor() as cursor:
+        cursor.execute(f"{AUDIT_SELECT}{where} ORDER BY LogID DESC LIMIT %s", params + [limit])
+        return [row[:3] + ("" if row[3] is None else row[3],) + row[4:] for row in cursor.fetchall()]
+
+
+def count_audit(conn, filters):
+    conditions, params = _audit_where(filters)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM logs{where}", params)
+        return cursor.fetchone()[0]
@@ -0,0 +1,149 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox, QCheckBox,
+                             QDateEdit, QTableView, QHeaderView, QAbstractItemView, QMessageBox)
+from PyQt6.QtCore import QDate
+from Models import ProductTableModel
+from Reports import name_accounts
+from Reference import reference_cache
+from Audit import AUDIT_ACCOUNT_COLUMN, AUDIT_COLUMNS, audit_writer, count_audit, fetch_audit_page
+
+AUDIT_STYLE = """
+    QLabel { color: white; }
+    QCheckBox { color: white; font-weight: bold; }
+    QLineEdit, QComboBox, QDateEdit { background-color: white; color: black; border-radius: 6px; padding: 2px; }
+    QPushButton {
+        background-color: rgb(50,150,200);
+        color: white;
+        font-weight: bold;
+        border-radius: 8px;
+        padding: 6px;
+    }
+    QPushButton:hover { background-color: rgb(70,170,220); }
+    QTableView {
+        color: black;
+        background-color: #f8f9fa;
+        alternate-background-color: #e9ecef;
+        gridline-color: #b0b0b0;
+        border-radius: 10px;
+        font-size: 13px;
+        selection-background-color: rgb(70,130,250);
+        selection-color: white;
+    }
+    QHeaderView::section {
+        background-color: rgb(50,150,200);
+        color: white;
+        font-weight: bold;
+        border: none;
+        padding: 6px;
+    }
+    QMessageBox {
+        background-color: rgb(40,40,40);
+        color: white;
+        font-size: 14px;
+    }
+    QMessageBox QLabel {
+        color: white;
+    }
+"""
+
+
+class AuditPanel(QWidget):
+    """Audit trail viewer, filtered by date range, product, user and action text.
+
+    Entries are read newest first in keyset pages as the table scrolls.
+    """
+
+    def __init__(self, pool, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.refs = reference_cache(pool)
+        self.filters = {}
+        self.setGeometry(10, 10, 1140, 500)
+        self.setStyleSheet("background-color: rgb(100, 100, 100); border-radius: 10px;" + AUDIT_STYLE)
+
+        layout = QVBoxLayout(self)
+
+        self.title = QLabel("Audit Log")
+        self.title.setStyleSheet("font-size: 22px; font-weight: bold;")
+        layout.addWidget(self.title)
+
+        # --- Filters ---
+        filter_row = QHBoxLayout()
+        self.date_check = QCheckBox("Dates")
+        self.date_from = QDateEdit(QDate.currentDate().addDays(-7))
+        self.date_to = QDateEdit(QDate.currentDate())
+        for widget in [self.date_from, self.date_to]:
+            widget.setCalendarPopup(True)
+            widget.setDisplayFormat("yyyy-MM-dd")
+
+        self.product_input = QLineEdit()
+        self.product_input.setPlaceholderText("Product ID")
+        self.product_input.returnPressed.connect(self.load_entries)
+        self.text_input = QLineEdit()
+        self.text_input.setPlaceholderText("Action contains")
+        self.text_input.returnPressed.connect(self.load_entries)
+        self.user_combo = QComboBox()
+        self.user_combo.setMinimumWidth(180)
+
+        apply_btn = QPushButton("Apply Filters")
+        apply_btn.clicked.connect(self.load_entries)
+
+        for widget in [self.date_check, self.date_from, self.date_to, self.product_input, self.text_input,
+                       self.user_combo, apply_btn]:
+            filter_row.addWidget(widget)
+        layout.addLayout(filter_row)
+
+        # --- Entries ---
+        self.table = QTableView()
+        self.model = ProductTableModel(
+            AUDIT_COLUMNS, self,
+            page_source=lambda after_id, limit: name_accounts(
+                self.pool.run(fetch_audit_page, self.filters, after_id, limit),
+                self.refs.account_names(), AUDIT_ACCOUNT_COLUMN))
+        self.table.setModel(self.model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setStretchLastSection(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        self.load_users()
+        self.load_entries()
+
+    def load_users(self):
+        self.user_combo.clear()
+        self.user_combo.addItem("All users", None)
+        try:
+            accounts = self.refs.account_names()
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        for account_id, full_name in sorted(accounts.items(), key=lambda item: item[1]):
+            self.user_combo.addItem(full_name, account_id)
+
+    def load_entries(self):
+        product_id = self.product_input.text().strip()
+        if product_id and not product_id.isdigit():
+            QMessageBox.warning(self, "Invalid Product ID", "Product ID must be a number.")
+            return
+        filters = {
+            "product_id": int(product_id) if product_id else None,
+            "account_id": self.user_combo.currentData(),
+            "text": self.text_input.text().strip(),
+        }
+        if self.date_check.isChecked():
+            filters["start"] = self.date_from.date().toPyDate()
+            filters["end"] = self.date_to.date().addDays(1).toPyDate()
+        self.filters = filters
+
+        # Entries from this terminal are still buffered for up to a second
+        audit_writer(self.pool).flush()
+        try:
+            count = self.pool.run(count_audit, filters)
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        self.title.setText(f"Audit Log ({count})")
+        self.model.reload()
@@ -0,0 +1,203 @@
+"""Timing harness for the hot inventory paths.
+
+    python Benchmark.py search                      # in-memory index vs SQL LIKE on the configured database
+    python Benchmark.py search --synthetic 500000   # in-memory index only, on a generated catalog
+    python Benchmark.py movement --rows 1000000     # stock movement rollup on a scratch database
+"""
+import argparse
+import random
+import time
+import pymysql
+from Database import DB_CONFIG, connect
+from Inventory import INVENTORY_SELECT
+from Search import ProductIndex, SEARCH_WHERE
+
+SEARCH_QUERIES = ["logitech", "intel core", "i5", "rtx", "hub", "12", "monitor", "zzz"]
+
+# Per-product stock in/out totals. Each ledger is summed on its own before
+# the join; joining both raw ledgers onto products first would multiply
+# every stock-in row by every stock-out row of the same product.
+STOCK_MOVEMENT_SELECT = """
+    SELECT p.ProductID,
+           IFNULL(si.StockIn, 0)  AS StockIn,
+           IFNULL(so.StockOut, 0) AS StockOut
+    FROM products AS p
+             LEFT JOIN (SELECT ProductID, SUM(Quantity) AS StockIn
+                        FROM stockin
+                        GROUP BY ProductID) AS si ON p.ProductID = si.ProductID
+             LEFT JOIN (SELECT ProductID, SUM(Quantity) AS StockOut
+                        FROM stockout
+                        GROUP BY ProductID) AS so ON p.ProductID = so.ProductID
+    ORDER BY p.ProductID
+"""
+
+# The stock movement query before the ledgers were pre-aggregated, kept for comparison.
+FANOUT_MOVEMENT_SELECT = """
+    SELECT p.ProductID,
+           IFNULL(SUM(si.Quantity), 0) AS StockIn,
+           IFNULL(SUM(so.Quantity), 0) AS StockOut
+    FROM products p
+    LEFT JOIN stockin si ON p.ProductID = si.ProductID
+    LEFT JOIN stockout so ON p.ProductID = so.ProductID
+    GROUP BY p.ProductID
+    ORDER BY p.ProductID ASC
+"""
+
+MOVEMENT_TABLES = [
+    "CREATE TABLE products (ProductID int(11) NOT NULL PRIMARY KEY) ENGINE=InnoDB",
+    """CREATE TABLE stockin (StockInID int(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+                            ProductID int(11) NOT NULL, Quantity int(11) NOT NULL,
+                            KEY ProductID (ProductID)) ENGINE=InnoDB""",
+    """CREATE TABLE stockout (StockOutID int(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+                             ProductID int(11) NOT NULL, Quantity int(11) NOT NULL) ENGINE=InnoDB""",
+]
+
+_BRANDS = ["Acer", "Asus", "Logitech", "Razer", "Redragon", "Canon", "Intel", "AMD", "Corsair", "Kingston",
+           "Seagate", "Sandisk", "TP-Link", "D-Link", "HyperX", "MSI", "Gigabyte", "Nvidia", "Samsung", "WD"]
+_MODELS = ["Core i3", "Core i5", "Core i7", "Ryzen 5", "Ryzen 7", "RTX 4060", "16GB", "32GB", "1TB", "2TB",
+           "K120", "DeathAdder", "Zeus", "Pixma", "B550", "C270", "24-inch", "27-inch", "Pro", "Mini"]
+_TYPES = ["Monitor", "Keyboard", "Mouse", "Headset", "Printer", "CPU", "RAM", "GPU", "Motherboard", "Storage",
+          "Router", "Switch", "Webcam", "Mouse Pad", "HDMI Cable", "External Drive"]
+_SUPPLIERS = ["TechSource", "PC Hub", "Gadget World", "NetLink Solutions", "CompTech Distributors",
+              "GetHub Distributors", "SheshTech", "Qualitech"]
+
+
+def synthetic_products(count, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for product_id in range(1, count + 1):
+        type_name = rng.choice(_TYPES)
+        name = f"{rng.choice(_BRANDS)} {rng.choice(_MODELS)} {type_name} {rng.randint(100, 9999)}"
+        price = rng.randint(100, 20000)
+        quantity = rng.randint(0, 100)
+        rows.append((product_id, name, type_name, rng.choice(_SUPPLIERS), price, quantity, price * quantity,
+                     rng.randint(1, 20), "2025-10-06 12:00:00"))
+    return rows
+
+
+def _time(fn, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    return best, result
+
+
+def bench_search(args):
+    conn = None
+    if args.synthetic:
+        rows = synthetic_products(args.synthetic)
+    else:
+        conn = connect()
+        cursor = conn.cursor()
+        cursor.execute(INVENTORY_SELECT + " ORDER BY p.ProductID")
+        rows = cursor.fetchall()
+        cursor.close()
+
+    build_time, index = _time(lambda: _build_index(rows), 1)
+    print(f"{len(rows)} products, index built in {build_time * 1000:.0f} ms")
+    print(f"{'query':<14}{'hits':>8}{'index ms':>12}{'sql ms':>10}")
+
+    for query in args.queries or SEARCH_QUERIES:
+        index_time, hits = _time(lambda: index.search(query), args.repeat)
+        sql_column = ""
+        if conn is not None:
+            sql_time, _ = _time(lambda: _sql_search(conn, query), args.repeat)
+            sql_column = f"{sql_time * 1000:>10.2f}"
+        print(f"{query:<14}{len(hits):>8}{index_time * 1000:>12.3f}{sql_column}")
+
+    if conn is not None:
+        conn.close()
+
+
+def _build_index(rows):
+    index = ProductIndex()
+    index.add_many(rows)
+    return index
+
+
+def _sql_search(conn, keyword):
+    pattern = f"%{keyword}%"
+    cursor = conn.cursor()
+    cursor.execute(INVENTORY_SELECT + SEARCH_WHERE, (pattern, pattern, pattern, pattern))
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def bench_movement(args):
+    conn = pymysql.connect(**dict(DB_CONFIG, database=None, autocommit=True))
+    cursor = conn.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{args.database}`")
+    cursor.execute(f"CREATE DATABASE `{args.database}`")
+    cursor.execute(f"USE `{args.database}`")
+    try:
+        load_time, _ = _time(lambda: _fill_ledgers(conn, args.products, args.rows), 1)
+        print(f"{args.products} products, {args.rows} movement rows loaded in {load_time:.1f} s")
+
+        rollup_time, rows = _time(lambda: _fetch_all(conn, STOCK_MOVEMENT_SELECT), args.repeat)
+        print(f"{'pre-aggregated':<16}{rollup_time * 1000:>10.1f} ms  ({len(rows)} products)")
+        if args.fanout:
+            fanout_time, fanout_rows = _time(lambda: _fetch_all(conn, FANOUT_MOVEMENT_SELECT), 1)
+            inflated = sum(1 for a, b in zip(rows, fanout_rows) if a != b)
+            print(f"{'fan-out join':<16}{fanout_time * 1000:>10.1f} ms  ({inflated} products with inflated totals)")
+    finally:
+        if not args.keep:
+            cursor.execute(f"DROP DATABASE `{args.database}`")
+        cursor.close()
+        conn.close()
+
+
+def _fill_ledgers(conn, products, rows, chunk=10000):
+    rng = random.Random(7)
+    cursor = conn.cursor()
+    for ddl in MOVEMENT_TABLES:
+        cursor.execute(ddl)
+    cursor.executemany("INSERT INTO products (ProductID) VALUES (%s)", [(i,) for i in range(1, products + 1)])
+    for table, count in (("stockin", rows - rows // 2), ("stockout", rows // 2)):
+        sql = f"INSERT INTO {table} (ProductID, Quantity) VALUES (%s, %s)"
+        for start in range(0, count, chunk):
+            batch = [(rng.randint(1, products), rng.randint(1, 50)) for _ in range(min(chunk, count - start))]
+            cursor.executemany(sql, batch)
+    cursor.execute("ANALYZE TABLE products, stockin, stockout")
+    cursor.fetchall()
+    cursor.close()
+
+
+def _fetch_all(conn, sql):
+    cursor = conn.cursor()
+    cursor.execute(sql)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="in-memory product index vs SQL LIKE search")
+    search.add_argument("--synthetic", type=int, metavar="N", help="index N generated products instead of the database")
+    search.add_argument("--repeat", type=int, default=5, help="runs per query, the best is reported")
+    search.add_argument("queries", nargs="*", help="keywords to time (default: a fixed mix)")
+    search.set_defaults(run=bench_search)
+
+    movement = commands.add_parser("movement", help="per-product stock movement rollup on generated ledgers")
+    movement.add_argument("--rows", type=int, default=1000000, help="stock-in plus stock-out rows to generate")
+    movement.add_argument("--products", type=int, default=1000, help="products the movements are spread over")
+    movement.add_argument("--database", default="ims_benchmark", help="scratch database, dropped and recreated")
+    movement.add_argument("--keep", action="store_true", help="leave the scratch database in place")
+    movement.add_argument("--fanout", action="store_true",
+                          help="also time the old fan-out join (quadratic per product, slow at full size)")
+    movement.add_argument("--repeat", type=int, default=3, help="runs of the rollup query, the best is reported")
+    movement.set_defaults(run=bench_movement)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
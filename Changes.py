@@ -0,0 +1,205 @@
+import time
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+
+# How often an open window asks for changes made since its last sync.
+CHANGE_POLL_MS = 2000
+# Changes read per poll; a longer backlog is picked up by the following polls.
+CHANGE_BATCH = 1000
+# Seconds a missing sequence number is waited for before it is taken as a
+# rolled-back transaction rather than one that has not committed yet.
+GAP_TIMEOUT = 30
+# Missing sequence numbers tracked at most; the oldest are given up first.
+MAX_GAPS = 1000
+# Changes older than this are deleted at startup.
+CHANGE_RETENTION_DAYS = 7
+
+# Entities and actions written to the feed
+PRODUCT, SUPPLIER, ACCOUNT = "product", "supplier", "account"
+UPSERT, DELETE, RELOAD = "upsert", "delete", "reload"
+
+# ---------------------------
+# Change log
+# ---------------------------
+# Every mutation appends (entity, id, action) rows in its own transaction,
+# so a change is visible in the feed exactly when the data is. It follows
+# the shape of the logs table, but logs keeps a foreign key to products
+# and is the audit trail; the feed also has to carry deletes and is pruned.
+CHANGES_TABLE = """
+    CREATE TABLE IF NOT EXISTS changes (
+        ChangeSeq bigint(20) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        Entity varchar(20) NOT NULL,
+        EntityID int(11) NOT NULL,
+        Action varchar(20) NOT NULL,
+        ChangedAt datetime NOT NULL DEFAULT current_timestamp(),
+        KEY ChangedAt (ChangedAt)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+"""
+
+
+def ensure_changes(conn):
+    with conn.cursor() as cursor:
+        cursor.execute(CHANGES_TABLE)
+
+
+def prune_changes(conn):
+    """Drop entries past their retention; run at startup."""
+    with conn.cursor() as cursor:
+        cursor.execute("DELETE FROM changes WHERE ChangedAt < NOW() - INTERVAL %s DAY", (CHANGE_RETENTION_DAYS,))
+
+
+# Called with the cursor of the transaction making the change.
+def record_change(cursor, entity, entity_id, action=UPSERT):
+    cursor.execute("INSERT INTO changes (Entity, EntityID, Action) VALUES (%s, %s, %s)",
+                   (entity, entity_id, action))
+
+
+def record_changes(cursor, entity, entity_ids, action=UPSERT):
+    cursor.executemany("INSERT INTO changes (Entity, EntityID, Action) VALUES (%s, %s, %s)",
+                       [(entity, entity_id, action) for entity_id in entity_ids])
+
+
+def latest_change(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT IFNULL(MAX(ChangeSeq), 0) FROM changes")
+        return cursor.fetchone()[0]
+
+
+def fetch_changes(conn, after_seq, limit=CHANGE_BATCH, missing=()):
+    """(ChangeSeq, Entity, EntityID, Action) rows after ``after_seq``, oldest first.
+
+    Rows for the earlier sequence numbers in ``missing`` are included if they
+    have appeared since.
+    """
+    with conn.cursor() as cursor:
+        rows = ()
+        if missing:
+            placeholders = ", ".join(["%s"] * len(missing))
+            cursor.execute(f"""
+                SELECT ChangeSeq, Entity, EntityID, Action
+                FROM changes
+                WHERE ChangeSeq IN ({placeholders})
+            """, list(missing))
+            rows = cursor.fetchall()
+        cursor.execute("""
+            SELECT ChangeSeq, Entity, EntityID, Action
+            FROM changes
+            WHERE ChangeSeq > %s
+            ORDER BY ChangeSeq
+            LIMIT %s
+        """, (after_seq, limit))
+        return sorted(rows) + list(cursor.fetchall())
+
+
+def collapse_changes(rows, last_seq, gaps, now):
+    """Fold fetched change rows into ``{entity: {entity_id: action}}``.
+
+    ``rows`` come from fetch_changes. ``gaps`` maps missing ChangeSeq to the
+    time it was first noticed and is updated in place: numbers skipped over
+    are added, numbers that turn up are removed, and numbers missing for
+    longer than GAP_TIMEOUT (or beyond the MAX_GAPS newest) are given up.
+    Returns ``(changes, new last_seq)``.
+    """
+    changes = {}
+    for seq, entity, entity_id, action in rows:
+        if seq <= last_seq and gaps.pop(seq, None) is None:
+            continue  # already applied
+        for missing in range(last_seq + 1, seq):
+            gaps[missing] = now
+        last_seq = max(last_seq, seq)
+        changes.setdefault(entity, {})[entity_id] = action
+    for seq, noticed in list(gaps.items()):
+        if now - noticed > GAP_TIMEOUT:
+            del gaps[seq]
+    if len(gaps) > MAX_GAPS:
+        for seq in sorted(gaps)[:len(gaps) - MAX_GAPS]:
+            del gaps[seq]
+    return changes, last_seq
+
+
+# ---------------------------
+# Tailing the feed
+# ---------------------------
+class _FeedSignals(QObject):
+    fetched = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _FeedTask(QRunnable):
+    def __init__(self, signals, pool, after_seq, missing):
+        super().__init__()
+        self.signals = signals
+        self.pool = pool
+        self.after_seq = after_seq
+        self.missing = missing
+
+    def run(self):
+        try:
+            if self.after_seq is None:
+                rows = self.pool.run(latest_change)
+            else:
+                rows = self.pool.run(fetch_changes, self.after_seq, CHANGE_BATCH, self.missing)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.fetched.emit(rows)
+
+
+class ChangeFeed(QObject):
+    """Tails the change log on a timer and emits what other writers changed.
+
+    ``changed`` carries ``{entity: {entity_id: action}}`` with only the last
+    action per id, collapsed from everything committed since the previous
+    poll. Sequence numbers are handed out at insert time but become visible
+    at commit, so a lower number can show up after a higher one; numbers
+    skipped over are re-read until they appear or GAP_TIMEOUT passes.
+    """
+
+    changed = pyqtSignal(dict)
+
+    def __init__(self, pool, parent=None, interval_ms=CHANGE_POLL_MS):
+        super().__init__(parent)
+        self.pool = pool
+        self.last_seq = None  # None until the starting point is known
+        self._gaps = {}  # missing ChangeSeq -> time first noticed
+        self._busy = False
+
+        self.signals = _FeedSignals(self)
+        self.signals.fetched.connect(self._on_fetched)
+        self.signals.failed.connect(self._on_failed)
+        self.workers = QThreadPool(self)
+        self.workers.setMaxThreadCount(1)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        self.timer.start()
+        self.poll()
+
+    def stop(self):
+        self.timer.stop()
+
+    def poll(self):
+        if self._busy:
+            return
+        self._busy = True
+        self.workers.start(_FeedTask(self.signals, self.pool, self.last_seq, sorted(self._gaps)))
+
+    @pyqtSlot(str)
+    def _on_failed(self, message):
+        # Polling simply tries again on the next tick
+        print("Error:", message)
+        self._busy = False
+
+    @pyqtSlot(object)
+    def _on_fetched(self, rows):
+        self._busy = False
+        if self.last_seq is None:
+            # First poll only fixes the starting point; the window loaded its data just now
+            self.last_seq = rows
+            return
+
+        changes, self.last_seq = collapse_changes(rows, self.last_seq, self._gaps, time.monotonic())
+        if changes:
+            self.changed.emit(changes)
@@ -0,0 +1,462 @@
+import math
+from functools import partial
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QMessageBox)
+from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from Summary import SUMMARY_ID
+from Stock import fetch_movement_trend, window_start
+from Alerts import LOW_STOCK_MARGIN
+
+# Worker threads used to load one dashboard refresh; each holds a pooled connection.
+DASHBOARD_THREADS = 4
+
+SUMMARY_BOXES = ["Total Categories", "Total Issued Items", "Total Products"]
+# Stock movement trend windows: (label, bucket, number of buckets)
+TREND_WINDOWS = [
+    ("Last 14 days", "day", 14),
+    ("Last 12 weeks", "week", 12),
+    ("Last 12 months", "month", 12),
+]
+TREND_LABEL_FORMATS = {"day": "%b %d", "week": "%b %d", "month": "%b %Y"}
+
+
+# ---------------------------
+# Dashboard queries
+# ---------------------------
+# Each section of the dashboard is loaded by its own query function so the
+# sections can run in parallel and render independently.
+def fetch_summary(conn):
+    # One round trip over the maintained counters (see Summary.py)
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM category), s.TotalProducts, s.TotalStockOut
+            FROM inventory_summary s
+            WHERE s.SummaryID = %s
+        """, (SUMMARY_ID,))
+        total_categories, total_products, total_stockout = cursor.fetchone() or (0, 0, 0)
+    return {
+        "Total Categories": total_categories,
+        "Total Issued Items": total_stockout,
+        "Total Products": total_products,
+    }
+
+
+def fetch_category_distribution(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT c.CategoryName, cs.ProductCount
+            FROM category_summary cs
+            JOIN category c ON cs.CategoryID = c.CategoryID
+            WHERE cs.ProductCount > 0
+            ORDER BY c.CategoryName
+        """)
+        return cursor.fetchall()
+
+
+def fetch_top_products(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT ProductName, Quantity
+            FROM products
+            WHERE RetiredAt IS NULL
+            ORDER BY Quantity DESC LIMIT 5
+        """)
+        return cursor.fetchall()
+
+
+def fetch_stock_movement(conn, bucket="day", periods=14):
+    trend = fetch_movement_trend(conn, bucket, window_start(bucket, periods))
+    label_format = TREND_LABEL_FORMATS[bucket]
+    trend["labels"] = [day.strftime(label_format) for day in trend["buckets"]]
+    return trend
+
+
+DASHBOARD_QUERIES = {
+    "summary": fetch_summary,
+    "category_distribution": fetch_category_distribution,
+    "top_products": fetch_top_products,
+    "stock_movement": fetch_stock_movement,
+}
+# The low stock table is not queried here: it shows the set kept by
+# Alerts.AlertEngine, which only re-reads the products that changed.
+
+
+# ---------------------------
+# Background loading
+# ---------------------------
+class _DashboardSignals(QObject):
+    loaded = pyqtSignal(int, str, object)
+    failed = pyqtSignal(int, str, str)
+
+
+class _DashboardTask(QRunnable):
+    def __init__(self, signals, pool, generation, key, fetch):
+        super().__init__()
+        self.signals = signals
+        self.pool = pool
+        self.generation = generation
+        self.key = key
+        self.fetch = fetch
+
+    def run(self):
+        try:
+            data = self.pool.run(self.fetch)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, self.key, str(e))
+            return
+        self.signals.loaded.emit(self.generation, self.key, data)
+
+
+class DashboardPanel(QWidget):
+    def __init__(self, pool, alerts, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.alerts = alerts
+        self.setGeometry(10, 10, 1140, 500)
+        self.setStyleSheet("background-color: rgb(70, 70, 70); border-radius: 10px;")
+
+        self.main_layout = QVBoxLayout(self)
+
+        # Title
+        title = QLabel("Dashboard")
+        title.setStyleSheet("color: white; font-size: 22px; font-weight: bold;")
+        title.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.main_layout.addWidget(title)
+
+        # Store widgets for refresh later
+        self.summary_layout = QHBoxLayout()
+        self.graph_layout = QHBoxLayout()
+
+        self.main_layout.addLayout(self.summary_layout)
+        self.main_layout.addLayout(self.graph_layout)
+
+        low_stock_header = QHBoxLayout()
+        self.low_stock_label = QLabel("Low Stock Products")
+        self.low_stock_label.setStyleSheet("color: white; font-size: 14px; font-weight: bold;")
+        self.low_stock_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        low_stock_header.addWidget(self.low_stock_label)
+
+        # Stock movement trend window
+        self.trend_combo = QComboBox()
+        for label, bucket, periods in TREND_WINDOWS:
+            self.trend_combo.addItem(label, (bucket, periods))
+        self.trend_combo.setStyleSheet("color: white; background-color: rgb(80, 80, 80); padding: 4px;")
+        self.trend_combo.currentIndexChanged.connect(lambda _: self.refresh_dashboard())
+        low_stock_header.addWidget(self.trend_combo, alignment=Qt.AlignmentFlag.AlignRight)
+
+        # Refresh button
+        self.refresh_btn = QPushButton("⟳ Refresh")
+        self.refresh_btn.setFixedWidth(100)
+        self.refresh_btn.setStyleSheet("""
+            QPushButton {
+                background-color: rgb(50, 150, 200);
+                color: white;
+                border-radius: 8px;
+                padding: 5px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: rgb(60, 170, 220);
+            }
+        """)
+        self.refresh_btn.clicked.connect(self.refresh_dashboard)
+        low_stock_header.addWidget(self.refresh_btn, alignment=Qt.AlignmentFlag.AlignRight)
+
+        self.main_layout.addLayout(low_stock_header)
+
+        # Create low stock table
+        self.low_stock_table = QTableWidget()
+        self.low_stock_table.setColumnCount(6)
+        self.low_stock_table.setHorizontalHeaderLabels(["Product Name", "Type", "Quantity", "Reorder Level",
+                                                        "Forecast Reorder Point", "Suggested Order"])
+        self.low_stock_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.low_stock_table.verticalHeader().setVisible(False)
+        self.low_stock_table.setStyleSheet("""
+            QTableWidget {
+                color: black;
+                background-color: #f8f9fa;
+                alternate-background-color: #e9ecef;
+                gridline-color: #b0b0b0;
+                border-radius: 10px;
+                font-size: 13px;
+                selection-background-color: rgb(70,130,250);
+                selection-color: white;
+            }
+            QHeaderView::section {
+                background-color: rgb(50,150,200);
+                color: white;
+                font-weight: bold;
+                border: none;
+                padding: 6px;
+            }
+            QHeaderView::section:first { border-top-left-radius: 10px; }
+            QHeaderView::section:last { border-top-right-radius: 10px; }
+            QTableCornerButton::section { background-color: rgb(50,150,200); border: none; }
+            QScrollBar:vertical {
+                background: #e2e2e2;
+                width: 10px;
+                margin: 2px 0 2px 0;
+                border-radius: 5px;
+            }
+            QScrollBar::handle:vertical {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 rgb(130,180,230), stop:1 rgb(90,150,210));
+                border-radius: 20px;
+                min-height: 20px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 rgb(150,200,250), stop:1 rgb(100,160,220));
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+                background: none;
+            }
+        """)
+        self.main_layout.addWidget(self.low_stock_table)
+        # Summary boxes are filled in as their data arrives
+        self.summary_boxes = {}
+        for label in SUMMARY_BOXES:
+            box = QLabel(f"{label}\n…")
+            box.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            box.setStyleSheet("""
+                QLabel {
+                    background-color: rgb(80, 80, 80);
+                    color: white;
+                    border-radius: 10px;
+                    padding: 10px;
+                    font-size: 16px;
+                }
+            """)
+            self.summary_layout.addWidget(box)
+            self.summary_boxes[label] = box
+
+        # Charts are built once and updated in place on every refresh
+        self._build_charts()
+
+        self.signals = _DashboardSignals(self)
+        self.signals.loaded.connect(self._on_loaded)
+        self.signals.failed.connect(self._on_failed)
+        self.workers = QThreadPool(self)
+        self.workers.setMaxThreadCount(DASHBOARD_THREADS)
+        self._generation = 0
+        self._pending = 0
+        self._shown = {}  # section -> data currently on screen
+        self._renderers = {
+            "summary": self.render_summary,
+            "category_distribution": self.render_category_distribution,
+            "top_products": self.render_top_products,
+            "stock_movement": self.render_stock_movement,
+        }
+
+        # Set when products changed while the panel was hidden or loading
+        self._stale = False
+
+        self.refresh_dashboard()
+        self.alerts.alerts_changed.connect(self.show_alerts)
+        self.show_alerts(self.alerts.alerts())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale:
+            self._auto_refresh()
+
+    def apply_changes(self):
+        """Reload after products changed (see Changes.py): now if on screen, otherwise when shown."""
+        self._stale = True
+        if self.isVisible():
+            self._auto_refresh()
+
+    def refresh_dashboard(self):
+        """Refresh all dashboard data in the background"""
+        self.refresh_btn.setEnabled(False)
+        self._load()
+
+    def _auto_refresh(self):
+        if not self._pending:
+            self._load()
+
+    def _load(self):
+        self._stale = False
+        self._generation += 1
+        self._pending = len(DASHBOARD_QUERIES)
+        self._errors = []
+        fetches = dict(DASHBOARD_QUERIES)
+        bucket, periods = self.trend_combo.currentData()
+        fetches["stock_movement"] = partial(fetch_stock_movement, bucket=bucket, periods=periods)
+        for key, fetch in fetches.items():
+            self.workers.start(_DashboardTask(self.signals, self.pool, self._generation, key, fetch))
+
+    @pyqtSlot(int, str, object)
+    def _on_loaded(self, generation, key, data):
+        if generation != self._generation:
+            return
+        # Unchanged sections are not redrawn, which keeps auto-refresh cheap
+        if self._shown.get(key) != data:
+            self._renderers[key](data)
+            self._shown[key] = data
+        self._section_done()
+
+    @pyqtSlot(int, str, str)
+    def _on_failed(self, generation, key, message):
+        if generation != self._generation:
+            return
+        print("Error:", key, message)
+        self._errors.append(message)
+        self._section_done()
+
+    def _section_done(self):
+        self._pending -= 1
+        if self._pending:
+            return
+        manual = not self.refresh_btn.isEnabled()
+        self.refresh_btn.setEnabled(True)
+        if self._errors and manual:
+            QMessageBox.critical(self, "Database Error", self._errors[0])
+        if self._stale and self.isVisible():
+            self._auto_refresh()
+
+    # ---------------------------
+    # Charts
+    # ---------------------------
+    def _build_charts(self):
+        self.canvases = {}
+        self.axes = {}
+        self.no_data = {}
+        for key, size in (("category_distribution", (3.8, 3.8)),
+                          ("top_products", (4.5, 2.2)),
+                          ("stock_movement", (4.5, 3.8))):
+            fig = Figure(figsize=size)
+            ax = fig.add_subplot()
+            self.axes[key] = ax
+            self.no_data[key] = ax.text(0.5, 0.5, "No Data", ha='center', va='center', transform=ax.transAxes)
+            self.canvases[key] = FigureCanvas(fig)
+            self.graph_layout.addWidget(self.canvases[key])
+        self.canvases["top_products"].figure.tight_layout(pad=2.0)
+
+        self._pie = None  # (wedges, labels, autotexts) of the current pie
+        self._bars = None  # (names, bars, value labels) of the current bar graph
+
+        ax3 = self.axes["stock_movement"]
+        self._stockin_line, = ax3.plot([], [], marker='o', label="Stock In")
+        self._stockout_line, = ax3.plot([], [], marker='o', label="Stock Out")
+        ax3.tick_params(axis='x', labelrotation=45, labelsize=7)
+        ax3.legend()
+
+    def _show_no_data(self, key, empty):
+        self.no_data[key].set_visible(empty)
+        if empty:
+            self.axes[key].set_axis_off()
+        else:
+            self.axes[key].set_axis_on()
+
+    # ---------------------------
+    # Section renderers
+    # ---------------------------
+    def render_summary(self, totals):
+        for label, value in totals.items():
+            self.summary_boxes[label].setText(f"{label}\n{value}")
+
+    def render_category_distribution(self, distribution):
+        # Pie Chart – Category Distribution
+        ax1 = self.axes["category_distribution"]
+        categories, counts = zip(*distribution) if distribution else ([], [])
+        if self._pie is not None and [w.get_label() for w in self._pie[0]] == list(categories):
+            # Same categories: swing the existing wedges to their new angles
+            total = float(sum(counts))
+            theta1 = 90.0
+            for wedge, label, autotext, count in zip(*self._pie, counts):
+                theta2 = theta1 + 360.0 * count / total
+                wedge.set_theta1(theta1)
+                wedge.set_theta2(theta2)
+                mid = math.radians((theta1 + theta2) / 2)
+                x, y = math.cos(mid), math.sin(mid)
+                label.set_position((1.1 * x, 1.1 * y))
+                label.set_horizontalalignment('left' if x > 0 else 'right')
+                autotext.set_position((0.6 * x, 0.6 * y))
+                autotext.set_text(f"{100.0 * count / total:.1f}%")
+                theta1 = theta2
+        else:
+            if self._pie is not None:
+                for artist in self._pie[0] + self._pie[1] + self._pie[2]:
+                    artist.remove()
+                self._pie = None
+            if categories:
+                wedges, labels, autotexts = ax1.pie(counts, labels=categories, autopct='%1.1f%%', startangle=90)
+                self._pie = (list(wedges), list(labels), list(autotexts))
+                ax1.set_title("Category Distribution", fontsize=10)
+        self._show_no_data("category_distribution", not categories)
+        self.canvases["category_distribution"].draw_idle()
+
+    def render_top_products(self, top_products):
+        # Bar Graph – Top 5 Products by Quantity
+        ax2 = self.axes["top_products"]
+        product_names, quantities = zip(*top_products) if top_products else ([], [])
+        if self._bars is not None and self._bars[0] == product_names:
+            for bar, value_label, height in zip(self._bars[1], self._bars[2], quantities):
+                bar.set_height(height)
+                value_label.set_y(height + 0.5)
+                value_label.set_text(str(int(height)))
+        else:
+            if self._bars is not None:
+                self._bars[1].remove()
+                for value_label in self._bars[2]:
+                    value_label.remove()
+            self._bars = None
+            if product_names:
+                bars = ax2.bar(range(len(product_names)), quantities)
+                ax2.set_title("Top 5 Products by Quantity", fontsize=10)
+                ax2.set_xticks(range(len(product_names)))
+                ax2.set_xticklabels(product_names, rotation=30, ha='right', fontsize=7)
+                value_labels = []
+                for bar in bars:
+                    height = bar.get_height()
+                    value_labels.append(ax2.text(bar.get_x() + bar.get_width() / 2, height + 0.5, str(int(height)),
+                                                 ha='center', va='bottom', fontsize=7, color='white'))
+                self._bars = (product_names, bars, value_labels)
+        ax2.relim()
+        ax2.autoscale_view()
+        self._show_no_data("top_products", not product_names)
+        self.canvases["top_products"].draw_idle()
+
+    def render_stock_movement(self, movement):
+        # Line Chart – Stock Movement Trend
+        ax3 = self.axes["stock_movement"]
+        positions = range(len(movement["labels"]))
+        self._stockin_line.set_data(positions, movement["stockin"])
+        self._stockout_line.set_data(positions, movement["stockout"])
+        ax3.set_xticks(positions)
+        ax3.set_xticklabels(movement["labels"])
+        ax3.set_title(f"Stock Movement Trend ({self.trend_combo.currentText()})", fontsize=10)
+        ax3.relim()
+        ax3.autoscale_view()
+        self.canvases["stock_movement"].draw_idle()
+
+    @pyqtSlot(list)
+    def show_alerts(self, rows):
+        self.low_stock_label.setText(f"Low Stock Products ({len(rows)})")
+        self.render_low_stock([row[1:] for row in rows])
+
+    def render_low_stock(self, low_stock_data):
+        self.low_stock_table.setRowCount(len(low_stock_data))
+        for row, values in enumerate(low_stock_data):
+            product_name, type_name, quantity, reorder_level, reorder_point, order_quantity = values
+            self.low_stock_table.setItem(row, 0, QTableWidgetItem(product_name))
+            self.low_stock_table.setItem(row, 1, QTableWidgetItem(type_name))
+
+            qty_item = QTableWidgetItem(str(quantity))
+            if quantity <= reorder_level:
+                qty_item.setForeground(QColor("red"))
+            elif quantity <= reorder_level + LOW_STOCK_MARGIN:
+                qty_item.setForeground(QColor("orange"))
+            self.low_stock_table.setItem(row, 2, qty_item)
+            self.low_stock_table.setItem(row, 3, QTableWidgetItem(str(reorder_level)))
+            # Blank until the first forecast run covers the product
+            point_item = QTableWidgetItem("" if reorder_point is None else str(reorder_point))
+            if reorder_point is not None and quantity <= reorder_point:
+                point_item.setForeground(QColor("red"))
+            self.low_stock_table.setItem(row, 4, point_item)
+            self.low_stock_table.setItem(row, 5, QTableWidgetItem("" if order_quantity is None else str(order_quantity)))
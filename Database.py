@@ -0,0 +1,158 @@
+import threading
+import time
+from contextlib import contextmanager
+import pymysql
+
+# Connection settings shared by the login window and every background worker.
+DB_CONFIG = {
+    "host": "localhost",
+    "port": 3306,
+    "user": "root",
+    "password": "",
+    "database": "ims",
+}
+
+# Connections kept by the pool, and how long a checkout may wait for one.
+POOL_SIZE = 8
+CHECKOUT_TIMEOUT = 10
+# Idle seconds after which a connection is pinged before it is handed out.
+PING_AFTER = 5
+
+
+def connect():
+    return pymysql.connect(**DB_CONFIG)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    """Bounded, thread-aware pool of pymysql connections.
+
+    ``connection()`` checks a connection out for the calling thread; nested
+    uses on the same thread share it, so helpers can open their own block
+    without taking a second slot. Pooled connections run in autocommit mode,
+    ``transaction()`` wraps a block in BEGIN/COMMIT and rolls back on error;
+    ``after_commit()`` defers work, such as dropping cached rows, until then.
+    Idle connections are pinged (and reconnected) on checkout, and a
+    connection that failed with a socket-level error is dropped instead of
+    going back to the pool.
+    """
+
+    def __init__(self, size=POOL_SIZE, timeout=CHECKOUT_TIMEOUT, ping_after=PING_AFTER, **config):
+        self.config = dict(DB_CONFIG, autocommit=True, **config)
+        self.size = size
+        self.timeout = timeout
+        self.ping_after = ping_after
+        self._idle = []  # (connection, released_at), most recent last
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._local = threading.local()
+        self._closed = False
+
+    def acquire(self):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(f"No database connection became available within {self.timeout}s.")
+        try:
+            with self._lock:
+                idle = self._idle.pop() if self._idle else None
+            if idle is None:
+                return pymysql.connect(**self.config)
+            conn, released_at = idle
+            if time.monotonic() - released_at >= self.ping_after:
+                try:
+                    conn.ping(reconnect=True)
+                except pymysql.MySQLError:
+                    _close_quietly(conn)
+                    conn = pymysql.connect(**self.config)
+            return conn
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn, discard=False):
+        try:
+            if discard or self._closed or not conn.open:
+                _close_quietly(conn)
+            else:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self.acquire()
+        local.conn = conn
+        broken = False
+        try:
+            yield conn
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            broken = True
+            raise
+        finally:
+            local.conn = None
+            self.release(conn, discard=broken)
+
+    @contextmanager
+    def transaction(self):
+        with self.connection() as conn:
+            local = self._local
+            if getattr(local, "in_transaction", False):
+                # Joined the enclosing transaction on this thread
+                yield conn
+                return
+
+            conn.begin()
+            local.in_transaction = True
+            local.after_commit = []
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                try:
+                    conn.rollback()
+                except pymysql.MySQLError:
+                    pass
+                raise
+            finally:
+                local.in_transaction = False
+                callbacks, local.after_commit = local.after_commit, []
+            for callback in callbacks:
+                callback()
+
+    def after_commit(self, callback):
+        """Call ``callback()`` once the transaction open on this thread commits.
+
+        Outside a transaction it is called right away; on rollback it is dropped.
+        """
+        if getattr(self._local, "in_transaction", False):
+            self._local.after_commit.append(callback)
+        else:
+            callback()
+
+    def run(self, fn, *args, **kwargs):
+        """Call ``fn(conn, *args, **kwargs)`` with a pooled connection."""
+        with self.connection() as conn:
+            return fn(conn, *args, **kwargs)
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            _close_quietly(conn)
+
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
@@ -0,0 +1,164 @@
+import csv
+import os
+import pymysql.cursors
+from datetime import datetime
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+from Reports import EXPORT_REPORTS, name_accounts
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Rows pulled from the server per fetchmany; only one chunk is held at a time.
+EXPORT_CHUNK = 10000
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def export_formats():
+    """File dialog filters for the formats this install can write."""
+    formats = ["CSV (*.csv)"]
+    if pyarrow is not None:
+        formats.append("Parquet (*.parquet)")
+    return formats
+
+
+# ---------------------------
+# Writers
+# ---------------------------
+# Each writer takes the report columns and receives rows chunk by chunk.
+class CsvWriter:
+    def __init__(self, path, columns):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([header for header, _ in columns])
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    ARROW_TYPES = {int: "int64", float: "float64", str: "string", datetime: "timestamp"}
+
+    def __init__(self, path, columns):
+        if pyarrow is None:
+            raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow).")
+        self.kinds = [kind for _, kind in columns]
+        self.schema = pyarrow.schema([(header, self._arrow_type(kind)) for header, kind in columns])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    @staticmethod
+    def _arrow_type(kind):
+        if kind is datetime:
+            return pyarrow.timestamp("s")
+        return getattr(pyarrow, ParquetWriter.ARROW_TYPES[kind])()
+
+    def write(self, rows):
+        # One row group per chunk keeps the writer's memory bounded
+        columns = [list(values) for values in zip(*rows)]
+        for index, kind in enumerate(self.kinds):
+            if kind is str:
+                columns[index] = [None if value is None else str(value) for value in columns[index]]
+        self.writer.write_table(pyarrow.Table.from_arrays(
+            [pyarrow.array(values, type=field.type) for values, field in zip(columns, self.schema)],
+            schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {".csv": CsvWriter, ".parquet": ParquetWriter}
+
+
+# ---------------------------
+# Export
+# ---------------------------
+def export_report(conn, report, path, progress=None, cancelled=None, account_names=None):
+    """Stream the named report in EXPORT_REPORTS to ``path`` and return the row count.
+
+    The format follows the file extension. Rows come through an unbuffered
+    SSCursor in EXPORT_CHUNK slices, so memory does not grow with the report.
+    The file is written under a temporary name and only moved into place once
+    complete; a failure or ``cancelled()`` returning True leaves no file behind,
+    but may leave unread rows on ``conn``, which should then be discarded.
+    ``account_names`` (AccountID -> name) fills in the StockedBy column.
+    """
+    columns, sql, account_column = EXPORT_REPORTS[report]
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Unsupported export format {extension!r}; use .csv or .parquet.")
+
+    partial = path + ".part"
+    writer = WRITERS[extension](partial, columns)
+    count = 0
+    try:
+        # Not closed on failure: closing an SSCursor reads out the remaining rows
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
+        cursor.execute(sql)
+        while True:
+            if cancelled and cancelled():
+                raise ExportCancelled("Export cancelled.")
+            rows = cursor.fetchmany(EXPORT_CHUNK)
+            if not rows:
+                break
+            if account_column is not None:
+                rows = name_accounts(rows, account_names or {}, account_column)
+            writer.write(rows)
+            count += len(rows)
+            if progress:
+                progress(count)
+        cursor.close()
+        writer.close()
+        os.replace(partial, path)
+    except BaseException:
+        writer.close()
+        os.remove(partial)
+        raise
+    return count
+
+
+class ExportSignals(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    """Runs export_report on a worker thread with its own pooled connection."""
+
+    def __init__(self, pool, report, path, account_names=None):
+        super().__init__()
+        self.pool = pool
+        self.report = report
+        self.path = path
+        self.account_names = account_names
+        self.signals = ExportSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @pyqtSlot()
+    def run(self):
+        conn = None
+        done = False
+        try:
+            conn = self.pool.acquire()
+            count = export_report(conn, self.report, self.path, self.signals.progress.emit,
+                                  lambda: self._cancelled, self.account_names)
+            done = True
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        finally:
+            if conn is not None:
+                # A cancelled or failed export may leave unread rows on the wire
+                self.pool.release(conn, discard=not done)
+        self.signals.finished.emit(count)
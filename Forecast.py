@@ -0,0 +1,183 @@
+import math
+import time
+from datetime import date, timedelta
+import numpy as np
+import pymysql.cursors
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+from Changes import PRODUCT, RELOAD, record_change
+
+# Days of stock-out history each forecast is fitted on.
+FORECAST_DAYS = 90
+# Days between placing a purchase order and receiving it.
+LEAD_TIME_DAYS = 7
+# Standard normal quantile for the chance of not running out during a lead
+# time; 1.65 covers 95% of lead times.
+SERVICE_Z = 1.65
+# Cost of placing one order, and yearly cost of holding one unit as a share
+# of its price; together they set the economic order quantity.
+ORDER_COST = 500
+HOLDING_RATE = 0.25
+# Rows streamed per fetch while reading, and sent per INSERT while writing.
+FORECAST_CHUNK = 5000
+
+FORECAST_TABLE = """
+    CREATE TABLE IF NOT EXISTS product_forecast (
+        ProductID int(11) NOT NULL PRIMARY KEY,
+        DailyUsage double NOT NULL,
+        UsageStdDev double NOT NULL,
+        SafetyStock int(11) NOT NULL,
+        ReorderPoint int(11) NOT NULL,
+        OrderQuantity int(11) NOT NULL,
+        ComputedAt datetime NOT NULL DEFAULT current_timestamp()
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+"""
+
+FORECAST_INSERT = """
+    INSERT INTO product_forecast (ProductID, DailyUsage, UsageStdDev, SafetyStock, ReorderPoint, OrderQuantity)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+
+def ensure_forecast(conn):
+    with conn.cursor() as cursor:
+        cursor.execute(FORECAST_TABLE)
+
+
+# ---------------------------
+# History
+# ---------------------------
+def _fetch_array(conn, sql, params, columns, dtype):
+    """Stream the rows of ``sql`` into a 2-D array without holding them all as tuples."""
+    chunks = []
+    cursor = conn.cursor(pymysql.cursors.SSCursor)
+    try:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(FORECAST_CHUNK)
+            if not rows:
+                break
+            chunks.append(np.array(rows, dtype=dtype))
+    finally:
+        cursor.close()
+    return np.concatenate(chunks) if chunks else np.empty((0, columns), dtype=dtype)
+
+
+def fetch_active_prices(conn):
+    """(ProductID, Price) of every active product, in ProductID order."""
+    return _fetch_array(conn, """
+        SELECT ProductID, Price FROM products
+        WHERE RetiredAt IS NULL
+        ORDER BY ProductID
+    """, (), 2, np.int64)
+
+
+def fetch_daily_usage(conn, start, end):
+    """(ProductID, day, quantity) stock-out totals per product and day from ``start`` to ``end``.
+
+    Days are counted from ``start``; days without stock-outs have no row.
+    """
+    return _fetch_array(conn, """
+        SELECT ProductID, DATEDIFF(MovedAt, %s) AS Day, SUM(Quantity)
+        FROM stockout
+        WHERE MovedAt >= %s AND MovedAt < %s
+        GROUP BY ProductID, Day
+    """, (start, start, end), 3, np.int64)
+
+
+# ---------------------------
+# Model
+# ---------------------------
+def forecast(product_ids, prices, usage, days, lead_time=LEAD_TIME_DAYS, z=SERVICE_Z,
+             order_cost=ORDER_COST, holding_rate=HOLDING_RATE):
+    """Reorder recommendations for every product at once.
+
+    ``product_ids`` must be sorted; ``usage`` holds (ProductID, day,
+    quantity) rows over a window of ``days`` days, and products without a
+    row used nothing on that day. Per product, daily demand has mean ``r``
+    and deviation ``s``, and:
+
+        safety stock  = ceil(z * s * sqrt(lead_time))
+        reorder point = ceil(r * lead_time) + safety stock
+        order qty     = ceil(sqrt(2 * 365r * order_cost / (price * holding_rate)))
+
+    Returns a dict of arrays aligned with ``product_ids``.
+    """
+    count = len(product_ids)
+    positions = np.searchsorted(product_ids, usage[:, 0])
+    found = positions < count
+    found[found] = product_ids[positions[found]] == usage[found, 0]
+    positions = positions[found]
+    quantities = usage[found, 2].astype(np.float64)
+
+    # Sums over the rows present; the missing days add zeros to both
+    totals = np.bincount(positions, weights=quantities, minlength=count)
+    squares = np.bincount(positions, weights=quantities * quantities, minlength=count)
+    rate = totals / days
+    deviation = np.sqrt(np.maximum(squares / days - rate * rate, 0.0))
+
+    safety = np.ceil(z * deviation * math.sqrt(lead_time))
+    reorder_point = np.ceil(rate * lead_time) + safety
+    holding = prices.astype(np.float64) * holding_rate
+    order_quantity = np.zeros(count)
+    orders = (rate > 0) & (holding > 0)
+    order_quantity[orders] = np.ceil(np.sqrt(2 * 365 * rate[orders] * order_cost / holding[orders]))
+    return {
+        "rate": rate,
+        "deviation": deviation,
+        "safety_stock": safety.astype(np.int64),
+        "reorder_point": reorder_point.astype(np.int64),
+        "order_quantity": order_quantity.astype(np.int64),
+    }
+
+
+# ---------------------------
+# Recompute
+# ---------------------------
+def save_forecasts(conn, product_ids, result):
+    """Replace every stored forecast; call inside pool.transaction()."""
+    rows = list(zip(product_ids.tolist(), np.round(result["rate"], 4).tolist(),
+                    np.round(result["deviation"], 4).tolist(), result["safety_stock"].tolist(),
+                    result["reorder_point"].tolist(), result["order_quantity"].tolist()))
+    with conn.cursor() as cursor:
+        cursor.execute("DELETE FROM product_forecast")
+        for start in range(0, len(rows), FORECAST_CHUNK):
+            cursor.executemany(FORECAST_INSERT, rows[start:start + FORECAST_CHUNK])
+        # Open windows reload their product views and low stock alerts
+        record_change(cursor, PRODUCT, 0, RELOAD)
+
+
+def recompute_forecasts(pool, days=FORECAST_DAYS, today=None):
+    """Fit every active product on the last ``days`` full days; returns the number forecast."""
+    end = today or date.today()
+    start = end - timedelta(days=days)
+    prices = pool.run(fetch_active_prices)
+    usage = pool.run(fetch_daily_usage, start, end)
+    result = forecast(prices[:, 0], prices[:, 1], usage, days)
+    with pool.transaction() as conn:
+        save_forecasts(conn, prices[:, 0], result)
+    return len(prices)
+
+
+class ForecastSignals(QObject):
+    finished = pyqtSignal(int, float)  # products forecast, seconds taken
+    failed = pyqtSignal(str)
+
+
+class ForecastTask(QRunnable):
+    """Runs recompute_forecasts on a worker thread."""
+
+    def __init__(self, pool, days=FORECAST_DAYS):
+        super().__init__()
+        self.pool = pool
+        self.days = days
+        self.signals = ForecastSignals()
+
+    @pyqtSlot()
+    def run(self):
+        started = time.perf_counter()
+        try:
+            count = recompute_forecasts(self.pool, self.days)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(count, time.perf_counter() - started)
@@ -4,7 +4,11 @@ from PyQt6.QtGui import *
 from PyQt6.QtCore import Qt
 from Staff import *
 from Admin import *
-import pymysql
+from Database import ConnectionPool
+from Migrations import migrate
+from Changes import prune_changes
+from Audit import close_audit_writers
+from Reference import login_role
 
 class ButtonGroupManager:
     def __init__(self):
@@ -64,9 +68,9 @@ class CustomButton(QPushButton):
 # Login Widget
 # ---------------------------
 class LoginWidget(QWidget):
-    def __init__(self, conn):
+    def __init__(self, pool):
         super().__init__()
-        self.conn = conn
+        self.pool = pool
         self.setWindowTitle("CompForge")
         self.setWindowIcon(QIcon("images/compforgelogobgremoved.png"))
         self.setGeometry(540, 200, 350, 400)
@@ -121,24 +125,16 @@ class LoginWidget(QWidget):
         password = self.password_input.text()
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT role FROM accounts WHERE username=%s AND password=%s",
-                (username, password)
-            )
-            result = cursor.fetchone()
-            print("Query result:", result)
-
-            cursor.close()
-
-            if result:
-                role = result[0]
+            role = self.pool.run(login_role, username, password)
+            print("Query result:", role)
+
+            if role:
                 if role == "Admin":
-                    self.admin_dashboard = AdminDashboard(self, username, self.conn)
+                    self.admin_dashboard = AdminDashboard(self, username, self.pool)
                     self.admin_dashboard.show()
                     self.setVisible(False)
                 elif role == "Staff":
-                    self.staff_dashboard = StaffDashboard(self, username, self.conn)
+                    self.staff_dashboard = StaffDashboard(self, username, self.pool)
                     self.staff_dashboard.show()
                     self.setVisible(False)
             else:
@@ -161,19 +157,17 @@ class LoginWidget(QWidget):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     print("Connecting...")
-    conn = pymysql.connect(
-        host="localhost",
-        port=3306,
-        user="root",
-        password="",
-        database="ims"
-    )
+    pool = ConnectionPool()
+    pool.run(migrate)
+    pool.run(prune_changes)
     print("Connected!")
 
-    login = LoginWidget(conn)
+    login = LoginWidget(pool)
     login.show()
     exit_code = app.exec()
 
-    conn.close()
+    # Write out audit entries still buffered before the connections go
+    close_audit_writers()
+    pool.close()
 
     sys.exit(exit_code)
@@ -0,0 +1,240 @@
+import csv
+import os
+from datetime import date, datetime
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+import Summary
+from Changes import PRODUCT, SUPPLIER, RELOAD, record_change
+
+# Rows sent per executemany; pymysql folds each chunk into one multi-row INSERT.
+IMPORT_CHUNK = 5000
+
+# File header (lower-cased, spaces and underscores removed) -> product field
+IMPORT_HEADERS = {
+    "productname": "name", "name": "name",
+    "type": "type", "typename": "type",
+    "supplier": "supplier", "suppliername": "supplier",
+    "price": "price",
+    "quantity": "quantity", "qty": "quantity", "stock": "quantity",
+    "reorderlevel": "reorder", "reorder": "reorder",
+    "datesupplied": "date", "date": "date",
+}
+REQUIRED_FIELDS = ["name", "type", "supplier", "price", "quantity", "reorder"]
+
+# Accepted spellings of DateSupplied text; spreadsheet date cells arrive as datetimes.
+DATE_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"]
+
+PRODUCT_INSERT = """
+    INSERT INTO products (ProductName, TypeID, SupplierID, Price, Quantity, Total, ReorderLevel, DateSupplied)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+class ImportFailed(Exception):
+    pass
+
+
+class ImportCancelled(Exception):
+    pass
+
+
+# ---------------------------
+# File readers
+# ---------------------------
+# Both readers are generators over plain value tuples, header row first, so
+# a file of any size is parsed one row at a time.
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        yield from csv.reader(f)
+
+
+def read_xlsx(path):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFailed("Reading .xlsx files needs openpyxl (pip install openpyxl).")
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def read_rows(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".xlsx", ".xlsm"):
+        return read_xlsx(path)
+    if extension in (".csv", ".txt"):
+        return read_csv(path)
+    raise ImportFailed(f"Unsupported file type {extension!r}; use .csv or .xlsx.")
+
+
+# ---------------------------
+# Import pipeline
+# ---------------------------
+def _field_positions(header):
+    positions = {}
+    for position, title in enumerate(header):
+        key = str(title or "").lower().replace(" ", "").replace("_", "")
+        field = IMPORT_HEADERS.get(key)
+        if field and field not in positions:
+            positions[field] = position
+    missing = [field for field in REQUIRED_FIELDS if field not in positions]
+    if missing:
+        raise ImportFailed(f"Missing columns: {', '.join(missing)}.")
+    return positions
+
+
+def _whole_number(value, column, line):
+    try:
+        number = float(str(value).replace(",", "").strip())
+    except ValueError:
+        raise ImportFailed(f"Line {line}: {column} must be a number, got {value!r}.")
+    if not number.is_integer() or number < 0:
+        raise ImportFailed(f"Line {line}: {column} must be a whole number of at least 0, got {value!r}.")
+    return int(number)
+
+
+def _date_supplied(value, line):
+    """DateSupplied as a DATETIME string, or None when the cell is blank."""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d 00:00:00")
+    text = str(value or "").strip()
+    if not text:
+        return None
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+    raise ImportFailed(f"Line {line}: Date Supplied must be a date like 2025-10-06 or 2025-10-06 14:30, "
+                       f"got {value!r}.")
+
+
+def _load_lookups(cursor):
+    # Keyed by case-folded name so "pc hub" and "PC Hub " resolve to the same supplier
+    cursor.execute("SELECT TypeID, TypeName FROM type")
+    types = {str(name).strip().casefold(): type_id for type_id, name in cursor.fetchall()}
+    cursor.execute("SELECT SupplierID, SupplierName FROM suppliers")
+    suppliers = {str(name).strip().casefold(): supplier_id for supplier_id, name in cursor.fetchall()}
+    return types, suppliers
+
+
+def import_products(conn, rows, chunk_size=IMPORT_CHUNK, progress=None, cancelled=None):
+    """Insert products from ``rows`` (header row first) and return the number imported.
+
+    Types and suppliers are resolved through maps loaded once up front;
+    unknown suppliers are created, unknown types are an error because a type
+    needs a category. Call inside pool.transaction(): any bad row raises
+    ImportFailed and nothing from the file is kept. ``progress(count)`` is
+    called after every chunk and the import stops with ImportCancelled as
+    soon as ``cancelled()`` returns True.
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        raise ImportFailed("The file is empty.")
+    positions = _field_positions(header)
+    date_position = positions.get("date")
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    imported = 0
+    type_counts = {}
+    batch = []
+    with conn.cursor() as cursor:
+        types, suppliers = _load_lookups(cursor)
+
+        for line, row in enumerate(rows, start=2):
+            if not row or all(value in (None, "") for value in row):
+                continue
+            try:
+                name = str(row[positions["name"]] or "").strip()
+                type_name = str(row[positions["type"]] or "").strip()
+                supplier_name = str(row[positions["supplier"]] or "").strip()
+                price = row[positions["price"]]
+                quantity = row[positions["quantity"]]
+                reorder = row[positions["reorder"]]
+                date_supplied = row[date_position] if date_position is not None else None
+            except IndexError:
+                raise ImportFailed(f"Line {line}: expected {len(header)} columns, got {len(row)}.")
+            if not name or not type_name or not supplier_name:
+                raise ImportFailed(f"Line {line}: product name, type and supplier are required.")
+
+            type_id = types.get(type_name.casefold())
+            if type_id is None:
+                raise ImportFailed(f"Line {line}: unknown type {type_name!r}.")
+            supplier_id = suppliers.get(supplier_name.casefold())
+            if supplier_id is None:
+                cursor.execute("INSERT INTO suppliers (SupplierName) VALUES (%s)", (supplier_name,))
+                supplier_id = suppliers[supplier_name.casefold()] = cursor.lastrowid
+                record_change(cursor, SUPPLIER, supplier_id)
+
+            price = _whole_number(price, "Price", line)
+            quantity = _whole_number(quantity, "Quantity", line)
+            reorder = _whole_number(reorder, "Reorder Level", line)
+            date_supplied = _date_supplied(date_supplied, line)
+            batch.append((name, type_id, supplier_id, price, quantity, price * quantity, reorder,
+                          date_supplied or now))
+            type_counts[type_id] = type_counts.get(type_id, 0) + 1
+
+            if len(batch) >= chunk_size:
+                imported += _flush(cursor, batch, cancelled)
+                if progress:
+                    progress(imported)
+
+        imported += _flush(cursor, batch, cancelled)
+        if imported:
+            Summary.products_added(cursor, type_counts)
+            # Too many rows to list one by one; open windows reload instead
+            record_change(cursor, PRODUCT, 0, RELOAD)
+    if progress:
+        progress(imported)
+    return imported
+
+
+def _flush(cursor, batch, cancelled):
+    if cancelled and cancelled():
+        raise ImportCancelled("Import cancelled.")
+    if not batch:
+        return 0
+    cursor.executemany(PRODUCT_INSERT, batch)
+    count = len(batch)
+    batch.clear()
+    return count
+
+
+# ---------------------------
+# Background import
+# ---------------------------
+class ImportSignals(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+
+class ImportTask(QRunnable):
+    """Runs import_products for one file on a worker thread in one transaction."""
+
+    def __init__(self, pool, path, chunk_size=IMPORT_CHUNK):
+        super().__init__()
+        self.pool = pool
+        self.path = path
+        self.chunk_size = chunk_size
+        self.signals = ImportSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            with self.pool.transaction() as conn:
+                count = import_products(conn, read_rows(self.path), self.chunk_size,
+                                        progress=self.signals.progress.emit,
+                                        cancelled=lambda: self._cancelled)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(count)
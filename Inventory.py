@@ -0,0 +1,82 @@
+import pymysql.cursors
+
+# Rows fetched per keyset page when a product view scrolls to its end.
+PAGE_SIZE = 500
+
+# ---------------------------
+# Product SELECTs
+# ---------------------------
+# Column order matches INVENTORY_COLUMNS / STOCK_COLUMNS in Models.py. Both
+# leave out retired products (see Archive.py) and are completed with
+# "AND ..." conditions by the callers. The inventory rows end with the
+# recommendations of the last forecast run (Forecast.py), NULL until then.
+INVENTORY_SELECT = """
+    SELECT p.ProductID,
+           p.ProductName,
+           t.TypeName,
+           s.SupplierName,
+           p.Price,
+           p.Quantity,
+           p.Total,
+           p.ReorderLevel,
+           p.DateSupplied,
+           ROUND(f.DailyUsage, 2) AS DailyUsage,
+           f.ReorderPoint,
+           f.OrderQuantity
+    FROM products AS p
+             LEFT JOIN type AS t ON p.TypeID = t.TypeID
+             LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
+             LEFT JOIN product_forecast AS f ON p.ProductID = f.ProductID
+    WHERE p.RetiredAt IS NULL
+"""
+
+STOCK_SELECT = """
+    SELECT p.ProductID,
+           p.ProductName,
+           t.TypeName,
+           s.SupplierName,
+           p.Quantity,
+           p.Price,
+           p.ReorderLevel,
+           p.DateSupplied
+    FROM products AS p
+             LEFT JOIN type AS t ON p.TypeID = t.TypeID
+             LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
+    WHERE p.RetiredAt IS NULL
+"""
+
+
+def fetch_product_page(conn, select_sql, after_id=0, limit=PAGE_SIZE):
+    """Return the next ``limit`` products with ProductID greater than ``after_id``.
+
+    Seeking on the primary key keeps every page an index range scan, and the
+    unbuffered SSCursor streams the page instead of materialising it twice.
+    """
+    cursor = conn.cursor(pymysql.cursors.SSCursor)
+    try:
+        cursor.execute(select_sql + " AND p.ProductID > %s ORDER BY p.ProductID LIMIT %s",
+                       (after_id, limit))
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def fetch_product(conn, product_id, select_sql=INVENTORY_SELECT):
+    """Return a single product row (or None) in the layout of ``select_sql``."""
+    cursor = conn.cursor()
+    cursor.execute(select_sql + " AND p.ProductID = %s", (product_id,))
+    row = cursor.fetchone()
+    cursor.close()
+    return row
+
+
+def fetch_products(conn, product_ids, select_sql=INVENTORY_SELECT):
+    """Return the rows of ``product_ids`` in the layout of ``select_sql``, in ProductID order."""
+    if not product_ids:
+        return []
+    placeholders = ", ".join(["%s"] * len(product_ids))
+    cursor = conn.cursor()
+    cursor.execute(select_sql + f" AND p.ProductID IN ({placeholders}) ORDER BY p.ProductID", list(product_ids))
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
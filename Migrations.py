@@ -0,0 +1,269 @@
+"""Versioned schema migrations and the query plan check.
+
+    python Migrations.py            # apply pending migrations to the configured database
+    python Migrations.py --check    # EXPLAIN the hot queries, exit 1 if any scans a whole table
+"""
+import argparse
+import sys
+from Database import connect
+from Summary import ensure_summary
+from Stock import ensure_ledger
+from Changes import ensure_changes
+from Audit import ensure_audit
+from Archive import ensure_archive
+from Alerts import ensure_reorder_gap
+from Forecast import ensure_forecast
+from Orders import ensure_orders
+
+MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        Version int(11) NOT NULL PRIMARY KEY,
+        Name varchar(100) NOT NULL,
+        AppliedAt datetime NOT NULL DEFAULT current_timestamp()
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+"""
+
+# ---------------------------
+# Hot query indexes
+# ---------------------------
+# table -> [(index name, columns)], each matched to the queries it serves:
+#   products  (RetiredAt, Quantity, ReorderLevel): top products read active
+#             products in Quantity order. The low stock alerts use the
+#             LowStock key on the generated ReorderGap (Alerts.py).
+#             (TypeID, RetiredAt, ProductName): the category panel lists the
+#             active products of one type by name. Name searches use
+#             "%keyword%" patterns that no B-tree can seek, and are served
+#             by the in-memory index in Search.py instead.
+#   accounts  UserName: handle_login.
+#   suppliers SupplierName: supplier lookups by name when saving a product.
+#   category / type: the reference cache reads them in name order.
+# stockout.ProductID and AccountID are the leading columns of the ledger
+# indexes added by Stock.ensure_ledger, which the reports already use.
+HOT_INDEXES = {
+    "products": [
+        ("Stock", "RetiredAt, Quantity, ReorderLevel"),
+        ("TypeID_Name", "TypeID, RetiredAt, ProductName"),
+    ],
+    "accounts": [("UserName", "UserName")],
+    "suppliers": [("SupplierName", "SupplierName")],
+    "category": [("CategoryName", "CategoryName")],
+    "type": [("TypeName", "TypeName")],
+}
+
+
+def add_hot_indexes(conn):
+    with conn.cursor() as cursor:
+        for table, indexes in HOT_INDEXES.items():
+            cursor.execute("""
+                SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+            """, (table,))
+            existing = {name for name, in cursor.fetchall()}
+            missing = [f"ADD KEY {name} ({columns})" for name, columns in indexes if name not in existing]
+            if missing:
+                cursor.execute(f"ALTER TABLE {table} " + ", ".join(missing))
+
+
+# ---------------------------
+# Migrations
+# ---------------------------
+# (version, name, step). Steps check the current schema before changing it,
+# so a database upgraded by an earlier release, or a step interrupted
+# halfway (MySQL commits DDL statement by statement), is simply finished
+# and recorded. Append new steps; never renumber or edit applied ones.
+MIGRATIONS = [
+    (1, "Stock ledger MovedAt and indexes", ensure_ledger),
+    (2, "Change feed", ensure_changes),
+    (3, "Audit log indexes", ensure_audit),
+    (4, "Product retirement and ledger archives", ensure_archive),
+    # After 4: the first fill counts active products and archived stock-outs
+    (5, "Dashboard summary counters", ensure_summary),
+    (6, "Hot query indexes", add_hot_indexes),
+    (7, "Low stock reorder gap", ensure_reorder_gap),
+    (8, "Demand forecasts", ensure_forecast),
+    (9, "Purchase orders", ensure_orders),
+]
+
+
+def applied_versions(conn):
+    with conn.cursor() as cursor:
+        cursor.execute(MIGRATIONS_TABLE)
+        cursor.execute("SELECT Version FROM schema_migrations")
+        return {version for version, in cursor.fetchall()}
+
+
+def migrate(conn):
+    """Apply every migration not yet recorded, in order; returns the versions applied."""
+    applied = applied_versions(conn)
+    done = []
+    for version, name, step in MIGRATIONS:
+        if version in applied:
+            continue
+        print(f"Migrating to {version}: {name}")
+        step(conn)
+        with conn.cursor() as cursor:
+            cursor.execute("INSERT INTO schema_migrations (Version, Name) VALUES (%s, %s)", (version, name))
+        done.append(version)
+    return done
+
+
+# ---------------------------
+# Query plan check
+# ---------------------------
+class _RecordingCursor:
+    """Stands in for a cursor and keeps the statements instead of running them."""
+
+    def __init__(self, statements):
+        self.statements = statements
+        self.rowcount = 0
+        self.lastrowid = None
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, params))
+        return 0
+
+    def executemany(self, sql, seq):
+        return 0
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self):
+        return []
+
+    def fetchmany(self, size=None):
+        return []
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class _RecordingConnection:
+    def __init__(self):
+        self.statements = []
+
+    def cursor(self, cursor_class=None):
+        return _RecordingCursor(self.statements)
+
+
+def captured_queries(fetch, *args):
+    """The SELECTs ``fetch(conn, *args)`` sends, captured without a database.
+
+    The function sees empty results, so it may fail after its queries are
+    sent; only the statements matter here. An error raised before anything
+    was sent means the call itself is wrong, and is passed on.
+    """
+    conn = _RecordingConnection()
+    try:
+        fetch(conn, *args)
+    except Exception:
+        if not conn.statements:
+            raise
+    return [(sql, params) for sql, params in conn.statements if sql.lstrip().upper().startswith("SELECT")]
+
+
+def hot_queries():
+    """(name, query function, args, tables allowed to scan) for every hot path.
+
+    The functions are the ones the panels call, so the check follows the
+    queries as they change. Tiny lookup tables may be scanned.
+    """
+    from Inventory import INVENTORY_SELECT, STOCK_SELECT, PAGE_SIZE, fetch_product, fetch_product_page
+    from Reference import login_role
+    from Reports import count_report, fetch_report_page
+    from Audit import count_audit, fetch_audit_page
+    from Dashboard import DASHBOARD_QUERIES
+    from Alerts import fetch_low_stock, fetch_stock_levels
+    from Orders import count_orders, fetch_order_lines, fetch_order_page
+
+    report_filters = [
+        {},
+        {"product": "1"},
+        {"account_id": 1},
+        {"start": "2025-01-01", "end": "2025-02-01"},
+    ]
+    queries = [
+        ("load_products", fetch_product_page, (INVENTORY_SELECT, 0, PAGE_SIZE), ()),
+        ("stock panel", fetch_product_page, (STOCK_SELECT, 0, PAGE_SIZE), ()),
+        ("product row", fetch_product, (1,), ()),
+        ("handle_login", login_role, ("admin", "password"), ()),
+        ("low stock alerts", fetch_low_stock, (), ("t",)),
+        ("changed stock levels", fetch_stock_levels, ([1, 2, 3],), ("t",)),
+    ]
+    queries += [(f"dashboard {name}", fetch, (), ("c", "cs", "t", "category"))
+                for name, fetch in DASHBOARD_QUERIES.items()]
+    for ledger in ("stockin", "stockout"):
+        for filters in report_filters:
+            queries.append((f"load_reports_data {ledger} {filters}", fetch_report_page, (ledger, filters), ()))
+            queries.append((f"count {ledger} {filters}", count_report, (ledger, filters), ()))
+    for filters in [{}, {"product_id": 1}, {"account_id": 1}]:
+        queries.append((f"audit {filters}", fetch_audit_page, (filters,), ()))
+        queries.append((f"audit count {filters}", count_audit, (filters,), ()))
+    for filters in [{}, {"supplier_id": 1}, {"overdue": True}]:
+        queries.append((f"orders {filters}", fetch_order_page, (filters,), ()))
+        queries.append((f"orders count {filters}", count_orders, (filters,), ()))
+    queries.append(("order lines", fetch_order_lines, (1,), ()))
+    return queries
+
+
+def check_plans(conn, queries=None):
+    """EXPLAIN every hot query; returns a list of problems found (empty when all is well).
+
+    A problem is a full scan, or a hot query that could not be captured.
+
+    Run against a database of realistic size: on a few dozen rows the
+    optimizer rightly prefers scanning to seeking.
+    """
+    problems = []
+    with conn.cursor() as cursor:
+        for name, fetch, args, allowed in queries or hot_queries():
+            # A hot path that sends nothing checkable counts as a problem, so
+            # drift in a query function cannot turn into "Plans OK."
+            try:
+                statements = captured_queries(fetch, *args)
+            except Exception as e:
+                problems.append(f"{name}: could not capture its queries ({type(e).__name__}: {e})")
+                continue
+            if not statements:
+                problems.append(f"{name}: no SELECT captured")
+                continue
+            for sql, params in statements:
+                cursor.execute("EXPLAIN " + sql, params)
+                columns = [column[0].lower() for column in cursor.description]
+                for row in cursor.fetchall():
+                    plan = dict(zip(columns, row))
+                    table = plan.get("table") or ""
+                    if plan.get("type") == "ALL" and table not in allowed and not table.startswith("<"):
+                        problems.append(f"{name}: full scan of {table} ({plan.get('rows')} rows)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="check the hot query plans instead of migrating")
+    options = parser.parse_args()
+
+    conn = connect()
+    conn.autocommit(True)
+    try:
+        if options.check:
+            problems = check_plans(conn)
+            for problem in problems:
+                print(problem)
+            print("Plans OK." if not problems else f"{len(problems)} plan problems.")
+            return 1 if problems else 0
+        applied = migrate(conn)
+        print(f"Applied {len(applied)} migrations." if applied else "Schema is up to date.")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+from array import array
+from bisect import bisect_left
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from Inventory import PAGE_SIZE
+
+
+# ---------------------------
+# Column layouts
+# ---------------------------
+# Each entry is (header, kind). Integer columns are packed into array('q')
+# buffers, everything else is kept in a plain list. NULLs show as blank cells.
+INVENTORY_COLUMNS = [
+    ("Product ID", int), ("Product Name", str), ("Type", str), ("Supplier", str),
+    ("Price", int), ("Stock", int), ("Total", int), ("Reorder Level", int), ("Date Supplied", str),
+    ("Daily Use", float), ("Reorder Point", int), ("Order Qty", int),
+]
+
+STOCK_COLUMNS = [
+    ("ProductID", int), ("ProductName", str), ("Type", str), ("Supplier", str),
+    ("Quantity", int), ("Price", int), ("Reorder Level", int), ("Date Supplied", str),
+]
+
+CATEGORY_PRODUCT_COLUMNS = [
+    ("ProductID", int), ("ProductName", str), ("Price", int), ("Quantity", int), ("ReorderLevel", int),
+]
+
+
+def _column_buffer(kind, values):
+    if kind is int:
+        try:
+            return array("q", values)
+        except TypeError:
+            # NULLs or non-integer values (e.g. a DECIMAL price) fall back to a list
+            return list(values)
+    return list(values)
+
+
+def _display(value):
+    return "" if value is None else str(value)
+
+
+class ProductTableModel(QAbstractTableModel):
+    """Read-only table model that keeps fetched rows in per-column buffers.
+
+    Cells are only turned into display strings when the view asks for them,
+    so the cost of painting depends on the visible rows, not on catalog size.
+
+    When ``page_source`` is given (a callable taking ``(after_id, limit)``),
+    rows are pulled in keyset pages on column 0 as the view scrolls, through
+    Qt's canFetchMore/fetchMore protocol.
+
+    After a write, ``upsert_row`` and ``remove_key`` patch the affected row
+    in place, keyed on column 0, instead of reloading the whole model.
+    """
+
+    def __init__(self, columns, parent=None, page_source=None, page_size=PAGE_SIZE):
+        super().__init__(parent)
+        self.headers = [header for header, _ in columns]
+        self.kinds = [kind for _, kind in columns]
+        self.page_source = page_source
+        self.page_size = page_size
+        self._columns = [_column_buffer(kind, []) for kind in self.kinds]
+        self._row_count = 0
+        self._exhausted = True
+        self._positions = None  # column 0 value -> row, built on first lookup
+
+    # ---------------------------
+    # Qt model interface
+    # ---------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return _display(self._columns[index.column()][index.row()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.page_source is not None and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        after_id = self._columns[0][-1] if self._row_count else 0
+        try:
+            rows = self.page_source(after_id, self.page_size)
+        except Exception as e:
+            # An exception escaping a Qt virtual aborts the app, stop paging instead
+            print("Error:", e)
+            self._exhausted = True
+            return
+        self._exhausted = len(rows) < self.page_size
+        self.append_rows(rows)
+
+    # ---------------------------
+    # Buffer helpers
+    # ---------------------------
+    def set_rows(self, rows):
+        """Replace the model contents with ``rows`` (a sequence of tuples)."""
+        self.beginResetModel()
+        columns = list(zip(*rows)) if rows else [()] * len(self.kinds)
+        self._columns = [_column_buffer(kind, values) for kind, values in zip(self.kinds, columns)]
+        self._row_count = len(rows)
+        self._exhausted = True
+        self._positions = None
+        self.endResetModel()
+
+    def reload(self):
+        """Drop the buffered rows and fetch the first page from ``page_source``."""
+        self.clear()
+        self._exhausted = False
+        self.fetchMore()
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for index, values in enumerate(zip(*rows)):
+            column = self._columns[index]
+            chunk = _column_buffer(self.kinds[index], values)
+            if isinstance(column, array) and not isinstance(chunk, array):
+                self._columns[index] = column = list(column)
+            column.extend(chunk)
+        if self._positions is not None:
+            self._positions.update((row[0], first + offset) for offset, row in enumerate(rows))
+        self._row_count += len(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.set_rows([])
+
+    def value(self, row, column):
+        return self._columns[column][row]
+
+    def text(self, row, column):
+        return _display(self._columns[column][row])
+
+    def row_values(self, row):
+        return tuple(column[row] for column in self._columns)
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column in self._columns:
+            del column[row]
+        self._row_count -= 1
+        self._positions = None
+        self.endRemoveRows()
+
+    # ---------------------------
+    # In-place patches
+    # ---------------------------
+    def row_of(self, key):
+        """Row holding ``key`` in column 0, or None."""
+        if self._positions is None:
+            self._positions = {key: row for row, key in enumerate(self._columns[0])}
+        return self._positions.get(key)
+
+    def upsert_row(self, values, insert=True):
+        """Replace the row whose column 0 equals ``values[0]``, or add it.
+
+        A missing row is only added when ``insert`` is true and its keyset
+        position is already loaded; rows further on arrive with the next
+        page anyway. Pass ``insert=False`` while the model shows filtered
+        rows (e.g. search results) that ``values`` may not belong to.
+        """
+        row = self.row_of(values[0])
+        if row is not None:
+            for index, value in enumerate(values):
+                column = self._columns[index]
+                if isinstance(column, array) and not isinstance(value, int):
+                    self._columns[index] = column = list(column)
+                column[row] = value
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1))
+            return
+        if not insert:
+            return
+        position = bisect_left(self._columns[0], values[0])
+        if position == self._row_count and not self._exhausted:
+            return
+        self.beginInsertRows(QModelIndex(), position, position)
+        for index, value in enumerate(values):
+            column = self._columns[index]
+            if isinstance(column, array) and not isinstance(value, int):
+                self._columns[index] = column = list(column)
+            column.insert(position, value)
+        self._row_count += 1
+        if position == self._row_count - 1 and self._positions is not None:
+            self._positions[values[0]] = position
+        else:
+            self._positions = None
+        self.endInsertRows()
+
+    def remove_key(self, key):
+        row = self.row_of(key)
+        if row is not None:
+            self.remove_row(row)
@@ -0,0 +1,214 @@
+from datetime import date, datetime
+import Stock
+from Inventory import PAGE_SIZE
+
+# Order states; only pending orders can be received or cancelled.
+PENDING, DELIVERED, CANCELLED = "Pending", "Delivered", "Cancelled"
+
+
+class OrderError(Exception):
+    pass
+
+
+# ---------------------------
+# Schema
+# ---------------------------
+# A purchase order is a header per supplier delivery and one line per
+# product. InnoDB appends the primary key to every secondary index, so
+# Status is really (Status, OrderID): the open-orders view pages through
+# pending orders in OrderID order without sorting, and (SupplierID, Status)
+# does the same for one supplier. (Status, ExpectedDate) finds the overdue
+# ones.
+ORDER_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS purchase_orders (
+        OrderID int(11) NOT NULL AUTO_INCREMENT PRIMARY KEY,
+        SupplierID int(11) NOT NULL,
+        AccountID int(11) NOT NULL,
+        Status varchar(20) NOT NULL DEFAULT 'Pending',
+        OrderDate datetime NOT NULL DEFAULT current_timestamp(),
+        ExpectedDate date NOT NULL,
+        ReceivedAt datetime DEFAULT NULL,
+        KEY Status (Status),
+        KEY Supplier_Status (SupplierID, Status),
+        KEY Status_Expected (Status, ExpectedDate)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS purchase_order_lines (
+        OrderID int(11) NOT NULL,
+        ProductID int(11) NOT NULL,
+        Quantity int(11) NOT NULL,
+        PRIMARY KEY (OrderID, ProductID),
+        KEY ProductID (ProductID)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+    """,
+]
+
+
+def ensure_orders(conn):
+    with conn.cursor() as cursor:
+        for ddl in ORDER_TABLES:
+            cursor.execute(ddl)
+
+
+# ---------------------------
+# Order lifecycle
+# ---------------------------
+# Call these inside pool.transaction().
+def create_order(conn, supplier_id, account_id, expected_date, lines):
+    """Record a pending order for the (product_id, quantity) ``lines``; returns its OrderID.
+
+    Repeated products are merged into one line. Raises OrderError if a
+    product no longer exists or has been retired.
+    """
+    try:
+        totals = Stock.batch_totals(lines)
+    except Stock.StockError as e:
+        raise OrderError(str(e))
+    if not totals:
+        raise OrderError("The order has no lines.")
+    placeholders = ", ".join(["%s"] * len(totals))
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT ProductID FROM products WHERE ProductID IN ({placeholders}) AND RetiredAt IS NULL",
+                       list(totals))
+        found = {product_id for product_id, in cursor.fetchall()}
+        missing = [str(product_id) for product_id in totals if product_id not in found]
+        if missing:
+            raise OrderError(f"Products no longer exist or have been retired: {', '.join(missing)}.")
+        cursor.execute("""
+            INSERT INTO purchase_orders (SupplierID, AccountID, Status, ExpectedDate)
+            VALUES (%s, %s, %s, %s)
+        """, (supplier_id, account_id, PENDING, expected_date))
+        order_id = cursor.lastrowid
+        cursor.executemany("INSERT INTO purchase_order_lines (OrderID, ProductID, Quantity) VALUES (%s, %s, %s)",
+                           [(order_id, product_id, quantity) for product_id, quantity in totals.items()])
+    return order_id
+
+
+def _lock_pending(cursor, order_id):
+    cursor.execute("SELECT Status FROM purchase_orders WHERE OrderID = %s FOR UPDATE", (order_id,))
+    row = cursor.fetchone()
+    if row is None:
+        raise OrderError(f"Order {order_id} not found.")
+    if row[0] != PENDING:
+        raise OrderError(f"Order {order_id} is already {row[0].lower()}.")
+
+
+def receive_order(conn, order_id, account_id):
+    """Post every line of a pending order as stock ins and mark it delivered.
+
+    The lines go through Stock.stock_in_batch, so the whole delivery is one
+    UPDATE ... JOIN and one ledger insert, committed together with the
+    status change. Returns {product_id: new quantity}.
+    """
+    with conn.cursor() as cursor:
+        _lock_pending(cursor, order_id)
+        cursor.execute("SELECT ProductID, Quantity FROM purchase_order_lines WHERE OrderID = %s", (order_id,))
+        lines = cursor.fetchall()
+    try:
+        balances = Stock.stock_in_batch(conn, account_id, lines)
+    except Stock.StockError as e:
+        raise OrderError(str(e))
+    with conn.cursor() as cursor:
+        cursor.execute("UPDATE purchase_orders SET Status = %s, ReceivedAt = NOW() WHERE OrderID = %s",
+                       (DELIVERED, order_id))
+    return balances
+
+
+def cancel_order(conn, order_id):
+    with conn.cursor() as cursor:
+        _lock_pending(cursor, order_id)
+        cursor.execute("UPDATE purchase_orders SET Status = %s WHERE OrderID = %s", (CANCELLED, order_id))
+
+
+# ---------------------------
+# Order queries
+# ---------------------------
+# ``filters`` is a dict with any of: "status" (default: pending),
+# "supplier_id" and "overdue" (expected before today). Pages run oldest
+# order first and seek past the last OrderID shown.
+ORDER_SELECT = """
+    SELECT o.OrderID,
+           s.SupplierName,
+           o.OrderDate,
+           o.ExpectedDate,
+           (SELECT COUNT(*) FROM purchase_order_lines l WHERE l.OrderID = o.OrderID)         AS Items,
+           (SELECT IFNULL(SUM(l.Quantity), 0) FROM purchase_order_lines l WHERE l.OrderID = o.OrderID) AS Units,
+           o.AccountID,
+           o.Status
+    FROM purchase_orders o
+             LEFT JOIN suppliers s ON o.SupplierID = s.SupplierID
+"""
+
+ORDER_COLUMNS = [
+    ("Order ID", int), ("Supplier", str), ("Ordered", datetime), ("Expected", date), ("Items", int),
+    ("Units", int), ("Ordered By", str), ("Status", str),
+]
+# Position of AccountID in the order rows, for Reports.name_accounts
+ORDER_ACCOUNT_COLUMN = 6
+
+ORDER_LINE_SELECT = """
+    SELECT l.ProductID, p.ProductName, l.Quantity
+    FROM purchase_order_lines l
+             LEFT JOIN products p ON l.ProductID = p.ProductID
+    WHERE l.OrderID = %s
+    ORDER BY l.ProductID
+"""
+
+
+def _order_where(filters):
+    conditions = ["o.Status = %s"]
+    params = [filters.get("status") or PENDING]
+    if filters.get("supplier_id"):
+        conditions.append("o.SupplierID = %s")
+        params.append(filters["supplier_id"])
+    if filters.get("overdue"):
+        conditions.append("o.ExpectedDate < CURDATE()")
+    return conditions, params
+
+
+def fetch_order_page(conn, filters, after_id=0, limit=PAGE_SIZE):
+    """Return up to ``limit`` orders with OrderID greater than ``after_id``."""
+    conditions, params = _order_where(filters)
+    conditions.append("o.OrderID > %s")
+    params.append(after_id)
+    with conn.cursor() as cursor:
+        cursor.execute(f"{ORDER_SELECT} WHERE {' AND '.join(conditions)} ORDER BY o.OrderID LIMIT %s",
+                       params + [limit])
+        return cursor.fetchall()
+
+
+def count_orders(conn, filters):
+    conditions, params = _order_where(filters)
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM purchase_orders o WHERE {' AND '.join(conditions)}", params)
+        return cursor.fetchone()[0]
+
+
+def fetch_order_lines(conn, order_id):
+    """(ProductID, ProductName, Quantity) of every line of ``order_id``."""
+    with conn.cursor() as cursor:
+        cursor.execute(ORDER_LINE_SELECT, (order_id,))
+        return cursor.fetchall()
+
+
+def fetch_reorder_suggestions(conn, supplier_id):
+    """(ProductID, ProductName, OrderQuantity) for the supplier's products at their forecast reorder point.
+
+    Products already on a pending order are left out.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT p.ProductID, p.ProductName, f.OrderQuantity
+            FROM products p
+                     JOIN product_forecast f ON p.ProductID = f.ProductID
+            WHERE p.SupplierID = %s AND p.RetiredAt IS NULL
+              AND p.Quantity <= f.ReorderPoint AND f.OrderQuantity > 0
+              AND NOT EXISTS (SELECT 1
+                              FROM purchase_order_lines l
+                                       JOIN purchase_orders o ON l.OrderID = o.OrderID
+                              WHERE l.ProductID = p.ProductID AND o.Status = %s)
+            ORDER BY p.ProductID
+        """, (supplier_id, PENDING))
+        return cursor.fetchall()
@@ -0,0 +1,409 @@
+from PyQt6.QtWidgets import (QWidget, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox,
+                             QCheckBox, QDateEdit, QTableView, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QAbstractItemView, QMessageBox)
+from PyQt6.QtCore import QDate
+from Models import ProductTableModel, STOCK_COLUMNS
+from Inventory import fetch_product_page, STOCK_SELECT
+from Reports import name_accounts
+from Reference import reference_cache
+from Audit import audit_writer
+from StockBatch import BATCH_STYLE
+import Orders
+from Orders import (ORDER_ACCOUNT_COLUMN, ORDER_COLUMNS, PENDING, DELIVERED, CANCELLED, OrderError, count_orders,
+                    fetch_order_lines, fetch_order_page, fetch_reorder_suggestions)
+
+# Days ahead the expected date of a new order starts at.
+DEFAULT_LEAD_DAYS = 7
+
+ORDERS_STYLE = """
+    QLabel { color: white; }
+    QCheckBox { color: white; font-weight: bold; }
+    QComboBox { background-color: white; color: black; border-radius: 6px; padding: 2px; }
+    QPushButton {
+        background-color: rgb(50,150,200);
+        color: white;
+        font-weight: bold;
+        border-radius: 8px;
+        padding: 6px;
+    }
+    QPushButton:hover { background-color: rgb(70,170,220); }
+    QTableView, QTableWidget {
+        color: black;
+        background-color: #f8f9fa;
+        alternate-background-color: #e9ecef;
+        gridline-color: #b0b0b0;
+        border-radius: 10px;
+        font-size: 13px;
+        selection-background-color: rgb(70,130,250);
+        selection-color: white;
+    }
+    QHeaderView::section {
+        background-color: rgb(50,150,200);
+        color: white;
+        font-weight: bold;
+        border: none;
+        padding: 6px;
+    }
+    QMessageBox {
+        background-color: rgb(40,40,40);
+        color: white;
+        font-size: 14px;
+    }
+    QMessageBox QLabel {
+        color: white;
+    }
+"""
+
+
+class OrdersPanel(QWidget):
+    """Purchase orders, pending ones by default, read in keyset pages as the table scrolls.
+
+    Receiving an order posts all of its lines as stock ins; the inventory
+    views pick the new quantities up from the change feed.
+    """
+
+    def __init__(self, pool, account_id, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.account_id = account_id
+        self.refs = reference_cache(pool)
+        self.audit = audit_writer(pool)
+        self.filters = {}
+        self.setGeometry(10, 10, 1140, 500)
+        self.setStyleSheet("background-color: rgb(100, 100, 100); border-radius: 10px;" + ORDERS_STYLE)
+
+        layout = QVBoxLayout(self)
+
+        self.title = QLabel("Purchase Orders")
+        self.title.setStyleSheet("font-size: 22px; font-weight: bold;")
+        layout.addWidget(self.title)
+
+        # --- Filters ---
+        filter_row = QHBoxLayout()
+        self.status_combo = QComboBox()
+        for status in [PENDING, DELIVERED, CANCELLED]:
+            self.status_combo.addItem(status)
+        self.supplier_combo = QComboBox()
+        self.supplier_combo.setMinimumWidth(200)
+        self.overdue_check = QCheckBox("Overdue only")
+        apply_btn = QPushButton("Apply Filters")
+        apply_btn.clicked.connect(self.load_orders)
+        for widget in [QLabel("Status:"), self.status_combo, QLabel("Supplier:"), self.supplier_combo,
+                       self.overdue_check, apply_btn]:
+            filter_row.addWidget(widget)
+        filter_row.addStretch()
+        layout.addLayout(filter_row)
+
+        # --- Orders and the lines of the selected one ---
+        tables = QHBoxLayout()
+        self.table = QTableView()
+        self.model = ProductTableModel(
+            ORDER_COLUMNS, self,
+            page_source=lambda after_id, limit: name_accounts(
+                self.pool.run(fetch_order_page, self.filters, after_id, limit),
+                self.refs.account_names(), ORDER_ACCOUNT_COLUMN))
+        self.table.setModel(self.model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setStretchLastSection(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.selectionModel().currentRowChanged.connect(self.show_lines)
+        tables.addWidget(self.table, 3)
+
+        self.lines_table = QTableWidget(0, 3)
+        self.lines_table.setHorizontalHeaderLabels(["ProductID", "ProductName", "Quantity"])
+        self.lines_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.lines_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.lines_table.verticalHeader().setVisible(False)
+        tables.addWidget(self.lines_table, 2)
+        layout.addLayout(tables)
+
+        btn_layout = QHBoxLayout()
+        new_btn = QPushButton("New Order")
+        receive_btn = QPushButton("Receive")
+        cancel_btn = QPushButton("Cancel Order")
+        new_btn.clicked.connect(self.new_order)
+        receive_btn.clicked.connect(self.receive_order)
+        cancel_btn.clicked.connect(self.cancel_order)
+        for btn in [new_btn, receive_btn, cancel_btn]:
+            btn_layout.addWidget(btn)
+        btn_layout.addStretch()
+        layout.addLayout(btn_layout)
+
+        self.load_suppliers()
+        self.load_orders()
+
+    def load_suppliers(self):
+        self.supplier_combo.clear()
+        self.supplier_combo.addItem("All suppliers", None)
+        try:
+            suppliers = self.refs.suppliers()
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        for supplier_id, name in suppliers:
+            self.supplier_combo.addItem(name, supplier_id)
+
+    def load_orders(self):
+        filters = {
+            "status": self.status_combo.currentText(),
+            "supplier_id": self.supplier_combo.currentData(),
+            "overdue": self.overdue_check.isChecked(),
+        }
+        self.filters = filters
+        try:
+            count = self.pool.run(count_orders, filters)
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        self.title.setText(f"Purchase Orders: {filters['status']} ({count})")
+        self.model.reload()
+        self.lines_table.setRowCount(0)
+
+    def selected_order(self):
+        row = self.table.currentIndex().row()
+        if row == -1:
+            QMessageBox.warning(self, "Warning", "Select an order from the table first.")
+            return None
+        return self.model.value(row, 0)
+
+    def show_lines(self, current, previous=None):
+        self.lines_table.setRowCount(0)
+        if not current.isValid():
+            return
+        try:
+            lines = self.pool.run(fetch_order_lines, self.model.value(current.row(), 0))
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        self.lines_table.setRowCount(len(lines))
+        for line, values in enumerate(lines):
+            for column, value in enumerate(values):
+                self.lines_table.setItem(line, column, QTableWidgetItem("" if value is None else str(value)))
+
+    def new_order(self):
+        dialog = OrderDialog(self.pool, self.account_id, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.load_orders()
+
+    def receive_order(self):
+        order_id = self.selected_order()
+        if order_id is None:
+            return
+        confirm = QMessageBox.question(
+            self, "Receive Order", f"Post every line of order {order_id} as stock ins?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+        try:
+            with self.pool.transaction() as conn:
+                balances = Orders.receive_order(conn, order_id, self.account_id)
+                lines = fetch_order_lines(conn, order_id)
+        except OrderError as e:
+            QMessageBox.warning(self, "Order Error", str(e))
+            self.load_orders()
+            return
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+
+        for product_id, _, quantity in lines:
+            self.audit.log(self.account_id, product_id,
+                           f"Received order {order_id}: {quantity} in, {balances[product_id]} on hand")
+        QMessageBox.information(
+            self, "Success",
+            f"Order {order_id} received: {sum(line[2] for line in lines)} units across {len(lines)} products.")
+        self.load_orders()
+
+    def cancel_order(self):
+        order_id = self.selected_order()
+        if order_id is None:
+            return
+        confirm = QMessageBox.question(
+            self, "Cancel Order", f"Cancel order {order_id}? Its stock will not be received.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+        try:
+            with self.pool.transaction() as conn:
+                Orders.cancel_order(conn, order_id)
+        except OrderError as e:
+            QMessageBox.warning(self, "Order Error", str(e))
+            self.load_orders()
+            return
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        self.audit.log(self.account_id, None, f"Cancelled order {order_id}")
+        self.load_orders()
+
+
+class OrderDialog(QDialog):
+    """Pick a supplier, an expected date and product lines for a new purchase order.
+
+    "Add Suggested" fills in the supplier's products that are at their
+    forecast reorder point, with the forecast order quantity.
+    """
+
+    def __init__(self, pool, account_id, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.account_id = account_id
+        self.refs = reference_cache(pool)
+        self.order_id = None
+        self.lines = []
+
+        self.setWindowTitle("New Purchase Order")
+        self.setFixedSize(800, 650)
+        self.setStyleSheet(BATCH_STYLE + "QDateEdit { color: black; background-color: white; padding: 4px; }")
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+
+        header_row = QHBoxLayout()
+        header_row.addWidget(QLabel("Supplier:"))
+        self.supplier_combo = QComboBox()
+        try:
+            for supplier_id, name in self.refs.suppliers():
+                self.supplier_combo.addItem(name, supplier_id)
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+        header_row.addWidget(self.supplier_combo)
+        header_row.addWidget(QLabel("Expected:"))
+        self.expected_date = QDateEdit(QDate.currentDate().addDays(DEFAULT_LEAD_DAYS))
+        self.expected_date.setCalendarPopup(True)
+        self.expected_date.setDisplayFormat("yyyy-MM-dd")
+        header_row.addWidget(self.expected_date)
+        suggest_btn = QPushButton("Add Suggested")
+        suggest_btn.clicked.connect(self.add_suggested)
+        header_row.addWidget(suggest_btn)
+        header_row.addStretch()
+        layout.addLayout(header_row)
+
+        # === Product picker ===
+        self.table = QTableView()
+        self.model = ProductTableModel(
+            STOCK_COLUMNS, self,
+            page_source=lambda after_id, limit: self.pool.run(fetch_product_page, STOCK_SELECT, after_id, limit))
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setFixedHeight(250)
+        layout.addWidget(self.table)
+        self.model.reload()
+
+        add_row = QHBoxLayout()
+        add_row.addWidget(QLabel("Quantity:"))
+        self.qty_input = QLineEdit()
+        self.qty_input.setPlaceholderText("Quantity to order for the selected product")
+        self.qty_input.returnPressed.connect(self.add_line)
+        add_row.addWidget(self.qty_input)
+        add_btn = QPushButton("Add Line")
+        add_btn.clicked.connect(self.add_line)
+        add_row.addWidget(add_btn)
+        layout.addLayout(add_row)
+
+        # === Order lines ===
+        self.lines_table = QTableWidget(0, 3)
+        self.lines_table.setHorizontalHeaderLabels(["ProductID", "ProductName", "Quantity"])
+        self.lines_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.lines_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.lines_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.lines_table.verticalHeader().setVisible(False)
+        layout.addWidget(self.lines_table)
+
+        btn_layout = QHBoxLayout()
+        remove_btn = QPushButton("Remove Line")
+        place_btn = QPushButton("Place Order")
+        cancel_btn = QPushButton("Cancel")
+        btn_layout.addWidget(remove_btn)
+        btn_layout.addWidget(place_btn)
+        btn_layout.addWidget(cancel_btn)
+        remove_btn.clicked.connect(self.remove_line)
+        place_btn.clicked.connect(self.place_order)
+        cancel_btn.clicked.connect(self.reject)
+        layout.addLayout(btn_layout)
+
+    def _append_line(self, product_id, name, quantity):
+        self.lines.append((product_id, quantity))
+        line = self.lines_table.rowCount()
+        self.lines_table.insertRow(line)
+        for column, value in enumerate((product_id, name, quantity)):
+            self.lines_table.setItem(line, column, QTableWidgetItem(str(value)))
+
+    def add_line(self):
+        row = self.table.currentIndex().row()
+        if row == -1:
+            QMessageBox.warning(self, "Warning", "Select a product from the table first.")
+            return
+        try:
+            quantity = int(self.qty_input.text().strip())
+            if quantity <= 0:
+                raise ValueError
+        except ValueError:
+            QMessageBox.warning(self, "Input Error", "Quantity must be a positive integer.")
+            return
+        self._append_line(self.model.value(row, 0), self.model.text(row, 1), quantity)
+        self.qty_input.clear()
+
+    def add_suggested(self):
+        supplier_id = self.supplier_combo.currentData()
+        if supplier_id is None:
+            return
+        try:
+            suggestions = self.pool.run(fetch_reorder_suggestions, supplier_id)
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+        listed = {product_id for product_id, _ in self.lines}
+        suggestions = [row for row in suggestions if row[0] not in listed]
+        if not suggestions:
+            QMessageBox.information(self, "No Suggestions",
+                                    "None of this supplier's products are at their forecast reorder point.")
+            return
+        for product_id, name, quantity in suggestions:
+            self._append_line(product_id, name, quantity)
+
+    def remove_line(self):
+        line = self.lines_table.currentRow()
+        if line == -1:
+            return
+        del self.lines[line]
+        self.lines_table.removeRow(line)
+
+    def place_order(self):
+        supplier_id = self.supplier_combo.currentData()
+        if supplier_id is None:
+            QMessageBox.warning(self, "Input Error", "Select a supplier.")
+            return
+        if not self.lines:
+            QMessageBox.warning(self, "Input Error", "Add at least one line to the order.")
+            return
+        if self.account_id is None:
+            QMessageBox.warning(self, "Error", "Cannot determine the current user.")
+            return
+
+        expected = self.expected_date.date().toPyDate()
+        try:
+            with self.pool.transaction() as conn:
+                self.order_id = Orders.create_order(conn, supplier_id, self.account_id, expected, self.lines)
+        except OrderError as e:
+            QMessageBox.warning(self, "Input Error", str(e))
+            return
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+
+        audit_writer(self.pool).log(
+            self.account_id, None,
+            f"Placed order {self.order_id} with {self.supplier_combo.currentText()}: "
+            f"{len(self.lines)} lines, expected {expected}")
+        QMessageBox.information(self, "Success", f"Order {self.order_id} placed.")
+        self.accept()
@@ -1,15 +1,28 @@
-import datetime
+import sys
+from itertools import islice
+from PracStore import StoreError, open_store
 
-# ---------- Data Structures ----------
-products = {}
-suppliers = {}
-orders = []
-sales = []
+# ---------- Data Store ----------
+# Products, suppliers, orders and sales live in a PracStore.Store, which
+# journals every change and is reloaded from disk on the next start.
+store = None
+
+# Lines written to the terminal per call when printing long lists.
+PRINT_CHUNK = 10000
+
+
+def print_lines(lines):
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, PRINT_CHUNK))
+        if not chunk:
+            break
+        sys.stdout.write("\n".join(chunk) + "\n")
 
 # ---------- Product Functions ----------
 def add_product():
     product_id = input("Enter product ID: ")
-    if product_id in products:
+    if product_id in store.products:
         print("❌ Product ID already exists!")
         return
     name = input("Enter product name: ")
@@ -17,142 +30,117 @@ def add_product():
     quantity = int(input("Enter initial stock quantity: "))
     supplier_id = input("Enter supplier ID (leave blank if none): ")
 
-    products[product_id] = {
-        "name": name,
-        "price": price,
-        "quantity": quantity,
-        "supplier": supplier_id
-    }
+    store.add_product(product_id, name, price, quantity, supplier_id)
     print("✅ Product added successfully!")
 
 def update_product():
     product_id = input("Enter product ID to update: ")
-    if product_id not in products:
+    if product_id not in store.products:
         print("❌ Product not found!")
         return
     name = input("Enter new name (leave blank to keep current): ")
     price = input("Enter new price (leave blank to keep current): ")
     quantity = input("Enter new quantity (leave blank to keep current): ")
 
-    if name:
-        products[product_id]["name"] = name
-    if price:
-        products[product_id]["price"] = float(price)
-    if quantity:
-        products[product_id]["quantity"] = int(quantity)
-
+    store.update_product(product_id, name or None, float(price) if price else None,
+                         int(quantity) if quantity else None)
     print("✅ Product updated successfully!")
 
 def delete_product():
     product_id = input("Enter product ID to delete: ")
-    if product_id in products:
-        del products[product_id]
-        print("✅ Product deleted successfully!")
-    else:
-        print("❌ Product not found!")
+    try:
+        store.delete_product(product_id)
+    except StoreError as e:
+        print(f"❌ {e}")
+        return
+    print("✅ Product deleted successfully!")
 
 def view_products():
-    if not products:
+    if not store.products:
         print("📦 No products available.")
         return
     print("\n📦 Product List:")
-    for pid, info in products.items():
-        print(f"  ID: {pid} | Name: {info['name']} | Price: {info['price']} | Stock: {info['quantity']} | Supplier: {info['supplier']}")
+    print_lines(f"  ID: {pid} | Name: {info.name} | Price: {info.price} | Stock: {info.quantity} | Supplier: {info.supplier}"
+                for pid, info in store.products.items())
 
 # ---------- Supplier Functions ----------
 def add_supplier():
     supplier_id = input("Enter supplier ID: ")
-    if supplier_id in suppliers:
+    if supplier_id in store.suppliers:
         print("❌ Supplier ID already exists!")
         return
     name = input("Enter supplier name: ")
     contact = input("Enter contact number: ")
 
-    suppliers[supplier_id] = {
-        "name": name,
-        "contact": contact
-    }
+    store.add_supplier(supplier_id, name, contact)
     print("✅ Supplier added successfully!")
 
 def view_suppliers():
-    if not suppliers:
+    if not store.suppliers:
         print("📇 No suppliers available.")
         return
     print("\n📇 Supplier List:")
-    for sid, info in suppliers.items():
-        print(f"  ID: {sid} | Name: {info['name']} | Contact: {info['contact']}")
+    print_lines(f"  ID: {sid} | Name: {info.name} | Contact: {info.contact}" for sid, info in store.suppliers.items())
 
 # ---------- Order Functions ----------
 def create_order():
     supplier_id = input("Enter supplier ID: ")
-    if supplier_id not in suppliers:
+    if supplier_id not in store.suppliers:
         print("❌ Supplier not found!")
         return
     product_id = input("Enter product ID to order: ")
-    if product_id not in products:
+    if product_id not in store.products:
         print("❌ Product not found!")
         return
     quantity = int(input("Enter quantity to order: "))
     expected_date = input("Enter expected delivery date (YYYY-MM-DD): ")
 
-    order = {
-        "order_id": len(orders) + 1,
-        "supplier_id": supplier_id,
-        "product_id": product_id,
-        "quantity": quantity,
-        "order_date": datetime.date.today(),
-        "expected_date": expected_date,
-        "status": "Pending"
-    }
-    orders.append(order)
+    try:
+        store.create_order(supplier_id, product_id, quantity, expected_date)
+    except StoreError as e:
+        print(f"❌ {e}")
+        return
     print("✅ Order created successfully!")
 
 def view_orders():
-    if not orders:
+    if not len(store.order_status):
         print("📦 No orders placed.")
         return
     print("\n📦 Orders List:")
-    for o in orders:
-        print(f"  Order ID: {o['order_id']} | Product: {o['product_id']} | Quantity: {o['quantity']} | Status: {o['status']} | Expected: {o['expected_date']}")
+    print_lines(f"  Order ID: {order_id} | Product: {product_id} | Quantity: {quantity} | Status: {status} | Expected: {expected}"
+                for order_id, _, product_id, quantity, _, expected, status in store.orders())
 
 def mark_order_delivered():
     oid = int(input("Enter order ID to mark delivered: "))
-    for order in orders:
-        if order["order_id"] == oid:
-            order["status"] = "Delivered"
-            # Auto-increase stock
-            products[order["product_id"]]["quantity"] += order["quantity"]
-            print("✅ Order marked as delivered. Stock updated.")
-            return
-    print("❌ Order not found!")
+    try:
+        store.mark_delivered(oid)
+    except StoreError as e:
+        print(f"❌ {e}")
+        return
+    print("✅ Order marked as delivered. Stock updated.")
 
 # ---------- Sales Functions ----------
 def record_sale():
     product_id = input("Enter product ID sold: ")
-    if product_id not in products:
+    if product_id not in store.products:
         print("❌ Product not found!")
         return
     quantity = int(input("Enter quantity sold: "))
-    if quantity > products[product_id]["quantity"]:
-        print("❌ Not enough stock!")
+    try:
+        store.record_sale(product_id, quantity)
+    except StoreError as e:
+        print(f"❌ {e}")
         return
-
-    products[product_id]["quantity"] -= quantity
-    sale = {
-        "product_id": product_id,
-        "quantity": quantity,
-        "date": datetime.date.today()
-    }
-    sales.append(sale)
     print("✅ Sale recorded successfully!")
 
 def view_sales_report():
-    if not sales:
+    if not len(store.sale_quantity):
         print("📊 No sales recorded.")
         return
     print("\n📊 Sales Report:")
-    for s in sales:
-        print(f"  Product: {products[s['product_id']]['name']} | Quantity: {s['quantity']} | Date: {s['date']}")
+    print_lines(f"  Product: {name} | Quantity: {quantity} | Date: {day}" for name, quantity, day in store.sales())
+    print("\n📊 Units Sold per Product:")
+    print_lines(f"  ID: {pid} | Product: {name} | Quantity: {total}" for pid, name, total in store.sales_by_product())
 
 # ---------- Main Menu ----------
 def main_menu():
@@ -239,4 +227,8 @@ def manage_orders():
 
 # ---------- Run Program ----------
 if __name__ == "__main__":
-    main_menu()
+    store = open_store()
+    try:
+        main_menu()
+    finally:
+        store.close()
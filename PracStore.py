@@ -0,0 +1,343 @@
+"""Data layer of the Prac.py CLI: indexed in-memory tables with journal persistence.
+
+Every change is appended to a journal as one JSON line before it is applied,
+and the journal is folded into a snapshot every SNAPSHOT_EVERY entries and on
+close. Opening a store loads the snapshot and replays the journal written
+since, so a restart costs one unpickle plus a short replay.
+"""
+import json
+import os
+import pickle
+from array import array
+from datetime import date
+
+# Journal entries written before the store folds them into a new snapshot.
+SNAPSHOT_EVERY = 100000
+# Where the CLI keeps its snapshot and journal.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prac_data")
+
+PENDING, DELIVERED = 0, 1
+STATUS_NAMES = ("Pending", "Delivered")
+
+
+class StoreError(Exception):
+    pass
+
+
+# ---------------------------
+# Records
+# ---------------------------
+class Product:
+    __slots__ = ("name", "price", "quantity", "supplier")
+
+    def __init__(self, name, price, quantity, supplier):
+        self.name = name
+        self.price = price
+        self.quantity = quantity
+        self.supplier = supplier
+
+
+class Supplier:
+    __slots__ = ("name", "contact")
+
+    def __init__(self, name, contact):
+        self.name = name
+        self.contact = contact
+
+
+class _Codes:
+    """Interns string IDs as small ints so order and sale rows fit in arrays.
+
+    ``codes`` maps each ID to its current code; an ID given a new code with
+    ``renew`` keeps its older codes in ``keys``.
+    """
+
+    __slots__ = ("codes", "keys")
+
+    def __init__(self, keys=()):
+        self.keys = list(keys)
+        # Later codes win, so a renewed ID maps to its newest code
+        self.codes = {key: code for code, key in enumerate(self.keys)}
+
+    def code(self, key):
+        code = self.codes.get(key)
+        if code is None:
+            code = self.renew(key)
+        return code
+
+    def renew(self, key):
+        code = self.codes[key] = len(self.keys)
+        self.keys.append(key)
+        return code
+
+
+# ---------------------------
+# Store
+# ---------------------------
+class Store:
+    """Products and suppliers in dicts; orders and sales in parallel array columns.
+
+    Order IDs are handed out in sequence, so an order's row is
+    ``order_id - 1`` and finding one is a subtraction, not a scan. Rows
+    refer to products and suppliers by interned code. Every product added
+    gets a new code, so a deleted product keeps its code and last name for
+    the reports even when its ID is reused.
+    """
+
+    def __init__(self, path=None, snapshot_every=SNAPSHOT_EVERY):
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self.products = {}
+        self.suppliers = {}
+        self._product_codes = _Codes()
+        self._supplier_codes = _Codes()
+        self._product_names = []  # product code -> last known name
+        self.order_product = array("l")
+        self.order_supplier = array("l")
+        self.order_quantity = array("q")
+        self.order_date = array("l")  # date ordinals
+        self.order_expected = array("l")
+        self.order_status = array("b")
+        self.sale_product = array("l")
+        self.sale_quantity = array("q")
+        self.sale_date = array("l")
+        self._seq = 0  # last journal entry applied
+        self._journaled = 0  # entries in the journal since the last snapshot
+        self._journal = None
+
+    # ---------------------------
+    # Products and suppliers
+    # ---------------------------
+    def add_product(self, product_id, name, price, quantity, supplier_id=""):
+        if product_id in self.products:
+            raise StoreError("Product ID already exists!")
+        self._commit("product", product_id, name, float(price), int(quantity), supplier_id)
+
+    def update_product(self, product_id, name=None, price=None, quantity=None):
+        if product_id not in self.products:
+            raise StoreError("Product not found!")
+        self._commit("update", product_id, name or None,
+                      None if price is None else float(price), None if quantity is None else int(quantity))
+
+    def delete_product(self, product_id):
+        if product_id not in self.products:
+            raise StoreError("Product not found!")
+        self._commit("delete", product_id)
+
+    def add_supplier(self, supplier_id, name, contact):
+        if supplier_id in self.suppliers:
+            raise StoreError("Supplier ID already exists!")
+        self._commit("supplier", supplier_id, name, contact)
+
+    # ---------------------------
+    # Orders and sales
+    # ---------------------------
+    def create_order(self, supplier_id, product_id, quantity, expected_date, today=None):
+        """Record a pending order and return its ID."""
+        if supplier_id not in self.suppliers:
+            raise StoreError("Supplier not found!")
+        if product_id not in self.products:
+            raise StoreError("Product not found!")
+        try:
+            expected = date.fromisoformat(expected_date).toordinal()
+        except (TypeError, ValueError):
+            raise StoreError("Expected date must be YYYY-MM-DD!")
+        self._commit("order", supplier_id, product_id, int(quantity), (today or date.today()).toordinal(), expected)
+        return len(self.order_status)
+
+    def order(self, order_id):
+        """(order_id, supplier_id, product_id, quantity, order date, expected date, status) or None."""
+        row = order_id - 1
+        if not 0 <= row < len(self.order_status):
+            return None
+        return (order_id, self._supplier_codes.keys[self.order_supplier[row]],
+                self._product_codes.keys[self.order_product[row]], self.order_quantity[row],
+                date.fromordinal(self.order_date[row]), date.fromordinal(self.order_expected[row]),
+                STATUS_NAMES[self.order_status[row]])
+
+    def orders(self):
+        for order_id in range(1, len(self.order_status) + 1):
+            yield self.order(order_id)
+
+    def mark_delivered(self, order_id):
+        """Mark a pending order delivered and add its quantity to the product's stock."""
+        row = order_id - 1
+        if not 0 <= row < len(self.order_status):
+            raise StoreError("Order not found!")
+        if self.order_status[row] == DELIVERED:
+            raise StoreError("Order already delivered!")
+        if self._product(self.order_product[row]) is None:
+            raise StoreError("The ordered product no longer exists!")
+        self._commit("deliver", order_id)
+
+    def record_sale(self, product_id, quantity, today=None):
+        product = self.products.get(product_id)
+        if product is None:
+            raise StoreError("Product not found!")
+        if int(quantity) > product.quantity:
+            raise StoreError("Not enough stock!")
+        self._commit("sale", product_id, int(quantity), (today or date.today()).toordinal())
+
+    def sales(self):
+        """(product name, quantity, date) per sale, oldest first."""
+        names = self._product_names
+        return zip((names[code] for code in self.sale_product), self.sale_quantity,
+                   map(date.fromordinal, self.sale_date))
+
+    def sales_by_product(self):
+        """(product ID, name, units sold) per product that sold, summed over every sale.
+
+        Totals are kept per product code, so products sharing a name, or a
+        deleted product and a later one reusing its ID, stay apart.
+        """
+        totals = [0] * len(self._product_names)
+        for code, quantity in zip(self.sale_product, self.sale_quantity):
+            totals[code] += quantity
+        keys = self._product_codes.keys
+        return [(keys[code], self._product_names[code], total) for code, total in enumerate(totals) if total]
+
+    # ---------------------------
+    # Applying changes
+    # ---------------------------
+    # _apply only mutates; the public methods above validate first, so a
+    # journal replay never fails halfway.
+    def _commit(self, op, *args):
+        entry = [self._seq + 1, op, *args]
+        if self._journal is not None:
+            self._journal.write(json.dumps(entry) + "\n")
+            self._journal.flush()
+            self._journaled += 1
+        self._apply(entry)
+        if self._journal is not None and self._journaled >= self.snapshot_every:
+            self.snapshot()
+
+    def _apply(self, entry):
+        self._seq, op, *args = entry
+        if op == "product":
+            product_id, name, price, quantity, supplier_id = args
+            self.products[product_id] = Product(name, price, quantity, supplier_id)
+            self._product_codes.renew(product_id)
+            self._product_names.append(name)
+        elif op == "update":
+            product_id, name, price, quantity = args
+            product = self.products[product_id]
+            if name is not None:
+                product.name = name
+                self._product_names[self._product_codes.codes[product_id]] = name
+            if price is not None:
+                product.price = price
+            if quantity is not None:
+                product.quantity = quantity
+        elif op == "delete":
+            del self.products[args[0]]
+        elif op == "supplier":
+            supplier_id, name, contact = args
+            self.suppliers[supplier_id] = Supplier(name, contact)
+        elif op == "order":
+            supplier_id, product_id, quantity, ordered, expected = args
+            self.order_supplier.append(self._supplier_codes.code(supplier_id))
+            self.order_product.append(self._product_codes.codes[product_id])
+            self.order_quantity.append(quantity)
+            self.order_date.append(ordered)
+            self.order_expected.append(expected)
+            self.order_status.append(PENDING)
+        elif op == "deliver":
+            row = args[0] - 1
+            self.order_status[row] = DELIVERED
+            self._product(self.order_product[row]).quantity += self.order_quantity[row]
+        elif op == "sale":
+            product_id, quantity, day = args
+            self.products[product_id].quantity -= quantity
+            self.sale_product.append(self._product_codes.codes[product_id])
+            self.sale_quantity.append(quantity)
+            self.sale_date.append(day)
+        else:
+            raise StoreError(f"Unknown journal entry {op!r}")
+
+    def _product(self, code):
+        """The product a row's code refers to, or None once it was deleted (even if its ID was reused)."""
+        product_id = self._product_codes.keys[code]
+        if self._product_codes.codes.get(product_id) != code:
+            return None
+        return self.products.get(product_id)
+
+    # ---------------------------
+    # Persistence
+    # ---------------------------
+    def _files(self):
+        return os.path.join(self.path, "snapshot.pickle"), os.path.join(self.path, "journal.jsonl")
+
+    def _state(self):
+        return {
+            "seq": self._seq,
+            "products": {key: (p.name, p.price, p.quantity, p.supplier) for key, p in self.products.items()},
+            "suppliers": {key: (s.name, s.contact) for key, s in self.suppliers.items()},
+            "product_keys": self._product_codes.keys,
+            "supplier_keys": self._supplier_codes.keys,
+            "product_names": self._product_names,
+            "columns": {name: getattr(self, name) for name in _COLUMNS},
+        }
+
+    def _load_state(self, state):
+        self._seq = state["seq"]
+        self.products = {key: Product(*values) for key, values in state["products"].items()}
+        self.suppliers = {key: Supplier(*values) for key, values in state["suppliers"].items()}
+        self._product_codes = _Codes(state["product_keys"])
+        self._supplier_codes = _Codes(state["supplier_keys"])
+        self._product_names = state["product_names"]
+        for name, column in state["columns"].items():
+            setattr(self, name, column)
+
+    def load(self):
+        """Read the snapshot, replay the journal after it and start appending to the journal."""
+        os.makedirs(self.path, exist_ok=True)
+        snapshot_path, journal_path = self._files()
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, "rb") as f:
+                self._load_state(pickle.load(f))
+        if os.path.exists(journal_path):
+            valid = 0
+            with open(journal_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # A line cut short by a crash; it was never applied
+                        break
+                    entry = json.loads(line)
+                    # Entries already in the snapshot if it was written but the journal not yet cleared
+                    if entry[0] > self._seq:
+                        self._apply(entry)
+                        self._journaled += 1
+                    valid += len(line)
+            os.truncate(journal_path, valid)
+        self._journal = open(journal_path, "a", encoding="utf-8")
+        return self
+
+    def snapshot(self):
+        """Write the whole store to a new snapshot and empty the journal."""
+        snapshot_path, journal_path = self._files()
+        temp_path = snapshot_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(self._state(), f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, snapshot_path)
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(journal_path, "w", encoding="utf-8")
+        self._journaled = 0
+
+    def close(self):
+        if self._journal is None:
+            return
+        if self._journaled:
+            self.snapshot()
+        self._journal.close()
+        self._journal = None
+
+
+_COLUMNS = ("order_product", "order_supplier", "order_quantity", "order_date", "order_expected", "order_status",
+            "sale_product", "sale_quantity", "sale_date")
+
+
+def open_store(path=DATA_DIR, snapshot_every=SNAPSHOT_EVERY):
+    return Store(path, snapshot_every).load()
@@ -0,0 +1,165 @@
+import threading
+import time
+from Changes import SUPPLIER, record_change
+
+# Seconds a loaded table is trusted before the next read reloads it. Writes
+# made through this process invalidate explicitly; the TTL only bounds how
+# long changes made from other terminals take to show up.
+REFERENCE_TTL = 300
+
+# ---------------------------
+# Reference tables
+# ---------------------------
+# Small lookup tables every dialog needs. Passwords are deliberately not
+# cached; logins keep checking them against the database.
+REFERENCE_QUERIES = {
+    "types": "SELECT TypeID, TypeName, CategoryID FROM type ORDER BY TypeName",
+    "suppliers": "SELECT SupplierID, SupplierName FROM suppliers ORDER BY SupplierName",
+    "categories": "SELECT CategoryID, CategoryName FROM category ORDER BY CategoryName",
+    "accounts": """
+        SELECT AccountID, UserName, FName, LName, Role
+        FROM accounts
+        ORDER BY FName, LName
+    """,
+}
+
+
+def _key(name):
+    # Matches the case-insensitive collation of the name columns
+    return str(name).strip().casefold()
+
+
+class ReferenceCache:
+    """Process-wide, thread-safe cache of the reference tables.
+
+    Each table is loaded on first use and kept for ``ttl`` seconds. Call
+    ``invalidate`` after writing to a table so the next read reloads it.
+    """
+
+    def __init__(self, pool, ttl=REFERENCE_TTL):
+        self.pool = pool
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._tables = {}
+        self._loaded_at = {}
+        self._indexes = {}
+        self._generations = {}  # bumped by invalidate, so a fetch it overlapped is not kept
+
+    def rows(self, table):
+        with self._lock:
+            loaded_at = self._loaded_at.get(table)
+            if loaded_at is not None and time.monotonic() - loaded_at < self.ttl:
+                return self._tables[table]
+            generation = self._generations.get(table, 0)
+        rows = self.pool.run(_fetch, REFERENCE_QUERIES[table])
+        with self._lock:
+            # Rows read before an invalidate that landed mid-fetch are returned but not cached
+            if self._generations.get(table, 0) == generation:
+                self._tables[table] = rows
+                self._loaded_at[table] = time.monotonic()
+                self._indexes.pop(table, None)
+        return rows
+
+    def invalidate(self, *tables):
+        """Forget ``tables`` (all of them when none are given)."""
+        with self._lock:
+            for table in tables or list(REFERENCE_QUERIES):
+                self._generations[table] = self._generations.get(table, 0) + 1
+                self._loaded_at.pop(table, None)
+                self._indexes.pop(table, None)
+
+    def _index(self, table, key_column, build):
+        rows = self.rows(table)
+        with self._lock:
+            cached = self._indexes.get(table, {}).get(key_column)
+            if cached is not None and cached[0] is rows:
+                return cached[1]
+        index = build(rows)
+        with self._lock:
+            self._indexes.setdefault(table, {})[key_column] = (rows, index)
+        return index
+
+    # ---------------------------
+    # Lookups
+    # ---------------------------
+    def types(self, category_id=None):
+        """(TypeID, TypeName) pairs, optionally for one category."""
+        return [(type_id, name) for type_id, name, category in self.rows("types")
+                if category_id is None or str(category) == str(category_id)]
+
+    def categories(self):
+        return list(self.rows("categories"))
+
+    def suppliers(self):
+        return list(self.rows("suppliers"))
+
+    def supplier_id(self, name):
+        index = self._index("suppliers", "name",
+                            lambda rows: {_key(supplier_name): supplier_id for supplier_id, supplier_name in rows})
+        return index.get(_key(name))
+
+    def account(self, username):
+        """(AccountID, UserName, FName, LName, Role) for ``username``, or None."""
+        index = self._index("accounts", "username", lambda rows: {_key(row[1]): row for row in rows})
+        return index.get(_key(username))
+
+    def account_id(self, username):
+        account = self.account(username)
+        return account[0] if account else None
+
+    def account_names(self):
+        """AccountID -> "FName LName" for every account."""
+        return self._index("accounts", "names",
+                           lambda rows: {row[0]: f"{row[2]} {row[3]}" for row in rows})
+
+    def resolve_supplier(self, cursor, name):
+        """Return the SupplierID for ``name``, inserting the supplier through ``cursor`` if new.
+
+        ``cursor`` must belong to this cache's pool, so the cached suppliers
+        are dropped once its transaction commits.
+        """
+        supplier_id = self.supplier_id(name)
+        if supplier_id is None:
+            cursor.execute("SELECT SupplierID FROM suppliers WHERE SupplierName=%s", (name,))
+            row = cursor.fetchone()
+            if row:
+                supplier_id = row[0]
+            else:
+                cursor.execute("INSERT INTO suppliers (SupplierName) VALUES (%s)", (name,))
+                supplier_id = cursor.lastrowid
+                record_change(cursor, SUPPLIER, supplier_id)
+            # Reloading before the commit would cache the list without the new
+            # supplier, and patching it could keep one the rollback removed
+            self.pool.after_commit(lambda: self.invalidate("suppliers"))
+        return supplier_id
+
+
+# Logins are always checked against the database, never the cache.
+LOGIN_SELECT = "SELECT role FROM accounts WHERE username=%s AND password=%s"
+
+
+def login_role(conn, username, password):
+    """Role of the account matching ``username`` and ``password``, or None."""
+    with conn.cursor() as cursor:
+        cursor.execute(LOGIN_SELECT, (username, password))
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _fetch(conn, sql):
+    with conn.cursor() as cursor:
+        cursor.execute(sql)
+        return tuple(cursor.fetchall())
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def reference_cache(pool):
+    """The shared ReferenceCache for ``pool``, created on first use."""
+    with _caches_lock:
+        cache = _caches.get(id(pool))
+        if cache is None or cache.pool is not pool:
+            cache = _caches[id(pool)] = ReferenceCache(pool)
+        return cache
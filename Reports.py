@@ -0,0 +1,144 @@
+from datetime import datetime
+from Archive import ARCHIVES
+from Inventory import INVENTORY_SELECT, PAGE_SIZE
+
+# ---------------------------
+# Report queries
+# ---------------------------
+# Stock movement history joined to the product and supplier. The account
+# that recorded each movement comes back as its AccountID and is turned into
+# a name from the reference cache (see name_accounts), so the reports do not
+# join accounts. ``{table}`` is the live ledger or its archive (see
+# Archive.archive_ledgers); the reports read both, so archiving never takes
+# movements out of them. Archived rows keep their IDs, which stay unique
+# across the pair.
+STOCKIN_REPORT_SELECT = """
+    SELECT s.StockInID,
+           p.ProductID,
+           p.ProductName,
+           sup.SupplierName,
+           p.Price,
+           s.Quantity                    AS QuantityAdded,
+           (p.Price * s.Quantity)        AS Total,
+           s.AccountID                   AS StockedBy,
+           s.MovedAt
+    FROM {table} s
+             JOIN products p ON s.ProductID = p.ProductID
+             JOIN suppliers sup ON p.SupplierID = sup.SupplierID
+"""
+
+STOCKOUT_REPORT_SELECT = """
+    SELECT s.StockOutID,
+           p.ProductID,
+           p.ProductName,
+           sup.SupplierName,
+           p.Price,
+           s.Quantity                    AS QuantityRemoved,
+           (p.Price * s.Quantity)        AS Total,
+           s.AccountID                   AS StockedBy,
+           s.MovedAt
+    FROM {table} s
+             JOIN products p ON s.ProductID = p.ProductID
+             JOIN suppliers sup ON p.SupplierID = sup.SupplierID
+"""
+
+REPORT_SELECTS = {"stockin": STOCKIN_REPORT_SELECT, "stockout": STOCKOUT_REPORT_SELECT}
+REPORT_IDS = {"stockin": "StockInID", "stockout": "StockOutID"}
+# Position of StockedBy in the report rows
+ACCOUNT_COLUMN = 7
+
+
+def name_accounts(rows, names, column=ACCOUNT_COLUMN):
+    """Replace the AccountID at ``column`` of each row with the name from ``names``."""
+    return [row[:column] + (names.get(row[column], f"#{row[column]}"),) + row[column + 1:] for row in rows]
+
+
+def _ledger_union(ledger, tail=""):
+    """The report SELECT over ``ledger`` UNION ALL its archive, each branch completed with ``tail``."""
+    return " UNION ALL ".join(f"({REPORT_SELECTS[ledger].format(table=table)}{tail})"
+                              for table in (ledger, ARCHIVES[ledger][0]))
+
+
+# ---------------------------
+# Filtered, paged reports
+# ---------------------------
+# ``filters`` is a dict with any of: "start" (inclusive) and "end" (exclusive)
+# datetimes, "product" (a ProductID or part of a product name), "account_id"
+# and "supplier_id". Pages run newest first and seek below the last ID shown,
+# so every page is an index range read no matter how deep the user scrolls.
+def _report_where(filters):
+    conditions = []
+    params = []
+    if filters.get("start"):
+        conditions.append("s.MovedAt >= %s")
+        params.append(filters["start"])
+    if filters.get("end"):
+        conditions.append("s.MovedAt < %s")
+        params.append(filters["end"])
+    if filters.get("account_id"):
+        conditions.append("s.AccountID = %s")
+        params.append(filters["account_id"])
+    product = str(filters.get("product") or "").strip()
+    if product.isdigit():
+        conditions.append("s.ProductID = %s")
+        params.append(int(product))
+    elif product:
+        conditions.append("p.ProductName LIKE %s")
+        params.append(f"%{product}%")
+    if filters.get("supplier_id"):
+        conditions.append("p.SupplierID = %s")
+        params.append(filters["supplier_id"])
+    return conditions, params
+
+
+def fetch_report_page(conn, ledger, filters, after_id=0, limit=PAGE_SIZE):
+    """Return up to ``limit`` movements older than ``after_id`` (0: the newest).
+
+    Each branch seeks its own ID index for ``limit`` rows, so merging the
+    archive in sorts at most twice a page.
+    """
+    conditions, params = _report_where(filters)
+    id_column = REPORT_IDS[ledger]
+    if after_id:
+        conditions.append(f"s.{id_column} < %s")
+        params.append(after_id)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    union = _ledger_union(ledger, f"{where} ORDER BY s.{id_column} DESC LIMIT %s")
+    with conn.cursor() as cursor:
+        cursor.execute(f"{union} ORDER BY {id_column} DESC LIMIT %s", (params + [limit]) * 2 + [limit])
+        return cursor.fetchall()
+
+
+def count_report(conn, ledger, filters):
+    """Number of movements matching ``filters``, joining products only when a filter needs it."""
+    conditions, params = _report_where(filters)
+    join = " JOIN products p ON s.ProductID = p.ProductID" if any("p." in c for c in conditions) else ""
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    counts = [f"(SELECT COUNT(*) FROM {table} s{join}{where})" for table in (ledger, ARCHIVES[ledger][0])]
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT " + " + ".join(counts), params * 2)
+        return cursor.fetchone()[0]
+
+
+# ---------------------------
+# Exportable reports
+# ---------------------------
+# name -> (columns, full SELECT, AccountID column to name or None). Columns
+# are (header, kind) like the layouts in Models.py; the kinds fix the column
+# types of typed formats such as Parquet.
+MOVEMENT_REPORT_COLUMNS = [
+    ("ID", int), ("ProductID", int), ("ProductName", str), ("Supplier", str), ("Price", int),
+    ("Quantity", int), ("Total", int), ("Stocked By", str), ("Date", datetime),
+]
+
+EXPORT_REPORTS = {
+    "Inventory": (
+        [("Product ID", int), ("Product Name", str), ("Type", str), ("Supplier", str), ("Price", int),
+         ("Stock", int), ("Total", int), ("Reorder Level", int), ("Date Supplied", datetime),
+         ("Daily Use", float), ("Reorder Point", int), ("Order Qty", int)],
+        INVENTORY_SELECT + " ORDER BY p.ProductID",
+        None,
+    ),
+    "Stock Ins": (MOVEMENT_REPORT_COLUMNS, _ledger_union("stockin") + " ORDER BY StockInID", ACCOUNT_COLUMN),
+    "Stock Outs": (MOVEMENT_REPORT_COLUMNS, _ledger_union("stockout") + " ORDER BY StockOutID", ACCOUNT_COLUMN),
+}
@@ -0,0 +1,448 @@
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+import pymysql
+import pymysql.cursors
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from Inventory import INVENTORY_SELECT
+
+# Quiet period after the last keystroke before a search is sent.
+SEARCH_DELAY_MS = 250
+# Rows handed to the model per batch while a search streams in.
+SEARCH_CHUNK = 200
+# Rows read per fetch while the in-memory index is being built.
+INDEX_CHUNK = 5000
+
+SEARCH_WHERE = """
+    AND (CAST(p.ProductID AS CHAR) LIKE %s
+         OR p.ProductName LIKE %s
+         OR t.TypeName LIKE %s
+         OR s.SupplierName LIKE %s)
+    ORDER BY p.ProductID
+"""
+
+_TOKEN_RE = re.compile(r"\w+")
+_EMPTY = frozenset()
+
+
+class ProductIndex:
+    """In-memory search index over ProductID, ProductName, TypeName and SupplierName.
+
+    Rows are the INVENTORY_SELECT tuples. Each text field has its own inverted
+    index (token -> product IDs), and the shared token vocabulary is indexed by
+    1-, 2- and 3-grams, so a substring of any word resolves to a handful of
+    vocabulary entries instead of a scan over products. Product IDs match
+    exactly or by prefix through a sorted list. Keywords spanning several
+    words are verified against the full field text, so a hit always means
+    the keyword is a case-insensitive substring of the name, type or
+    supplier, as with the SQL LIKE path.
+    """
+
+    # Ranking buckets, best first
+    EXACT_ID, ID_PREFIX, NAME_PREFIX, WORD_PREFIX, NAME, TYPE, SUPPLIER = range(7)
+
+    def __init__(self):
+        self.rows = {}  # ProductID -> inventory row
+        self._texts = {}  # ProductID -> (name, type, supplier), lowercased
+        self._postings = (defaultdict(set), defaultdict(set), defaultdict(set))  # per field: token -> {ProductID}
+        self._leading = defaultdict(set)  # first token of the name -> {ProductID}
+        self._vocabulary = set()
+        self._grams = defaultdict(set)  # 3-gram -> {token}
+        self._short = defaultdict(set)  # 1- and 2-gram -> {token}
+        self._ids = []  # sorted str(ProductID) for prefix lookups
+
+    def __len__(self):
+        return len(self.rows)
+
+    # ---------------------------
+    # Maintenance
+    # ---------------------------
+    def add_many(self, rows):
+        new_ids = []
+        for row in rows:
+            if row[0] in self.rows:
+                self.upsert(row)
+            else:
+                new_ids.append(str(row[0]))
+                self._add(row)
+        self._ids.extend(new_ids)
+        self._ids.sort()
+
+    def upsert(self, row):
+        product_id = row[0]
+        if product_id in self.rows:
+            self._unlink(product_id)
+        else:
+            insort(self._ids, str(product_id))
+        self._add(row)
+
+    def remove(self, product_id):
+        if product_id not in self.rows:
+            return
+        self._unlink(product_id)
+        del self.rows[product_id]
+        key = str(product_id)
+        i = bisect_left(self._ids, key)
+        if i < len(self._ids) and self._ids[i] == key:
+            del self._ids[i]
+
+    def _add(self, row):
+        product_id = row[0]
+        texts = tuple((value or "").lower() for value in row[1:4])
+        self.rows[product_id] = row
+        self._texts[product_id] = texts
+        for postings, text in zip(self._postings, texts):
+            for token in set(_TOKEN_RE.findall(text)):
+                if token not in self._vocabulary:
+                    self._index_token(token)
+                postings[token].add(product_id)
+        leading = _TOKEN_RE.match(texts[0])
+        if leading:
+            self._leading[leading.group()].add(product_id)
+
+    def _unlink(self, product_id):
+        texts = self._texts.pop(product_id)
+        for postings, text in zip(self._postings, texts):
+            for token in set(_TOKEN_RE.findall(text)):
+                self._discard(postings, token, product_id)
+        leading = _TOKEN_RE.match(texts[0])
+        if leading:
+            self._discard(self._leading, leading.group(), product_id)
+
+    @staticmethod
+    def _discard(postings, token, product_id):
+        ids = postings.get(token)
+        if ids is not None:
+            ids.discard(product_id)
+            if not ids:
+                del postings[token]
+
+    def _index_token(self, token):
+        self._vocabulary.add(token)
+        for size, table in ((1, self._short), (2, self._short), (3, self._grams)):
+            for i in range(len(token) - size + 1):
+                table[token[i:i + size]].add(token)
+
+    # ---------------------------
+    # Lookup
+    # ---------------------------
+    def _tokens_containing(self, term):
+        if len(term) <= 2:
+            return self._short.get(term, _EMPTY)
+        grams = sorted((self._grams.get(term[i:i + 3], _EMPTY) for i in range(len(term) - 2)), key=len)
+        if len(term) == 3 or not grams[0]:
+            return grams[0]
+        return [token for token in grams[0].intersection(*grams[1:]) if term in token]
+
+    def _term_hits(self, term):
+        """Per-field sets of products with a token containing ``term``.
+
+        Also returns the products whose name has a word, or starts with a
+        word, beginning with ``term``.
+        """
+        hits = (set(), set(), set())
+        word_prefix = set()
+        name_prefix = set()
+        for token in self._tokens_containing(term):
+            for field, postings in enumerate(self._postings):
+                ids = postings.get(token)
+                if ids:
+                    hits[field].update(ids)
+            if token.startswith(term):
+                word_prefix.update(self._postings[0].get(token, _EMPTY))
+                name_prefix.update(self._leading.get(token, _EMPTY))
+        return hits, word_prefix, name_prefix
+
+    def _single_term_buckets(self, query, buckets):
+        (name, type_name, supplier), word_prefix, name_prefix = self._term_hits(query)
+        buckets[self.NAME_PREFIX] = name_prefix
+        buckets[self.WORD_PREFIX] = word_prefix - name_prefix
+        buckets[self.NAME] = name - word_prefix
+        buckets[self.TYPE] = type_name - name
+        buckets[self.SUPPLIER] = supplier - name - type_name
+
+    def _verified_buckets(self, query, terms, buckets):
+        if terms:
+            candidates = None
+            # Longest terms first, they are usually the most selective
+            for term in sorted(set(terms), key=len, reverse=True):
+                hits = self._term_hits(term)[0]
+                matched = hits[0] | hits[1] | hits[2]
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return
+        else:
+            candidates = self.rows.keys()
+        for product_id in candidates:
+            name, type_name, supplier = self._texts[product_id]
+            if query in name:
+                if name.startswith(query):
+                    bucket = self.NAME_PREFIX
+                elif " " + query in name:
+                    bucket = self.WORD_PREFIX
+                else:
+                    bucket = self.NAME
+            elif query in type_name:
+                bucket = self.TYPE
+            elif query in supplier:
+                bucket = self.SUPPLIER
+            else:
+                continue
+            buckets[bucket].add(product_id)
+
+    def search(self, keyword, limit=None):
+        """Return matching rows, best matches first.
+
+        Ranking: exact ProductID, ProductID prefix, name prefix, name word
+        prefix, name substring, type, supplier; ties by ProductID.
+        """
+        query = keyword.strip().lower()
+        if not query:
+            return []
+
+        buckets = [set() for _ in range(7)]
+        if query.isdigit():
+            i = bisect_left(self._ids, query)
+            while i < len(self._ids) and self._ids[i].startswith(query):
+                buckets[self.ID_PREFIX].add(int(self._ids[i]))
+                i += 1
+            if int(query) in self.rows:
+                buckets[self.EXACT_ID].add(int(query))
+                buckets[self.ID_PREFIX].discard(int(query))
+
+        terms = _TOKEN_RE.findall(query)
+        if terms == [query]:
+            self._single_term_buckets(query, buckets)
+        else:
+            self._verified_buckets(query, terms, buckets)
+
+        # Only the ID buckets can overlap the text buckets
+        ids = buckets[self.EXACT_ID] | buckets[self.ID_PREFIX]
+        result = []
+        for rank, bucket in enumerate(buckets):
+            if ids and rank > self.ID_PREFIX:
+                bucket -= ids
+            result.extend(map(self.rows.__getitem__, sorted(bucket)))
+            if limit is not None and len(result) >= limit:
+                return result[:limit]
+        return result
+
+
+class _SearchSignals(QObject):
+    chunk = pyqtSignal(int, list)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(int, str)
+    index_built = pyqtSignal(int, object)
+    index_failed = pyqtSignal(int)
+
+
+class _SearchTask(QRunnable):
+    def __init__(self, controller, generation, keyword):
+        super().__init__()
+        self.controller = controller
+        self.generation = generation
+        self.keyword = keyword
+
+    def run(self):
+        controller = self.controller
+        signals = controller.signals
+        conn = None
+        drained = False
+        try:
+            conn = controller.db_pool.acquire()
+            controller._begin(self.generation, conn)
+            cursor = conn.cursor(pymysql.cursors.SSCursor)
+            pattern = f"%{self.keyword}%"
+            cursor.execute(controller.select_sql + SEARCH_WHERE, (pattern, pattern, pattern, pattern))
+            while not controller.is_stale(self.generation):
+                rows = cursor.fetchmany(SEARCH_CHUNK)
+                if not rows:
+                    cursor.close()
+                    drained = True
+                    break
+                signals.chunk.emit(self.generation, list(rows))
+        except Exception as e:
+            if not controller.is_stale(self.generation):
+                signals.failed.emit(self.generation, str(e))
+        finally:
+            controller._end(self.generation)
+            if conn is not None:
+                # Dropping the connection also abandons any unread rows of a superseded search
+                controller.db_pool.release(conn, discard=not drained)
+            signals.finished.emit(self.generation)
+
+
+class _IndexTask(QRunnable):
+    def __init__(self, controller, generation):
+        super().__init__()
+        self.controller = controller
+        self.generation = generation
+
+    def run(self):
+        try:
+            with self.controller.db_pool.connection() as conn, conn.cursor(pymysql.cursors.SSCursor) as cursor:
+                cursor.execute(self.controller.select_sql + " ORDER BY p.ProductID")
+                index = ProductIndex()
+                while True:
+                    rows = cursor.fetchmany(INDEX_CHUNK)
+                    if not rows:
+                        break
+                    index.add_many(rows)
+        except Exception as e:
+            # Searching keeps using the SQL path
+            print("Error:", e)
+            self.controller.signals.index_failed.emit(self.generation)
+            return
+        self.controller.signals.index_built.emit(self.generation, index)
+
+
+class SearchController(QObject):
+    """Debounced product search that runs off the GUI thread.
+
+    Every keystroke bumps a generation counter; only the newest generation is
+    sent to the database, on a worker thread with a connection from ``db_pool``. Results
+    stream into ``model`` in chunks, and anything belonging to an older
+    generation is dropped. A superseded query still running on the server is
+    cancelled with KILL QUERY.
+
+    Once ``load_index`` has built a ProductIndex in the background, searches
+    are answered from memory without the debounce or a round trip. Writers
+    keep it current through ``index_upsert`` and ``index_remove``.
+    """
+
+    failed = pyqtSignal(str)
+
+    def __init__(self, model, db_pool, parent=None, select_sql=INVENTORY_SELECT, delay_ms=SEARCH_DELAY_MS):
+        super().__init__(parent)
+        self.model = model
+        self.db_pool = db_pool
+        self.select_sql = select_sql
+        self.signals = _SearchSignals(self)
+        self.signals.chunk.connect(self._on_chunk)
+        self.signals.finished.connect(self._on_finished)
+        self.signals.failed.connect(self._on_failed)
+        self.signals.index_built.connect(self._on_index_built)
+        self.signals.index_failed.connect(self._on_index_failed)
+
+        self.workers = QThreadPool(self)
+        self.workers.setMaxThreadCount(2)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self._start)
+
+        self._lock = threading.Lock()
+        self._running = {}  # generation -> server thread id
+        self._generation = 0
+        self._shown_generation = 0
+        self._keyword = ""
+
+        self.index = None
+        self._index_log = None  # changes made while the newest index build runs
+        self._index_generation = 0
+
+    def search(self, keyword):
+        self._generation += 1
+        if self.index is not None:
+            self.timer.stop()
+            self.model.set_rows(self.index.search(keyword))
+            return
+        self._keyword = keyword
+        self.timer.start()
+
+    def cancel(self):
+        """Drop the pending search and ignore results of the running one."""
+        self._generation += 1
+        self.timer.stop()
+
+    def is_stale(self, generation):
+        return generation != self._generation
+
+    # ---------------------------
+    # In-memory index
+    # ---------------------------
+    def load_index(self):
+        """Build a fresh index in the background; a build still running is superseded."""
+        # The new build reads every change committed so far, so only later ones need replaying
+        self._index_generation += 1
+        self._index_log = []
+        self.workers.start(_IndexTask(self, self._index_generation))
+
+    def index_upsert(self, row):
+        if row is None:
+            return
+        if self._index_log is not None:
+            self._index_log.append(("upsert", row))
+        if self.index is not None:
+            self.index.upsert(row)
+
+    def index_remove(self, product_id):
+        if self._index_log is not None:
+            self._index_log.append(("remove", product_id))
+        if self.index is not None:
+            self.index.remove(product_id)
+
+    @pyqtSlot(int, object)
+    def _on_index_built(self, generation, index):
+        if generation != self._index_generation:
+            return
+        for action, arg in self._index_log or ():
+            getattr(index, action)(arg)
+        self._index_log = None
+        self.index = index
+
+    @pyqtSlot(int)
+    def _on_index_failed(self, generation):
+        if generation == self._index_generation:
+            # Nothing will replay the log; keep the previous index, if any
+            self._index_log = None
+
+    # ---------------------------
+    # Worker side
+    # ---------------------------
+    def _start(self):
+        self.workers.start(_SearchTask(self, self._generation, self._keyword))
+
+    def _begin(self, generation, conn):
+        with self._lock:
+            stale = [thread_id for gen, thread_id in self._running.items() if gen != generation]
+            self._running[generation] = conn.thread_id()
+        if stale:
+            cursor = conn.cursor()
+            for thread_id in stale:
+                try:
+                    cursor.execute("KILL QUERY %s", (thread_id,))
+                except pymysql.MySQLError:
+                    pass  # already finished
+            cursor.close()
+
+    def _end(self, generation):
+        with self._lock:
+            self._running.pop(generation, None)
+
+    # ---------------------------
+    # GUI side
+    # ---------------------------
+    @pyqtSlot(int, list)
+    def _on_chunk(self, generation, rows):
+        if self.is_stale(generation):
+            return
+        if self._shown_generation != generation:
+            self._shown_generation = generation
+            self.model.set_rows(rows)
+        else:
+            self.model.append_rows(rows)
+
+    @pyqtSlot(int)
+    def _on_finished(self, generation):
+        if not self.is_stale(generation) and self._shown_generation != generation:
+            # Nothing matched
+            self._shown_generation = generation
+            self.model.clear()
+
+    @pyqtSlot(int, str)
+    def _on_failed(self, generation, message):
+        if not self.is_stale(generation):
+            self.failed.emit(message)
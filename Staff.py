@@ -1,272 +1,35 @@
 from PyQt6.QtCore import QDateTime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from datetime import datetime
+from Models import ProductTableModel, STOCK_COLUMNS, INVENTORY_COLUMNS, CATEGORY_PRODUCT_COLUMNS
+from Inventory import fetch_product, fetch_products, fetch_product_page, INVENTORY_SELECT, STOCK_SELECT
+from Search import SearchController
+from Dashboard import DashboardPanel
+import Stock
+from Stock import StockError
+from StockBatch import BatchStockDialog
+from Reference import reference_cache
+from Alerts import AlertEngine, AlertTray
+from Audit import audit_writer
+from Changes import ChangeFeed, PRODUCT, SUPPLIER, ACCOUNT, UPSERT, DELETE, RELOAD
 from IMS import *
 
-class DashboardPanel(QWidget):
-    def __init__(self, conn, parent=None):
-        super().__init__(parent)
-        self.conn = conn
-        self.setGeometry(10, 10, 1140, 500)
-        self.setStyleSheet("background-color: rgb(70, 70, 70); border-radius: 10px;")
-
-        self.main_layout = QVBoxLayout(self)
-
-        # Title
-        title = QLabel("Dashboard")
-        title.setStyleSheet("color: white; font-size: 22px; font-weight: bold;")
-        title.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.main_layout.addWidget(title)
-
-        # Store widgets for refresh later
-        self.summary_layout = QHBoxLayout()
-        self.graph_layout = QHBoxLayout()
-
-        self.main_layout.addLayout(self.summary_layout)
-        self.main_layout.addLayout(self.graph_layout)
-
-        low_stock_header = QHBoxLayout()
-        self.low_stock_label = QLabel("Low Stock Products")
-        self.low_stock_label.setStyleSheet("color: white; font-size: 14px; font-weight: bold;")
-        self.low_stock_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        low_stock_header.addWidget(self.low_stock_label)
-
-        # Refresh button
-        self.refresh_btn = QPushButton("⟳ Refresh")
-        self.refresh_btn.setFixedWidth(100)
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgb(50, 150, 200);
-                color: white;
-                border-radius: 8px;
-                padding: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgb(60, 170, 220);
-            }
-        """)
-        self.refresh_btn.clicked.connect(self.refresh_dashboard)
-        low_stock_header.addWidget(self.refresh_btn, alignment=Qt.AlignmentFlag.AlignRight)
-
-        self.main_layout.addLayout(low_stock_header)
-
-        # Create low stock table
-        self.low_stock_table = QTableWidget()
-        self.low_stock_table.setColumnCount(4)
-        self.low_stock_table.setHorizontalHeaderLabels(["Product Name", "Type", "Quantity", "Reorder Level"])
-        self.low_stock_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.low_stock_table.verticalHeader().setVisible(False)
-        self.low_stock_table.setStyleSheet("""
-            QTableWidget {
-                color: black;
-                background-color: #f8f9fa;
-                alternate-background-color: #e9ecef;
-                gridline-color: #b0b0b0;
-                border-radius: 10px;
-                font-size: 13px;
-                selection-background-color: rgb(70,130,250);
-                selection-color: white;
-            }
-            QHeaderView::section {
-                background-color: rgb(50,150,200);
-                color: white;
-                font-weight: bold;
-                border: none;
-                padding: 6px;
-            }
-            QHeaderView::section:first { border-top-left-radius: 10px; }
-            QHeaderView::section:last { border-top-right-radius: 10px; }
-            QTableCornerButton::section { background-color: rgb(50,150,200); border: none; }
-            QScrollBar:vertical {
-                background: #e2e2e2;
-                width: 10px;
-                margin: 2px 0 2px 0;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgb(130,180,230), stop:1 rgb(90,150,210));
-                border-radius: 20px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgb(150,200,250), stop:1 rgb(100,160,220));
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-                background: none;
-            }
-        """)
-        self.main_layout.addWidget(self.low_stock_table)
-
-        self.refresh_dashboard()
-
-    def refresh_dashboard(self):
-        """Refresh all dashboard data"""
-        for i in reversed(range(self.summary_layout.count())):
-            widget = self.summary_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        for i in reversed(range(self.graph_layout.count())):
-            widget = self.graph_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
-        data = self.fetch_dashboard_data()
-
-        # Summary stats
-        for label, value in [
-            ("Total Categories", data["total_categories"]),
-            ("Total Issued Items", data["total_stockout"]),
-            ("Total Products", data["total_products"]),
-        ]:
-            box = QLabel(f"{label}\n{value}")
-            box.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            box.setStyleSheet("""
-                QLabel {
-                    background-color: rgb(80, 80, 80);
-                    color: white;
-                    border-radius: 10px;
-                    padding: 10px;
-                    font-size: 16px;
-                }
-            """)
-            self.summary_layout.addWidget(box)
-
-        # Graphs
-        from matplotlib import pyplot as plt
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-
-        # Pie Chart – Category Distribution
-        fig1, ax1 = plt.subplots(figsize=(3.8, 3.8))
-        categories, counts = zip(*data["category_distribution"]) if data["category_distribution"] else ([], [])
-        if categories:
-            ax1.pie(counts, labels=categories, autopct='%1.1f%%', startangle=90)
-            ax1.set_title("Category Distribution", fontsize=10)
-        else:
-            ax1.text(0.5, 0.5, "No Data", ha='center', va='center')
-        self.graph_layout.addWidget(FigureCanvas(fig1))
-        plt.close(fig1)
-
-        # Bar Graph – Top 5 Products by Quantity
-        fig2, ax2 = plt.subplots(figsize=(4.5, 2.2))
-        fig2.tight_layout(pad=2.0)
-        product_names, quantities = zip(*data["top_products"]) if data["top_products"] else ([], [])
-        if product_names:
-            bars = ax2.bar(product_names, quantities)
-            ax2.set_title("Top 5 Products by Quantity", fontsize=10)
-            ax2.set_xticks(range(len(product_names)))
-            ax2.set_xticklabels(product_names, rotation=30, ha='right', fontsize=7)
-            for bar in bars:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width() / 2, height + 0.5, str(int(height)),
-                         ha='center', va='bottom', fontsize=7, color='white')
-        else:
-            ax2.text(0.5, 0.5, "No Data", ha='center', va='center')
-        self.graph_layout.addWidget(FigureCanvas(fig2))
-        plt.close(fig2)
-
-        # Line Chart – Stock Movement Trend
-        fig3, ax3 = plt.subplots(figsize=(4.5, 3.8))
-        ax3.plot(data["stock_movement"]["labels"], data["stock_movement"]["stockin"], marker='o', label="Stock In")
-        ax3.plot(data["stock_movement"]["labels"], data["stock_movement"]["stockout"], marker='o', label="Stock Out")
-        ax3.set_title("Stock Movement Trend", fontsize=10)
-        ax3.legend()
-        self.graph_layout.addWidget(FigureCanvas(fig3))
-        plt.close(fig3)
-
-        # Update Low Stock Table
-        low_stock_data = data["low_stock_products"]
-        self.low_stock_table.setRowCount(len(low_stock_data))
-        for row, (product_name, type_name, quantity, reorder_level) in enumerate(low_stock_data):
-            self.low_stock_table.setItem(row, 0, QTableWidgetItem(product_name))
-            self.low_stock_table.setItem(row, 1, QTableWidgetItem(type_name))
-
-            qty_item = QTableWidgetItem(str(quantity))
-            if quantity <= reorder_level:
-                qty_item.setForeground(QColor("red"))
-            elif quantity <= reorder_level + 5:
-                qty_item.setForeground(QColor("orange"))
-            self.low_stock_table.setItem(row, 2, qty_item)
-            self.low_stock_table.setItem(row, 3, QTableWidgetItem(str(reorder_level)))
-
-    def fetch_dashboard_data(self):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM category")
-        total_categories = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM products")
-        total_products = cursor.fetchone()[0]
-        cursor.execute("SELECT IFNULL(SUM(Quantity), 0) FROM stockout")
-        total_stockout = cursor.fetchone()[0]
-        cursor.execute("""
-            SELECT c.CategoryName, COUNT(p.ProductID)
-            FROM category c
-            JOIN type t ON c.CategoryID = t.CategoryID
-            JOIN products p ON t.TypeID = p.TypeID
-            GROUP BY c.CategoryName
-        """)
-        category_distribution = cursor.fetchall()
-        cursor.execute("""
-            SELECT ProductName, Quantity
-            FROM products
-            ORDER BY Quantity DESC LIMIT 5
-        """)
-        top_products = cursor.fetchall()
-        cursor.execute("""
-            SELECT p.ProductID,
-                   IFNULL(SUM(si.Quantity), 0) AS StockIn,
-                   IFNULL(SUM(so.Quantity), 0) AS StockOut
-            FROM products p
-            LEFT JOIN stockin si ON p.ProductID = si.ProductID
-            LEFT JOIN stockout so ON p.ProductID = so.ProductID
-            GROUP BY p.ProductID
-            ORDER BY p.ProductID ASC
-        """)
-        rows = cursor.fetchall()
-        labels = [str(r[0]) for r in rows]
-        stockin = [r[1] for r in rows]
-        stockout = [r[2] for r in rows]
-        cursor.execute("""
-            SELECT p.ProductName, t.TypeName, p.Quantity, p.ReorderLevel
-            FROM products p
-            JOIN type t ON p.TypeID = t.TypeID
-            WHERE p.Quantity <= p.ReorderLevel + 5
-            ORDER BY p.Quantity ASC
-        """)
-        low_stock_products = cursor.fetchall()
-        cursor.close()
-        return {
-            "total_categories": total_categories,
-            "total_products": total_products,
-            "total_stockout": total_stockout,
-            "category_distribution": category_distribution,
-            "top_products": top_products,
-            "stock_movement": {
-                "labels": labels,
-                "stockin": stockin,
-                "stockout": stockout,
-            },
-            "low_stock_products": low_stock_products,
-        }
 class StaffDashboard(QWidget):
-    def __init__(self, login_widget, username, conn):
+    def __init__(self, login_widget, username, pool):
         super().__init__()
         self.login_widget = login_widget
         self.username = username
-        self.conn = conn
+        self.pool = pool
+        self.refs = reference_cache(pool)
+        self.audit = audit_writer(pool)
+        # Started before any panel loads so nothing committed in between is missed
+        self.change_feed = ChangeFeed(pool, self)
+        self.change_feed.changed.connect(self.apply_changes)
+        self.change_feed.start()
+        self.alerts = AlertEngine(pool, self)
+        self.alerts.start()
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT AccountID FROM accounts WHERE UserName=%s", (self.username,))
-            result = cursor.fetchone()
-            cursor.close()
-            if result:
-                self.current_user_id = result[0]
-            else:
-                self.current_user_id = None
+            self.current_user_id = self.refs.account_id(self.username)
         except Exception as e:
             QMessageBox.critical(self, "Database Error", str(e))
             self.current_user_id = None
@@ -331,17 +94,15 @@ class StaffDashboard(QWidget):
         self.topPanel.setStyleSheet("background-color: rgb(70, 70, 70)")
 
 
+        # Low stock notifications
+        self.alert_tray = AlertTray(self.alerts, self.topPanel)
+        self.alert_tray.setGeometry(960, 30, 180, 40)
+
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT fname, lname FROM accounts WHERE username=%s",
-                (self.username,)
-            )
-            result = cursor.fetchone()
-            cursor.close()
-
-            if result:
-                fname, lname = result
+            account = self.refs.account(self.username)
+
+            if account:
+                fname, lname = account[2:4]
                 title_label = QLabel(f"CompForge Inventory Staff: {fname} {lname}", self.topPanel)
                 title_label.setGeometry(20, 30, 500, 40)
                 title_label.setStyleSheet("color: white; font-size: 24px; font-weight: bold;")
@@ -372,7 +133,7 @@ class StaffDashboard(QWidget):
     def show_dashboard_panel(self):
         self.hide_all_panels()
         if not self.dashboard_panel:
-            self.dashboard_panel = DashboardPanel(self.conn, self.analyticPanel)
+            self.dashboard_panel = DashboardPanel(self.pool, self.alerts, self.analyticPanel)
         self.dashboard_panel.show()
 
     def show_inventory_panel(self):
@@ -425,17 +186,20 @@ class StaffDashboard(QWidget):
             self.search_btn.clicked.connect(self.search_product)
 
             # Table setup
-            self.table = QTableWidget(self.inventory_panel)
+            self.table = QTableView(self.inventory_panel)
             self.table.setGeometry(20, 100, 1100, 350)
             # Table setup
-            self.table.setColumnCount(9)
-            self.table.setHorizontalHeaderLabels([
-                "ProductID", "ProductName", "Type", "Supplier",
-                "Price", "Stock", "Total", "ReorderLevel", "DateSupplied"
-            ])
+            self.product_model = ProductTableModel(
+                INVENTORY_COLUMNS, self,
+                page_source=lambda after_id, limit: self.pool.run(fetch_product_page, INVENTORY_SELECT, after_id, limit))
+            self.table.setModel(self.product_model)
+            self.search_controller = SearchController(self.product_model, self.pool, self)
+            self.search_controller.failed.connect(
+                lambda message: QMessageBox.critical(self, "Database Error", message))
+            self.search_controller.load_index()
             self.table.setColumnWidth(1, 200)
             self.table.setStyleSheet("""
-                QTableWidget {
+                QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -547,10 +311,15 @@ class StaffDashboard(QWidget):
             self.stock_out_btn.setGeometry(500, 60, 150, 30)
             self.stock_out_btn.clicked.connect(self.stock_out)
 
+            self.batch_stock_btn = QPushButton("Batch In/Out", self.inventory_panel)
+            self.batch_stock_btn.setGeometry(670, 60, 150, 30)
+            self.batch_stock_btn.clicked.connect(self.batch_stock)
+
             # Shared button style
             for btn in [
                 self.stock_in_btn,
                 self.stock_out_btn,
+                self.batch_stock_btn,
             ]:
                 btn.setStyleSheet("""
                     QPushButton {
@@ -584,35 +353,49 @@ class StaffDashboard(QWidget):
         # -----------------------------------------------------
 
     def load_products(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-                       SELECT p.ProductID,
-                              p.ProductName,
-                              t.TypeName,
-                              s.SupplierName,
-                              p.Price,
-                              p.Quantity,
-                              p.Total,
-                              p.ReorderLevel,
-                              p.DateSupplied
-                       FROM products AS p
-                                LEFT JOIN type AS t ON p.TypeID = t.TypeID
-                                LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
-                       """)
-        rows = cursor.fetchall()
-        cursor.close()
-
-        self.table.setRowCount(0)
-        self.table.setHorizontalHeaderLabels([
-            "Product ID", "Product Name", "Type", "Supplier",
-            "Price", "Stock", "Total", "Reorder Level", "Date Supplied"
-        ])
-
-        for row_data in rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            for column, data in enumerate(row_data):
-                self.table.setItem(row, column, QTableWidgetItem(str(data)))
+        # Only the first keyset page is fetched here, the view pulls the rest while scrolling
+        self.product_model.reload()
+
+    def apply_product_rows(self, rows):
+        # Patch just the rows a write returned into the table and the search index
+        searching = bool(self.search_bar.text().strip())
+        for row in rows:
+            if row is not None:
+                self.product_model.upsert_row(row, insert=not searching)
+                self.search_controller.index_upsert(row)
+
+    def apply_changes(self, changes):
+        # Deltas committed by any terminal since the last poll of the change feed
+        if SUPPLIER in changes:
+            self.refs.invalidate("suppliers")
+        if ACCOUNT in changes:
+            self.refs.invalidate("accounts")
+        products = changes.get(PRODUCT)
+        if not products:
+            return
+        self.alerts.apply_changes(products)
+        if self.dashboard_panel:
+            self.dashboard_panel.apply_changes()
+        if self.inventory_panel is None:
+            return
+        if RELOAD in products.values():
+            self.load_products()
+            self.search_controller.load_index()
+            return
+        for product_id, action in products.items():
+            if action == DELETE:
+                self.product_model.remove_key(product_id)
+                self.search_controller.index_remove(product_id)
+        try:
+            rows = self.pool.run(fetch_products, [pid for pid, action in products.items() if action == UPSERT])
+        except Exception as e:
+            print("Error:", e)
+            return
+        self.apply_product_rows(rows)
+
+    def closeEvent(self, event):
+        self.change_feed.stop()
+        super().closeEvent(event)
 
         # -----------------------------------------------------
         # SEARCH PRODUCT
@@ -623,44 +406,12 @@ class StaffDashboard(QWidget):
 
         # If search bar is empty, reload all products
         if keyword == "":
+            self.search_controller.cancel()
             self.load_products()
             return
 
-        cursor = self.conn.cursor()
-        query = """
-                SELECT p.ProductID, \
-                       p.ProductName, \
-                       t.TypeName, \
-                       s.SupplierName, \
-                       p.Price, \
-                       p.Quantity, \
-                       p.Total, \
-                       p.ReorderLevel
-                FROM products AS p
-                         LEFT JOIN type AS t ON p.TypeID = t.TypeID
-                         LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
-                WHERE CAST(p.ProductID AS CHAR) LIKE %s
-                   OR p.ProductName LIKE %s
-                   OR t.TypeName LIKE %s
-                   OR s.SupplierName LIKE %s \
-                """
-        # We use CAST(ProductID AS CHAR) so we can search it as text
-        cursor.execute(query, (
-            f"%{keyword}%",
-            f"%{keyword}%",
-            f"%{keyword}%",
-            f"%{keyword}%"
-        ))
-        rows = cursor.fetchall()
-        cursor.close()
-
-        # Clear table and show results
-        self.table.setRowCount(0)
-        for row_data in rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            for column, data in enumerate(row_data):
-                self.table.setItem(row, column, QTableWidgetItem(str(data)))
+        # Debounced; the query runs on a worker thread and streams into the model
+        self.search_controller.search(keyword)
 
         # -----------------------------------------------------
         # ADD PRODUCT (placeholder)
@@ -1179,7 +930,7 @@ class StaffDashboard(QWidget):
             QPushButton { background-color: rgb(50,150,200); color: white; font-weight: bold; border-radius: 6px; padding: 6px; }
             QPushButton:hover { background-color: rgb(70,170,220); }
             QPushButton:pressed { background-color: rgb(30,130,180); }
-            QTableWidget {
+            QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -1274,10 +1025,11 @@ class StaffDashboard(QWidget):
         layout.addWidget(top_panel)
 
         # === Product Table ===
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels(
-            ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level"])
+        table = QTableView()
+        model = ProductTableModel(
+            STOCK_COLUMNS, dialog,
+            page_source=lambda after_id, limit: self.pool.run(fetch_product_page, STOCK_SELECT, after_id, limit))
+        table.setModel(model)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -1288,59 +1040,26 @@ class StaffDashboard(QWidget):
         layout.addWidget(table)
 
         # Load products
-        cursor = self.conn.cursor()
-        cursor.execute("""
-                       SELECT p.ProductID,
-                              p.ProductName,
-                              t.TypeName,
-                              s.SupplierName,
-                              p.Quantity,
-                              p.Price,
-                              p.ReorderLevel
-                       FROM products AS p
-                                LEFT JOIN type AS t ON p.TypeID = t.TypeID
-                                LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
-                       """)
-        rows = cursor.fetchall()
-        cursor.close()
-
-        table.setRowCount(0)
-        for row_data in rows:
-            row = table.rowCount()
-            table.insertRow(row)
-            for col, data in enumerate(row_data):
-                table.setItem(row, col, QTableWidgetItem(str(data)))
+        model.reload()
 
         # === Table selection updates top panel ===
         def update_top_panel():
-            row = table.currentRow()
+            row = table.currentIndex().row()
             if row == -1:
                 for f in fields.values():
                     f.clear()
                 return
             for i, key in enumerate(
-                    ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level"]):
-                fields[key].setText(table.item(row, i).text())
-
-            # Fetch DateSupplied from DB
-            product_id = table.item(row, 0).text()
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT DateSupplied, Quantity*Price FROM products WHERE ProductID=%s", (product_id,))
-                result = cursor.fetchone()
-                cursor.close()
-                if result:
-                    date_supplied, total = result
-                    fields["Date Supplied"].setText(str(date_supplied))
-                    fields["Total"].setText(f"{total:.2f}")
-            except Exception as e:
-                QMessageBox.critical(dialog, "Database Error", str(e))
+                    ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level",
+                     "Date Supplied"]):
+                fields[key].setText(model.text(row, i))
+            fields["Total"].setText(f"{model.value(row, 4) * model.value(row, 5):.2f}")
 
-        table.itemSelectionChanged.connect(update_top_panel)
+        table.selectionModel().selectionChanged.connect(update_top_panel)
 
         # === Confirm Stock In ===
         def confirm_stock_in():
-            row = table.currentRow()
+            row = table.currentIndex().row()
             if row == -1:
                 QMessageBox.warning(dialog, "Warning", "Select a product from the table first.")
                 return
@@ -1357,31 +1076,14 @@ class StaffDashboard(QWidget):
                 QMessageBox.warning(dialog, "Input Error", "Quantity must be a positive integer.")
                 return
 
-            product_id = table.item(row, 0).text()
-            current_qty = int(fields["Quantity"].text())
-            new_qty = current_qty + qty_received
-            new_total = float(fields["Price"].text()) * new_qty
-            new_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            product_id = model.text(row, 0)
 
             try:
-                # --- Update products table ---
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                               UPDATE products
-                               SET Quantity=%s,
-                                   Total=%s,
-                                   DateSupplied=%s
-                               WHERE ProductID = %s
-                               """, (new_qty, new_total, new_date, product_id))
-
-                # --- Insert into stockin table ---
-                cursor.execute("""
-                               INSERT INTO stockin (ProductID, AccountID, Quantity)
-                               VALUES (%s, %s, %s)
-                               """, (product_id, self.current_user_id, qty_received))  # <-- Use your logged-in staff's AccountID
-
-                self.conn.commit()
-                cursor.close()
+                with self.pool.transaction() as conn:
+                    new_qty = Stock.stock_in(conn, product_id, self.current_user_id, qty_received)
+                    product_row = fetch_product(conn, product_id)
+                self.audit.log(self.current_user_id, int(product_id),
+                               f"Stock in: {qty_received} received, {new_qty} on hand")
 
                 # Success message
                 msg = QMessageBox(dialog)
@@ -1397,7 +1099,7 @@ class StaffDashboard(QWidget):
                 msg.exec()
 
                 dialog.accept()
-                self.load_products()
+                self.apply_product_rows([product_row])
             except Exception as e:
                 QMessageBox.critical(dialog, "Database Error", str(e))
 
@@ -1428,7 +1130,7 @@ class StaffDashboard(QWidget):
             QPushButton { background-color: rgb(50,150,200); color: white; font-weight: bold; border-radius: 6px; padding: 6px; }
             QPushButton:hover { background-color: rgb(70,170,220); }
             QPushButton:pressed { background-color: rgb(30,130,180); }
-            QTableWidget {
+            QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -1521,11 +1223,11 @@ class StaffDashboard(QWidget):
         layout.addWidget(top_panel)
 
         # === Product Table ===
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels(
-            ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level"]
-        )
+        table = QTableView()
+        model = ProductTableModel(
+            STOCK_COLUMNS, dialog,
+            page_source=lambda after_id, limit: self.pool.run(fetch_product_page, STOCK_SELECT, after_id, limit))
+        table.setModel(model)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -1536,59 +1238,27 @@ class StaffDashboard(QWidget):
         layout.addWidget(table)
 
         # === Load products ===
-        cursor = self.conn.cursor()
-        cursor.execute("""
-                       SELECT p.ProductID,
-                              p.ProductName,
-                              t.TypeName,
-                              s.SupplierName,
-                              p.Quantity,
-                              p.Price,
-                              p.ReorderLevel
-                       FROM products AS p
-                                LEFT JOIN type AS t ON p.TypeID = t.TypeID
-                                LEFT JOIN suppliers AS s ON p.SupplierID = s.SupplierID
-                       """)
-        rows = cursor.fetchall()
-        cursor.close()
-
-        table.setRowCount(0)
-        for row_data in rows:
-            row = table.rowCount()
-            table.insertRow(row)
-            for col, data in enumerate(row_data):
-                table.setItem(row, col, QTableWidgetItem(str(data)))
+        model.reload()
 
         # === Update top panel on selection ===
         def update_top_panel():
-            row = table.currentRow()
+            row = table.currentIndex().row()
             if row == -1:
                 for f in fields.values():
                     f.clear()
                 return
 
             for i, key in enumerate(
-                    ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level"]):
-                fields[key].setText(table.item(row, i).text())
+                    ["ProductID", "ProductName", "Type", "Supplier", "Quantity", "Price", "Reorder Level",
+                     "Date Supplied"]):
+                fields[key].setText(model.text(row, i))
+            fields["Total"].setText(f"{model.value(row, 4) * model.value(row, 5):.2f}")
 
-            product_id = table.item(row, 0).text()
-            try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT DateSupplied, Quantity*Price FROM products WHERE ProductID=%s", (product_id,))
-                result = cursor.fetchone()
-                cursor.close()
-                if result:
-                    date_supplied, total = result
-                    fields["Date Supplied"].setText(str(date_supplied))
-                    fields["Total"].setText(f"{total:.2f}")
-            except Exception as e:
-                QMessageBox.critical(dialog, "Database Error", str(e))
-
-        table.itemSelectionChanged.connect(update_top_panel)
+        table.selectionModel().selectionChanged.connect(update_top_panel)
 
         # === Confirm Stock Out ===
         def confirm_stock_out():
-            row = table.currentRow()
+            row = table.currentIndex().row()
             if row == -1:
                 QMessageBox.warning(dialog, "Warning", "Select a product from the table first.")
                 return
@@ -1605,46 +1275,17 @@ class StaffDashboard(QWidget):
                 QMessageBox.warning(dialog, "Input Error", "Quantity must be a positive integer.")
                 return
 
-            product_id = table.item(row, 0).text()
-            current_qty = int(fields["Quantity"].text())
-
-            if qty_issued > current_qty:
-                QMessageBox.warning(dialog, "Input Error", "Cannot issue more than current stock.")
+            product_id = model.text(row, 0)
+            if self.current_user_id is None:
+                QMessageBox.warning(dialog, "Warning", "Unable to find current user account.")
                 return
 
-            new_qty = current_qty - qty_issued
-            new_total = float(fields["Price"].text()) * new_qty
-            date_issued = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
             try:
-                cursor = self.conn.cursor()
-
-                # Update products
-                cursor.execute("""
-                    UPDATE products
-                    SET Quantity=%s,
-                        Total=%s,
-                        DateSupplied=%s
-                    WHERE ProductID = %s
-                """, (new_qty, new_total, date_issued, product_id))
-
-                # Get the current user’s AccountID
-                cursor.execute("SELECT AccountID FROM accounts WHERE Username = %s", (self.username,))
-                account = cursor.fetchone()
-                if account:
-                    account_id = account[0]
-
-                    cursor.execute("""
-                        INSERT INTO stockout (ProductID, AccountID, Quantity)
-                        VALUES (%s, %s, %s)
-                    """, (product_id, account_id, qty_issued))
-                else:
-                    QMessageBox.warning(dialog, "Warning", "Unable to find current user account.")
-                    cursor.close()
-                    return
-
-                self.conn.commit()
-                cursor.close()
+                with self.pool.transaction() as conn:
+                    new_qty = Stock.stock_out(conn, product_id, self.current_user_id, qty_issued)
+                    product_row = fetch_product(conn, product_id)
+                self.audit.log(self.current_user_id, int(product_id),
+                               f"Stock out: {qty_issued} issued, {new_qty} on hand")
 
                 # Success message
                 msg = QMessageBox(dialog)
@@ -1660,8 +1301,10 @@ class StaffDashboard(QWidget):
                 msg.exec()
 
                 dialog.accept()
-                self.load_products()
+                self.apply_product_rows([product_row])
 
+            except StockError as e:
+                QMessageBox.warning(dialog, "Input Error", str(e))
             except Exception as e:
                 QMessageBox.critical(dialog, "Database Error", str(e))
 
@@ -1677,6 +1320,12 @@ class StaffDashboard(QWidget):
 
         dialog.exec()
 
+    def batch_stock(self):
+        dialog = BatchStockDialog(self.pool, self.current_user_id, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        self.apply_product_rows(dialog.rows)
+
     def show_category_panel(self):
         self.hide_all_panels()
 
@@ -1692,7 +1341,7 @@ class StaffDashboard(QWidget):
 
             # === Common table style ===
             table_style = """
-                QTableWidget {
+                QTableView {
                     color: black;
                     background-color: #f8f9fa;
                     alternate-background-color: #e9ecef;
@@ -1804,11 +1453,10 @@ class StaffDashboard(QWidget):
             self.type_table.verticalHeader().setVisible(False)
 
             # === Product Table ===
-            self.product_table = QTableWidget(self.category_panel)
+            self.product_table = QTableView(self.category_panel)
             self.product_table.setGeometry(660, 60, 460, 420)
-            self.product_table.setColumnCount(5)
-            self.product_table.setHorizontalHeaderLabels(
-                ["ProductID", "ProductName", "Price", "Quantity", "ReorderLevel"])
+            self.product_table_model = ProductTableModel(CATEGORY_PRODUCT_COLUMNS, self)
+            self.product_table.setModel(self.product_table_model)
             self.product_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
             self.product_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
             self.product_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -1819,10 +1467,7 @@ class StaffDashboard(QWidget):
 
             # === Load categories from DB ===
             try:
-                cursor = self.conn.cursor()
-                cursor.execute("SELECT CategoryID, CategoryName FROM category ORDER BY CategoryName")
-                categories = cursor.fetchall()
-                cursor.close()
+                categories = self.refs.categories()
 
                 self.category_table.setRowCount(0)
                 for row_data in categories:
@@ -1838,18 +1483,14 @@ class StaffDashboard(QWidget):
                 row = self.category_table.currentRow()
                 if row == -1:
                     self.type_table.setRowCount(0)
-                    self.product_table.setRowCount(0)
+                    self.product_table_model.clear()
                     return
                 category_id = self.category_table.item(row, 0).text()
                 try:
-                    cursor = self.conn.cursor()
-                    cursor.execute("SELECT TypeID, TypeName FROM type WHERE CategoryID=%s ORDER BY TypeName",
-                                   (category_id,))
-                    types = cursor.fetchall()
-                    cursor.close()
+                    types = self.refs.types(category_id)
 
                     self.type_table.setRowCount(0)
-                    self.product_table.setRowCount(0)
+                    self.product_table_model.clear()
                     for row_data in types:
                         row_idx = self.type_table.rowCount()
                         self.type_table.insertRow(row_idx)
@@ -1864,26 +1505,20 @@ class StaffDashboard(QWidget):
             def type_selected():
                 row = self.type_table.currentRow()
                 if row == -1:
-                    self.product_table.setRowCount(0)
+                    self.product_table_model.clear()
                     return
                 type_id = self.type_table.item(row, 0).text()
                 try:
-                    cursor = self.conn.cursor()
-                    cursor.execute("""
-                                   SELECT ProductID, ProductName, Price, Quantity, ReorderLevel
-                                   FROM products
-                                   WHERE TypeID = %s
-                                   ORDER BY ProductName
-                                   """, (type_id,))
-                    products = cursor.fetchall()
-                    cursor.close()
-
-                    self.product_table.setRowCount(0)
-                    for row_data in products:
-                        row_idx = self.product_table.rowCount()
-                        self.product_table.insertRow(row_idx)
-                        for col, data in enumerate(row_data):
-                            self.product_table.setItem(row_idx, col, QTableWidgetItem(str(data)))
+                    with self.pool.connection() as conn, conn.cursor() as cursor:
+                        cursor.execute("""
+                                       SELECT ProductID, ProductName, Price, Quantity, ReorderLevel
+                                       FROM products
+                                       WHERE TypeID = %s AND RetiredAt IS NULL
+                                       ORDER BY ProductName
+                                       """, (type_id,))
+                        products = cursor.fetchall()
+
+                    self.product_table_model.set_rows(products)
                 except Exception as e:
                     QMessageBox.critical(self, "Database Error", str(e))
 
@@ -2113,16 +1748,10 @@ class StaffDashboard(QWidget):
     def show_account_panel(self):
         self.hide_all_panels()
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT username, fname, lname, role FROM accounts WHERE username=%s",
-                (self.username,)
-            )
-            result = cursor.fetchone()
-            cursor.close()
-
-            if result:
-                uname, fname, lname, role = result
+            account = self.refs.account(self.username)
+
+            if account:
+                uname, fname, lname, role = account[1:]
 
                 self.account_panel = QWidget(self.analyticPanel)
                 self.account_panel.setGeometry(10, 10, 1140, 500)
@@ -0,0 +1,293 @@
+from datetime import date, datetime, timedelta
+import pymysql
+import Summary
+from Changes import PRODUCT, record_change, record_changes
+
+# ---------------------------
+# Stock movement ledger
+# ---------------------------
+# stockin and stockout rows carry a MovedAt timestamp. (ProductID, MovedAt)
+# serves per-product history and MovedAt alone serves windows over every
+# product, so trend queries only read the rows inside their window.
+# (AccountID, MovedAt) serves the reports filtered by user.
+LEDGERS = ("stockin", "stockout")
+
+LEDGER_INDEXES = [
+    ("ProductID_MovedAt", "ProductID, MovedAt"),
+    ("MovedAt", "MovedAt"),
+    ("AccountID_MovedAt", "AccountID, MovedAt"),
+]
+
+# SQL for the first day of the bucket a movement falls in (weeks start on Monday).
+BUCKET_STARTS = {
+    "day": "DATE(MovedAt)",
+    "week": "DATE_SUB(DATE(MovedAt), INTERVAL WEEKDAY(MovedAt) DAY)",
+    "month": "DATE_SUB(DATE(MovedAt), INTERVAL DAYOFMONTH(MovedAt) - 1 DAY)",
+}
+
+
+def ensure_ledger(conn):
+    """Add MovedAt and the ledger indexes to ledgers created before they existed.
+
+    Rows that predate the column are stamped with the time of the upgrade.
+    """
+    with conn.cursor() as cursor:
+        for table in LEDGERS:
+            cursor.execute("""
+                SELECT COUNT(*) FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = 'MovedAt'
+            """, (table,))
+            changes = []
+            if not cursor.fetchone()[0]:
+                changes.append("ADD COLUMN MovedAt datetime NOT NULL DEFAULT current_timestamp()")
+            cursor.execute("""
+                SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+            """, (table,))
+            existing = {name for name, in cursor.fetchall()}
+            changes += [f"ADD KEY {name} ({columns})" for name, columns in LEDGER_INDEXES if name not in existing]
+            if changes:
+                cursor.execute(f"ALTER TABLE {table} " + ", ".join(changes))
+
+
+class StockError(Exception):
+    pass
+
+
+# ---------------------------
+# Stock movements
+# ---------------------------
+# The balance is adjusted on the server (Quantity = Quantity +/- n) rather
+# than written back from what the dialog last displayed, so concurrent
+# terminals cannot overwrite each other. Call these inside
+# pool.transaction() so the ledger row commits together with the balance.
+def stock_in(conn, product_id, account_id, quantity):
+    """Receive ``quantity`` units and return the new on-hand quantity."""
+    return _move(conn, "stockin", product_id, account_id, quantity)
+
+
+def stock_out(conn, product_id, account_id, quantity):
+    """Issue ``quantity`` units and return the new on-hand quantity.
+
+    Raises StockError, changing nothing, if fewer than ``quantity`` are on hand.
+    """
+    balance = _move(conn, "stockout", product_id, account_id, quantity)
+    with conn.cursor() as cursor:
+        Summary.stock_issued(cursor, quantity)
+    return balance
+
+
+# LAST_INSERT_ID(expr) hands the new balance back in the OK packet, so no
+# SELECT is needed to report it. MySQL assigns left to right, so Total is
+# computed from the updated Quantity.
+BALANCE_UPDATES = {
+    "stockin": """
+        UPDATE products
+        SET Quantity = LAST_INSERT_ID(Quantity + %(quantity)s),
+            Total = Price * Quantity,
+            DateSupplied = NOW()
+        WHERE ProductID = %(product_id)s AND RetiredAt IS NULL
+    """,
+    "stockout": """
+        UPDATE products
+        SET Quantity = LAST_INSERT_ID(Quantity - %(quantity)s),
+            Total = Price * Quantity,
+            DateSupplied = NOW()
+        WHERE ProductID = %(product_id)s AND RetiredAt IS NULL AND Quantity >= %(quantity)s
+    """,
+}
+
+
+def _move(conn, ledger, product_id, account_id, quantity):
+    with conn.cursor() as cursor:
+        cursor.execute(BALANCE_UPDATES[ledger], {"quantity": quantity, "product_id": product_id})
+        changed = cursor.rowcount
+        if changed != 1:
+            cursor.execute("SELECT Quantity FROM products WHERE ProductID = %s AND RetiredAt IS NULL",
+                           (product_id,))
+            row = cursor.fetchone()
+            if row is None:
+                raise StockError(f"Product {product_id} no longer exists or has been retired.")
+            if ledger == "stockout":
+                raise StockError(f"Cannot issue more than current stock ({row[0]} on hand).")
+            raise StockError(f"Stock of product {product_id} was not updated ({changed} rows changed).")
+        balance = cursor.lastrowid
+        cursor.execute(f"INSERT INTO {ledger} (ProductID, AccountID, Quantity) VALUES (%s, %s, %s)",
+                       (product_id, account_id, quantity))
+        record_change(cursor, PRODUCT, product_id)
+    return balance
+
+
+# ---------------------------
+# Batch movements
+# ---------------------------
+# A batch is a list of (product_id, quantity) lines applied in one
+# transaction: the per-product totals go into a session-local table, one
+# UPDATE ... JOIN adjusts every balance and one executemany writes the
+# ledger rows, instead of a round trip pair per line.
+BATCH_TABLE = """
+    CREATE TEMPORARY TABLE IF NOT EXISTS stock_batch (
+        ProductID int(11) NOT NULL PRIMARY KEY,
+        Quantity int(11) NOT NULL
+    ) ENGINE=MEMORY
+"""
+
+BATCH_SIGNS = {"stockin": "+", "stockout": "-"}
+
+
+def stock_in_batch(conn, account_id, lines):
+    """Receive every (product_id, quantity) line and return {product_id: new quantity}."""
+    return _move_batch(conn, "stockin", account_id, lines)
+
+
+def stock_out_batch(conn, account_id, lines):
+    """Issue every (product_id, quantity) line and return {product_id: new quantity}.
+
+    Raises StockError, changing nothing, if any product is short; the message
+    lists every short product, not just the first.
+    """
+    balances = _move_batch(conn, "stockout", account_id, lines)
+    with conn.cursor() as cursor:
+        Summary.stock_issued(cursor, sum(quantity for _, quantity in lines))
+    return balances
+
+
+def batch_totals(lines):
+    """Sum the quantities of repeated products, keeping first-seen order."""
+    totals = {}
+    for product_id, quantity in lines:
+        if quantity <= 0:
+            raise StockError(f"Quantity for product {product_id} must be a positive integer.")
+        totals[int(product_id)] = totals.get(int(product_id), 0) + quantity
+    return totals
+
+
+def _move_batch(conn, ledger, account_id, lines):
+    totals = batch_totals(lines)
+    if not totals:
+        raise StockError("The batch has no lines.")
+    with conn.cursor() as cursor:
+        cursor.execute(BATCH_TABLE)
+        cursor.execute("DELETE FROM stock_batch")
+        try:
+            cursor.executemany("INSERT INTO stock_batch (ProductID, Quantity) VALUES (%s, %s)",
+                               list(totals.items()))
+            # Lock the rows first so the check and the update see the same balances
+            cursor.execute("""
+                SELECT b.ProductID, p.Quantity
+                FROM stock_batch b
+                LEFT JOIN products p ON p.ProductID = b.ProductID AND p.RetiredAt IS NULL
+                FOR UPDATE
+            """)
+            on_hand = dict(cursor.fetchall())
+            _check_batch(ledger, totals, on_hand)
+
+            cursor.execute(f"""
+                UPDATE products p
+                JOIN stock_batch b ON p.ProductID = b.ProductID
+                SET p.Quantity = p.Quantity {BATCH_SIGNS[ledger]} b.Quantity,
+                    p.DateSupplied = NOW()
+            """)
+            # Multi-table UPDATE does not promise left-to-right assignment, so
+            # Total is recomputed from the stored Quantity in its own statement.
+            cursor.execute("""
+                UPDATE products p
+                JOIN stock_batch b ON p.ProductID = b.ProductID
+                SET p.Total = p.Price * p.Quantity
+            """)
+            cursor.executemany(f"INSERT INTO {ledger} (ProductID, AccountID, Quantity) VALUES (%s, %s, %s)",
+                               [(product_id, account_id, quantity) for product_id, quantity in lines])
+            record_changes(cursor, PRODUCT, list(totals))
+            cursor.execute("""
+                SELECT p.ProductID, p.Quantity
+                FROM products p
+                JOIN stock_batch b ON p.ProductID = b.ProductID
+            """)
+            balances = dict(cursor.fetchall())
+        finally:
+            try:
+                cursor.execute("DELETE FROM stock_batch")
+            except pymysql.MySQLError:
+                # Lost with the connection; the original error matters, and
+                # the next batch on this session clears the table first anyway
+                pass
+    return {product_id: balances[product_id] for product_id in totals}
+
+
+def _check_batch(ledger, totals, on_hand):
+    missing = [str(product_id) for product_id in totals if on_hand.get(product_id) is None]
+    if missing:
+        raise StockError(f"Products no longer exist or have been retired: {', '.join(missing)}.")
+    if ledger != "stockout":
+        return
+    short = [f"{product_id} (wants {quantity}, {on_hand[product_id]} on hand)"
+             for product_id, quantity in totals.items() if on_hand[product_id] < quantity]
+    if short:
+        raise StockError("Cannot issue more than current stock:\n" + "\n".join(short))
+
+
+def bucket_start(day, bucket):
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(start, bucket):
+    if bucket == "week":
+        return start + timedelta(weeks=1)
+    if bucket == "month":
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def window_start(bucket, periods, today=None):
+    """First day of a window covering the last ``periods`` buckets up to today."""
+    start = bucket_start(today or date.today(), bucket)
+    for _ in range(periods - 1):
+        start = bucket_start(start - timedelta(days=1), bucket)
+    return start
+
+
+def fetch_movement_trend(conn, bucket="day", start=None, end=None, product_id=None):
+    """Return stock in/out totals per ``bucket`` ("day", "week" or "month").
+
+    The window is ``start`` (inclusive) to ``end`` (exclusive, default: now),
+    optionally for a single product. Buckets without movements are filled
+    with zeros. Result: ``{"buckets": [date, ...], "stockin": [...], "stockout": [...]}``.
+    """
+    if bucket not in BUCKET_STARTS:
+        raise ValueError(f"Unknown bucket {bucket!r}")
+    end = end or datetime.now()
+    start = start or window_start(bucket, 30)
+
+    conditions = "MovedAt >= %s AND MovedAt < %s"
+    params = [start, end]
+    if product_id is not None:
+        conditions = "ProductID = %s AND " + conditions
+        params.insert(0, product_id)
+
+    totals = {}
+    with conn.cursor() as cursor:
+        for table in LEDGERS:
+            cursor.execute(f"""
+                SELECT {BUCKET_STARTS[bucket]} AS Bucket, SUM(Quantity)
+                FROM {table}
+                WHERE {conditions}
+                GROUP BY Bucket
+            """, params)
+            totals[table] = {bucket_day: int(quantity) for bucket_day, quantity in cursor.fetchall()}
+
+    first = bucket_start(start.date() if isinstance(start, datetime) else start, bucket)
+    last = end.date() if isinstance(end, datetime) else end - timedelta(days=1)
+    buckets = []
+    day = first
+    while day <= last:
+        buckets.append(day)
+        day = next_bucket(day, bucket)
+    return {
+        "buckets": buckets,
+        "stockin": [totals["stockin"].get(day, 0) for day in buckets],
+        "stockout": [totals["stockout"].get(day, 0) for day in buckets],
+    }
@@ -0,0 +1,184 @@
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox,
+                             QTableView, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QMessageBox)
+from Models import ProductTableModel, STOCK_COLUMNS
+from Inventory import fetch_product_page, fetch_products, STOCK_SELECT
+import Stock
+from Stock import StockError
+from Audit import audit_writer
+
+# Dialog modes: (label, service function, past-tense verb for the summary)
+BATCH_MODES = [
+    ("Stock In", Stock.stock_in_batch, "received"),
+    ("Stock Out", Stock.stock_out_batch, "issued"),
+]
+
+BATCH_STYLE = """
+    QDialog { background-color: rgb(70,70,70); border-radius: 10px; }
+    QLabel { font-size: 14px; color: white; font-weight: bold; }
+    QLineEdit, QComboBox { color: black; background-color: white; border-radius: 6px; padding: 4px; font-size: 13px; }
+    QPushButton { background-color: rgb(50,150,200); color: white; font-weight: bold; border-radius: 6px; padding: 6px; }
+    QPushButton:hover { background-color: rgb(70,170,220); }
+    QPushButton:pressed { background-color: rgb(30,130,180); }
+    QTableView, QTableWidget {
+        color: black;
+        background-color: #f8f9fa;
+        alternate-background-color: #e9ecef;
+        gridline-color: #b0b0b0;
+        font-size: 13px;
+        selection-background-color: rgb(70,130,250);
+        selection-color: white;
+    }
+    QHeaderView::section {
+        background-color: rgb(50,150,200);
+        color: white;
+        font-weight: bold;
+        border: none;
+        padding: 6px;
+    }
+    QMessageBox {
+        background-color: rgb(40,40,40);
+        color: white;
+        font-size: 14px;
+    }
+    QMessageBox QLabel {
+        color: white;
+    }
+"""
+
+
+class BatchStockDialog(QDialog):
+    """Collect many stock in/out lines and apply them in one transaction.
+
+    After ``exec()`` returns Accepted, ``balances`` maps every touched
+    ProductID to its new quantity and ``rows`` holds their inventory rows.
+    """
+
+    def __init__(self, pool, account_id, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+        self.account_id = account_id
+        self.balances = {}
+        self.rows = []
+        self.lines = []
+
+        self.setWindowTitle("Batch Stock In / Out")
+        self.setFixedSize(800, 650)
+        self.setStyleSheet(BATCH_STYLE)
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+
+        mode_row = QHBoxLayout()
+        mode_row.addWidget(QLabel("Mode:"))
+        self.mode_combo = QComboBox()
+        for label, _, _ in BATCH_MODES:
+            self.mode_combo.addItem(label)
+        mode_row.addWidget(self.mode_combo)
+        mode_row.addStretch()
+        layout.addLayout(mode_row)
+
+        # === Product picker ===
+        self.table = QTableView()
+        self.model = ProductTableModel(
+            STOCK_COLUMNS, self,
+            page_source=lambda after_id, limit: self.pool.run(fetch_product_page, STOCK_SELECT, after_id, limit))
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setFixedHeight(250)
+        layout.addWidget(self.table)
+        self.model.reload()
+
+        add_row = QHBoxLayout()
+        add_row.addWidget(QLabel("Quantity:"))
+        self.qty_input = QLineEdit()
+        self.qty_input.setPlaceholderText("Quantity for the selected product")
+        self.qty_input.returnPressed.connect(self.add_line)
+        add_row.addWidget(self.qty_input)
+        add_btn = QPushButton("Add Line")
+        add_btn.clicked.connect(self.add_line)
+        add_row.addWidget(add_btn)
+        layout.addLayout(add_row)
+
+        # === Batch lines ===
+        self.lines_table = QTableWidget(0, 3)
+        self.lines_table.setHorizontalHeaderLabels(["ProductID", "ProductName", "Quantity"])
+        self.lines_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.lines_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.lines_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.lines_table.verticalHeader().setVisible(False)
+        layout.addWidget(self.lines_table)
+
+        btn_layout = QHBoxLayout()
+        remove_btn = QPushButton("Remove Line")
+        apply_btn = QPushButton("Apply Batch")
+        cancel_btn = QPushButton("Cancel")
+        btn_layout.addWidget(remove_btn)
+        btn_layout.addWidget(apply_btn)
+        btn_layout.addWidget(cancel_btn)
+        remove_btn.clicked.connect(self.remove_line)
+        apply_btn.clicked.connect(self.apply_batch)
+        cancel_btn.clicked.connect(self.reject)
+        layout.addLayout(btn_layout)
+
+    def add_line(self):
+        row = self.table.currentIndex().row()
+        if row == -1:
+            QMessageBox.warning(self, "Warning", "Select a product from the table first.")
+            return
+        try:
+            quantity = int(self.qty_input.text().strip())
+            if quantity <= 0:
+                raise ValueError
+        except ValueError:
+            QMessageBox.warning(self, "Input Error", "Quantity must be a positive integer.")
+            return
+
+        product_id = self.model.value(row, 0)
+        self.lines.append((product_id, quantity))
+        line = self.lines_table.rowCount()
+        self.lines_table.insertRow(line)
+        for column, value in enumerate((product_id, self.model.text(row, 1), quantity)):
+            self.lines_table.setItem(line, column, QTableWidgetItem(str(value)))
+        self.qty_input.clear()
+
+    def remove_line(self):
+        line = self.lines_table.currentRow()
+        if line == -1:
+            return
+        del self.lines[line]
+        self.lines_table.removeRow(line)
+
+    def apply_batch(self):
+        if not self.lines:
+            QMessageBox.warning(self, "Input Error", "Add at least one line to the batch.")
+            return
+        if self.account_id is None:
+            QMessageBox.warning(self, "Error", "Cannot determine the current user.")
+            return
+
+        label, apply, verb = BATCH_MODES[self.mode_combo.currentIndex()]
+        try:
+            with self.pool.transaction() as conn:
+                self.balances = apply(conn, self.account_id, self.lines)
+                self.rows = fetch_products(conn, list(self.balances))
+        except StockError as e:
+            QMessageBox.warning(self, "Input Error", str(e))
+            return
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error", str(e))
+            return
+
+        audit = audit_writer(self.pool)
+        for product_id, quantity in Stock.batch_totals(self.lines).items():
+            audit.log(self.account_id, product_id,
+                      f"{label} (batch): {quantity} {verb}, {self.balances[product_id]} on hand")
+        units = sum(quantity for _, quantity in self.lines)
+        QMessageBox.information(
+            self, "Success",
+            f"{label}: {units} units {verb} across {len(self.balances)} products "
+            f"in {len(self.lines)} lines.")
+        self.accept()
@@ -0,0 +1,124 @@
+# ---------------------------
+# Maintained dashboard counters
+# ---------------------------
+# inventory_summary holds a single row of running totals and category_summary
+# one product count per category. The write paths update both in the same
+# transaction as the change itself, so the dashboard reads a handful of rows
+# instead of aggregating products and stockout on every refresh.
+
+SUMMARY_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS inventory_summary (
+        SummaryID tinyint(4) NOT NULL PRIMARY KEY,
+        TotalProducts int(11) NOT NULL DEFAULT 0,
+        TotalStockOut bigint(20) NOT NULL DEFAULT 0
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS category_summary (
+        CategoryID int(11) NOT NULL PRIMARY KEY,
+        ProductCount int(11) NOT NULL DEFAULT 0
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+    """,
+]
+
+SUMMARY_ID = 1
+
+
+def ensure_summary(conn):
+    """Create the summary tables if needed and fill them on first use."""
+    with conn.cursor() as cursor:
+        for ddl in SUMMARY_TABLES:
+            cursor.execute(ddl)
+        cursor.execute("SELECT 1 FROM inventory_summary WHERE SummaryID = %s", (SUMMARY_ID,))
+        populated = cursor.fetchone() is not None
+    if not populated:
+        rebuild_summary(conn)
+
+
+def rebuild_summary(conn):
+    """Recompute every counter from the base tables."""
+    conn.begin()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                REPLACE INTO inventory_summary (SummaryID, TotalProducts, TotalStockOut)
+                SELECT %s,
+                       (SELECT COUNT(*) FROM products WHERE RetiredAt IS NULL),
+                       (SELECT IFNULL(SUM(Quantity), 0) FROM stockout)
+                           + (SELECT IFNULL(SUM(Quantity), 0) FROM stockout_archive)
+            """, (SUMMARY_ID,))
+            cursor.execute("DELETE FROM category_summary")
+            cursor.execute("""
+                INSERT INTO category_summary (CategoryID, ProductCount)
+                SELECT t.CategoryID, COUNT(p.ProductID)
+                FROM type t
+                JOIN products p ON t.TypeID = p.TypeID
+                WHERE p.RetiredAt IS NULL
+                GROUP BY t.CategoryID
+            """)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _add_to_category(cursor, type_id, delta):
+    cursor.execute("""
+        INSERT INTO category_summary (CategoryID, ProductCount)
+        SELECT CategoryID, %s FROM type WHERE TypeID = %s
+        ON DUPLICATE KEY UPDATE ProductCount = ProductCount + VALUES(ProductCount)
+    """, (delta, type_id))
+
+
+# ---------------------------
+# Write-path hooks
+# ---------------------------
+# Called with the cursor of the transaction making the change.
+def product_added(cursor, type_id):
+    cursor.execute("UPDATE inventory_summary SET TotalProducts = TotalProducts + 1 WHERE SummaryID = %s",
+                   (SUMMARY_ID,))
+    _add_to_category(cursor, type_id, 1)
+
+
+def products_added(cursor, type_counts):
+    """Bulk form of product_added: ``type_counts`` maps TypeID to products added."""
+    cursor.execute("UPDATE inventory_summary SET TotalProducts = TotalProducts + %s WHERE SummaryID = %s",
+                   (sum(type_counts.values()), SUMMARY_ID))
+    for type_id, count in type_counts.items():
+        _add_to_category(cursor, type_id, count)
+
+
+def product_retyped(cursor, product_id, type_id):
+    """Call before the UPDATE that may move ``product_id`` to ``type_id``.
+
+    The row lock holds concurrent edits of the product until this one
+    commits, so each of them sees the type the previous one left.
+    """
+    cursor.execute("SELECT TypeID FROM products WHERE ProductID = %s AND RetiredAt IS NULL FOR UPDATE",
+                   (product_id,))
+    row = cursor.fetchone()
+    if row is None or str(row[0]) == str(type_id):
+        return
+    _add_to_category(cursor, row[0], -1)
+    _add_to_category(cursor, type_id, 1)
+
+
+def product_retired(cursor, product_id):
+    """Call before the product is flagged as retired.
+
+    Its stock-outs stay in the ledger, so TotalStockOut keeps counting them.
+    """
+    cursor.execute("SELECT TypeID FROM products WHERE ProductID = %s AND RetiredAt IS NULL FOR UPDATE",
+                   (product_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return
+    cursor.execute("UPDATE inventory_summary SET TotalProducts = TotalProducts - 1 WHERE SummaryID = %s",
+                   (SUMMARY_ID,))
+    _add_to_category(cursor, row[0], -1)
+
+
+def stock_issued(cursor, quantity):
+    cursor.execute("UPDATE inventory_summary SET TotalStockOut = TotalStockOut + %s WHERE SummaryID = %s",
+                   (quantity, SUMMARY_ID))
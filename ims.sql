@@ -71,6 +71,60 @@ INSERT INTO `category` (`CategoryID`, `CategoryName`) VALUES
 
 -- --------------------------------------------------------
 
+--
+-- Table structure for table `changes`
+--
+
+CREATE TABLE `changes` (
+  `ChangeSeq` bigint(20) NOT NULL,
+  `Entity` varchar(20) NOT NULL,
+  `EntityID` int(11) NOT NULL,
+  `Action` varchar(20) NOT NULL,
+  `ChangedAt` datetime NOT NULL DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `category_summary`
+--
+
+CREATE TABLE `category_summary` (
+  `CategoryID` int(11) NOT NULL,
+  `ProductCount` int(11) NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Dumping data for table `category_summary`
+--
+
+INSERT INTO `category_summary` (`CategoryID`, `ProductCount`) VALUES
+(1, 6),
+(2, 6),
+(3, 2),
+(4, 3);
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `inventory_summary`
+--
+
+CREATE TABLE `inventory_summary` (
+  `SummaryID` tinyint(4) NOT NULL,
+  `TotalProducts` int(11) NOT NULL DEFAULT 0,
+  `TotalStockOut` bigint(20) NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Dumping data for table `inventory_summary`
+--
+
+INSERT INTO `inventory_summary` (`SummaryID`, `TotalProducts`, `TotalStockOut`) VALUES
+(1, 17, 200);
+
+-- --------------------------------------------------------
+
 --
 -- Table structure for table `logs`
 --
@@ -78,7 +132,7 @@ INSERT INTO `category` (`CategoryID`, `CategoryName`) VALUES
 CREATE TABLE `logs` (
   `LogID` int(11) NOT NULL,
   `AccountID` int(11) NOT NULL,
-  `ProductID` int(11) NOT NULL,
+  `ProductID` int(11) DEFAULT NULL,
   `Action` varchar(500) NOT NULL,
   `Date` datetime NOT NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
@@ -98,7 +152,9 @@ CREATE TABLE `products` (
   `Quantity` int(11) NOT NULL,
   `Total` int(11) NOT NULL,
   `ReorderLevel` int(11) NOT NULL,
-  `DateSupplied` datetime NOT NULL
+  `DateSupplied` datetime NOT NULL,
+  `RetiredAt` datetime DEFAULT NULL,
+  `ReorderGap` int(11) GENERATED ALWAYS AS (`Quantity` - `ReorderLevel`) STORED
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 --
@@ -126,6 +182,77 @@ INSERT INTO `products` (`ProductID`, `ProductName`, `TypeID`, `SupplierID`, `Pri
 
 -- --------------------------------------------------------
 
+--
+-- Table structure for table `product_forecast`
+--
+
+CREATE TABLE `product_forecast` (
+  `ProductID` int(11) NOT NULL,
+  `DailyUsage` double NOT NULL,
+  `UsageStdDev` double NOT NULL,
+  `SafetyStock` int(11) NOT NULL,
+  `ReorderPoint` int(11) NOT NULL,
+  `OrderQuantity` int(11) NOT NULL,
+  `ComputedAt` datetime NOT NULL DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `purchase_orders`
+--
+
+CREATE TABLE `purchase_orders` (
+  `OrderID` int(11) NOT NULL,
+  `SupplierID` int(11) NOT NULL,
+  `AccountID` int(11) NOT NULL,
+  `Status` varchar(20) NOT NULL DEFAULT 'Pending',
+  `OrderDate` datetime NOT NULL DEFAULT current_timestamp(),
+  `ExpectedDate` date NOT NULL,
+  `ReceivedAt` datetime DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `purchase_order_lines`
+--
+
+CREATE TABLE `purchase_order_lines` (
+  `OrderID` int(11) NOT NULL,
+  `ProductID` int(11) NOT NULL,
+  `Quantity` int(11) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
+--
+-- Table structure for table `schema_migrations`
+--
+
+CREATE TABLE `schema_migrations` (
+  `Version` int(11) NOT NULL,
+  `Name` varchar(100) NOT NULL,
+  `AppliedAt` datetime NOT NULL DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Dumping data for table `schema_migrations`
+--
+
+INSERT INTO `schema_migrations` (`Version`, `Name`) VALUES
+(1, 'Stock ledger MovedAt and indexes'),
+(2, 'Change feed'),
+(3, 'Audit log indexes'),
+(4, 'Product retirement and ledger archives'),
+(5, 'Dashboard summary counters'),
+(6, 'Hot query indexes'),
+(7, 'Low stock reorder gap'),
+(8, 'Demand forecasts'),
+(9, 'Purchase orders');
+
+-- --------------------------------------------------------
+
 --
 -- Table structure for table `stockin`
 --
@@ -134,7 +261,8 @@ CREATE TABLE `stockin` (
   `StockInID` int(11) NOT NULL,
   `ProductID` int(11) NOT NULL,
   `AccountID` int(11) NOT NULL,
-  `Quantity` int(11) NOT NULL
+  `Quantity` int(11) NOT NULL,
+  `MovedAt` datetime NOT NULL DEFAULT current_timestamp()
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 --
@@ -155,6 +283,20 @@ INSERT INTO `stockin` (`StockInID`, `ProductID`, `AccountID`, `Quantity`) VALUES
 
 -- --------------------------------------------------------
 
+--
+-- Table structure for table `stockin_archive`
+--
+
+CREATE TABLE `stockin_archive` (
+  `StockInID` int(11) NOT NULL,
+  `ProductID` int(11) NOT NULL,
+  `AccountID` int(11) NOT NULL,
+  `Quantity` int(11) NOT NULL,
+  `MovedAt` datetime NOT NULL DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
 --
 -- Table structure for table `stockout`
 --
@@ -163,7 +305,8 @@ CREATE TABLE `stockout` (
   `StockOutID` int(11) NOT NULL,
   `ProductID` int(11) NOT NULL,
   `AccountID` int(11) NOT NULL,
-  `Quantity` int(11) NOT NULL
+  `Quantity` int(11) NOT NULL,
+  `MovedAt` datetime NOT NULL DEFAULT current_timestamp()
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 --
@@ -187,6 +330,20 @@ INSERT INTO `stockout` (`StockOutID`, `ProductID`, `AccountID`, `Quantity`) VALU
 
 -- --------------------------------------------------------
 
+--
+-- Table structure for table `stockout_archive`
+--
+
+CREATE TABLE `stockout_archive` (
+  `StockOutID` int(11) NOT NULL,
+  `ProductID` int(11) NOT NULL,
+  `AccountID` int(11) NOT NULL,
+  `Quantity` int(11) NOT NULL,
+  `MovedAt` datetime NOT NULL DEFAULT current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+
 --
 -- Table structure for table `suppliers`
 --
@@ -261,21 +418,43 @@ INSERT INTO `type` (`TypeID`, `TypeName`, `CategoryID`) VALUES
 -- Indexes for table `accounts`
 --
 ALTER TABLE `accounts`
-  ADD PRIMARY KEY (`AccountID`);
+  ADD PRIMARY KEY (`AccountID`),
+  ADD KEY `UserName` (`UserName`);
 
 --
 -- Indexes for table `category`
 --
 ALTER TABLE `category`
+  ADD PRIMARY KEY (`CategoryID`),
+  ADD KEY `CategoryName` (`CategoryName`);
+
+--
+-- Indexes for table `changes`
+--
+ALTER TABLE `changes`
+  ADD PRIMARY KEY (`ChangeSeq`),
+  ADD KEY `ChangedAt` (`ChangedAt`);
+
+--
+-- Indexes for table `category_summary`
+--
+ALTER TABLE `category_summary`
   ADD PRIMARY KEY (`CategoryID`);
 
+--
+-- Indexes for table `inventory_summary`
+--
+ALTER TABLE `inventory_summary`
+  ADD PRIMARY KEY (`SummaryID`);
+
 --
 -- Indexes for table `logs`
 --
 ALTER TABLE `logs`
   ADD PRIMARY KEY (`LogID`),
-  ADD KEY `AccountID` (`AccountID`),
-  ADD KEY `ProductID` (`ProductID`);
+  ADD KEY `ProductID_Date` (`ProductID`,`Date`),
+  ADD KEY `AccountID_Date` (`AccountID`,`Date`),
+  ADD KEY `Date` (`Date`);
 
 --
 -- Indexes for table `products`
@@ -283,7 +462,39 @@ ALTER TABLE `logs`
 ALTER TABLE `products`
   ADD PRIMARY KEY (`ProductID`),
   ADD KEY `SupplierID` (`SupplierID`),
-  ADD KEY `TypeID` (`TypeID`);
+  ADD KEY `TypeID` (`TypeID`),
+  ADD KEY `Active` (`RetiredAt`,`ProductID`),
+  ADD KEY `Stock` (`RetiredAt`,`Quantity`,`ReorderLevel`),
+  ADD KEY `TypeID_Name` (`TypeID`,`RetiredAt`,`ProductName`),
+  ADD KEY `LowStock` (`RetiredAt`,`ReorderGap`);
+
+--
+-- Indexes for table `product_forecast`
+--
+ALTER TABLE `product_forecast`
+  ADD PRIMARY KEY (`ProductID`);
+
+--
+-- Indexes for table `purchase_orders`
+--
+ALTER TABLE `purchase_orders`
+  ADD PRIMARY KEY (`OrderID`),
+  ADD KEY `Status` (`Status`),
+  ADD KEY `Supplier_Status` (`SupplierID`,`Status`),
+  ADD KEY `Status_Expected` (`Status`,`ExpectedDate`);
+
+--
+-- Indexes for table `purchase_order_lines`
+--
+ALTER TABLE `purchase_order_lines`
+  ADD PRIMARY KEY (`OrderID`,`ProductID`),
+  ADD KEY `ProductID` (`ProductID`);
+
+--
+-- Indexes for table `schema_migrations`
+--
+ALTER TABLE `schema_migrations`
+  ADD PRIMARY KEY (`Version`);
 
 --
 -- Indexes for table `stockin`
@@ -291,26 +502,52 @@ ALTER TABLE `products`
 ALTER TABLE `stockin`
   ADD PRIMARY KEY (`StockInID`),
   ADD KEY `ProductID` (`ProductID`),
-  ADD KEY `AccountID` (`AccountID`);
+  ADD KEY `AccountID` (`AccountID`),
+  ADD KEY `ProductID_MovedAt` (`ProductID`,`MovedAt`),
+  ADD KEY `MovedAt` (`MovedAt`),
+  ADD KEY `AccountID_MovedAt` (`AccountID`,`MovedAt`);
+
+--
+-- Indexes for table `stockin_archive`
+--
+ALTER TABLE `stockin_archive`
+  ADD PRIMARY KEY (`StockInID`),
+  ADD KEY `ProductID_MovedAt` (`ProductID`,`MovedAt`),
+  ADD KEY `MovedAt` (`MovedAt`),
+  ADD KEY `AccountID_MovedAt` (`AccountID`,`MovedAt`);
 
 --
 -- Indexes for table `stockout`
 --
 ALTER TABLE `stockout`
-  ADD PRIMARY KEY (`StockOutID`);
+  ADD PRIMARY KEY (`StockOutID`),
+  ADD KEY `ProductID_MovedAt` (`ProductID`,`MovedAt`),
+  ADD KEY `MovedAt` (`MovedAt`),
+  ADD KEY `AccountID_MovedAt` (`AccountID`,`MovedAt`);
+
+--
+-- Indexes for table `stockout_archive`
+--
+ALTER TABLE `stockout_archive`
+  ADD PRIMARY KEY (`StockOutID`),
+  ADD KEY `ProductID_MovedAt` (`ProductID`,`MovedAt`),
+  ADD KEY `MovedAt` (`MovedAt`),
+  ADD KEY `AccountID_MovedAt` (`AccountID`,`MovedAt`);
 
 --
 -- Indexes for table `suppliers`
 --
 ALTER TABLE `suppliers`
-  ADD PRIMARY KEY (`SupplierID`);
+  ADD PRIMARY KEY (`SupplierID`),
+  ADD KEY `SupplierName` (`SupplierName`);
 
 --
 -- Indexes for table `type`
 --
 ALTER TABLE `type`
   ADD PRIMARY KEY (`TypeID`),
-  ADD KEY `CategoryID` (`CategoryID`);
+  ADD KEY `CategoryID` (`CategoryID`),
+  ADD KEY `TypeName` (`TypeName`);
 
 --
 -- AUTO_INCREMENT for dumped tables
@@ -328,6 +565,12 @@ ALTER TABLE `accounts`
 ALTER TABLE `category`
   MODIFY `CategoryID` int(11) NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=5;
 
+--
+-- AUTO_INCREMENT for table `changes`
+--
+ALTER TABLE `changes`
+  MODIFY `ChangeSeq` bigint(20) NOT NULL AUTO_INCREMENT;
+
 --
 -- AUTO_INCREMENT for table `logs`
 --
@@ -340,18 +583,36 @@ ALTER TABLE `logs`
 ALTER TABLE `products`
   MODIFY `ProductID` int(11) NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=28;
 
+--
+-- AUTO_INCREMENT for table `purchase_orders`
+--
+ALTER TABLE `purchase_orders`
+  MODIFY `OrderID` int(11) NOT NULL AUTO_INCREMENT;
+
 --
 -- AUTO_INCREMENT for table `stockin`
 --
 ALTER TABLE `stockin`
   MODIFY `StockInID` int(11) NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=19;
 
+--
+-- AUTO_INCREMENT for table `stockin_archive`
+--
+ALTER TABLE `stockin_archive`
+  MODIFY `StockInID` int(11) NOT NULL AUTO_INCREMENT;
+
 --
 -- AUTO_INCREMENT for table `stockout`
 --
 ALTER TABLE `stockout`
   MODIFY `StockOutID` int(11) NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=20;
 
+--
+-- AUTO_INCREMENT for table `stockout_archive`
+--
+ALTER TABLE `stockout_archive`
+  MODIFY `StockOutID` int(11) NOT NULL AUTO_INCREMENT;
+
 --
 -- AUTO_INCREMENT for table `suppliers`
 --
@@ -368,13 +629,6 @@ ALTER TABLE `type`
 -- Constraints for dumped tables
 --
 
---
--- Constraints for table `logs`
---
-ALTER TABLE `logs`
-  ADD CONSTRAINT `logs_ibfk_1` FOREIGN KEY (`AccountID`) REFERENCES `accounts` (`AccountID`),
-  ADD CONSTRAINT `logs_ibfk_2` FOREIGN KEY (`ProductID`) REFERENCES `products` (`ProductID`);
-
 --
 -- Constraints for table `products`
 --
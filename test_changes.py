@@ -0,0 +1,56 @@
+from Changes import GAP_TIMEOUT, MAX_GAPS, PRODUCT, SUPPLIER, UPSERT, DELETE, collapse_changes
+
+
+def test_collapses_to_last_action_per_id():
+    rows = [(1, PRODUCT, 5, UPSERT), (2, SUPPLIER, 1, UPSERT), (3, PRODUCT, 5, DELETE)]
+    gaps = {}
+    changes, last_seq = collapse_changes(rows, 0, gaps, now=100.0)
+    assert changes == {PRODUCT: {5: DELETE}, SUPPLIER: {1: UPSERT}}
+    assert last_seq == 3
+    assert gaps == {}
+
+
+def test_skipped_numbers_become_gaps():
+    gaps = {}
+    changes, last_seq = collapse_changes([(2, PRODUCT, 1, UPSERT), (5, PRODUCT, 2, UPSERT)], 1, gaps, now=100.0)
+    assert last_seq == 5
+    assert changes == {PRODUCT: {1: UPSERT, 2: UPSERT}}
+    assert gaps == {3: 100.0, 4: 100.0}
+
+
+def test_late_commit_fills_its_gap_once():
+    gaps = {3: 100.0, 4: 100.0}
+    # 4 commits after 5 was seen: applied, and its gap closed
+    changes, last_seq = collapse_changes([(4, PRODUCT, 9, UPSERT)], 5, gaps, now=101.0)
+    assert changes == {PRODUCT: {9: UPSERT}}
+    assert last_seq == 5
+    assert gaps == {3: 100.0}
+    # Reading it again (e.g. through the missing list) applies nothing
+    changes, last_seq = collapse_changes([(4, PRODUCT, 9, UPSERT)], 5, gaps, now=102.0)
+    assert changes == {}
+
+
+def test_already_applied_rows_are_ignored():
+    gaps = {}
+    changes, last_seq = collapse_changes([(3, PRODUCT, 1, UPSERT), (4, PRODUCT, 2, UPSERT)], 3, gaps, now=0.0)
+    assert changes == {PRODUCT: {2: UPSERT}}
+    assert last_seq == 4
+
+
+def test_gaps_expire_after_timeout():
+    gaps = {3: 100.0, 4: 100.0 + GAP_TIMEOUT}
+    changes, last_seq = collapse_changes([], 5, gaps, now=100.0 + GAP_TIMEOUT + 1)
+    assert changes == {}
+    assert last_seq == 5
+    assert gaps == {4: 100.0 + GAP_TIMEOUT}
+    # An expired number that turns up later is treated as already applied
+    changes, _ = collapse_changes([(3, PRODUCT, 7, UPSERT)], 5, gaps, now=200.0)
+    assert changes == {}
+
+
+def test_oldest_gaps_dropped_past_max():
+    gaps = {}
+    collapse_changes([(MAX_GAPS + 12, PRODUCT, 1, UPSERT)], 0, gaps, now=0.0)
+    assert len(gaps) == MAX_GAPS
+    assert min(gaps) == 12
+    assert max(gaps) == MAX_GAPS + 11
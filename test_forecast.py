@@ -0,0 +1,61 @@
+import math
+import numpy as np
+from Forecast import forecast
+
+# Four days of history, a lead time of four days (sqrt = 2), z = 1.5, and an
+# order cost and holding rate that keep the EOQ arithmetic readable.
+DAYS, LEAD, Z, ORDER_COST, HOLDING = 4, 4, 1.5, 50, 0.25
+
+PRODUCT_IDS = np.array([1, 2, 3, 4])
+PRICES = np.array([10, 20, 40, 0])
+USAGE = np.array([
+    # (ProductID, day, quantity); product 1 never sold
+    (2, 0, 3), (2, 1, 3), (2, 2, 3), (2, 3, 3),
+    (3, 0, 8), (3, 2, 4),
+    (4, 1, 2),
+    (99, 0, 50),  # not an active product
+])
+
+
+def _result():
+    return forecast(PRODUCT_IDS, PRICES, USAGE, DAYS, lead_time=LEAD, z=Z,
+                    order_cost=ORDER_COST, holding_rate=HOLDING)
+
+
+def test_product_without_stock_outs_needs_nothing():
+    result = _result()
+    assert result["rate"][0] == 0 and result["deviation"][0] == 0
+    assert (result["safety_stock"][0], result["reorder_point"][0], result["order_quantity"][0]) == (0, 0, 0)
+
+
+def test_constant_demand_has_no_safety_stock():
+    result = _result()
+    assert result["rate"][1] == 3
+    assert result["deviation"][1] == 0
+    assert result["safety_stock"][1] == 0
+    assert result["reorder_point"][1] == 12  # 3 a day over 4 days
+    # sqrt(2 * 365 * 3 * 50 / (20 * 0.25)) = sqrt(21900) = 147.99
+    assert result["order_quantity"][1] == 148
+
+
+def test_variable_demand():
+    result = _result()
+    # Days of 8, 0, 4, 0: mean 3, variance 80 / 4 - 9 = 11
+    assert result["rate"][2] == 3
+    assert math.isclose(result["deviation"][2], math.sqrt(11))
+    assert result["safety_stock"][2] == 10  # ceil(1.5 * 3.317 * 2) = ceil(9.95)
+    assert result["reorder_point"][2] == 22
+    # sqrt(2 * 365 * 3 * 50 / (40 * 0.25)) = sqrt(10950) = 104.64
+    assert result["order_quantity"][2] == 105
+
+
+def test_free_product_gets_no_order_quantity():
+    result = _result()
+    assert result["rate"][3] == 0.5
+    assert result["order_quantity"][3] == 0
+
+
+def test_empty_history():
+    result = forecast(PRODUCT_IDS, PRICES, np.empty((0, 3), dtype=np.int64), DAYS)
+    assert not result["reorder_point"].any() and not result["order_quantity"].any()
+    assert result["reorder_point"].dtype == np.int64
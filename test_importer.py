@@ -0,0 +1,70 @@
+from datetime import date, datetime
+import pytest
+from Importer import ImportFailed, import_products
+
+HEADER = ["Product Name", "Type", "Supplier", "Price", "Quantity", "Reorder Level", "Date Supplied"]
+
+
+class _Cursor:
+    def __init__(self):
+        self.inserted = []
+        self._rows = []
+        self.lastrowid = None
+
+    def execute(self, sql, params=()):
+        if sql.startswith("SELECT TypeID"):
+            self._rows = [(3, "Mouse")]
+        elif sql.startswith("SELECT SupplierID"):
+            self._rows = [(1, "PC Hub")]
+
+    def executemany(self, sql, rows):
+        self.inserted.extend(rows)
+
+    def fetchall(self):
+        return self._rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Connection:
+    def __init__(self):
+        self.cursor_ = _Cursor()
+
+    def cursor(self):
+        return self.cursor_
+
+
+def _import(*rows):
+    conn = _Connection()
+    import_products(conn, [HEADER, *rows])
+    return [row[7] for row in conn.cursor_.inserted]
+
+
+def test_date_supplied_accepts_text_and_spreadsheet_dates():
+    assert _import(
+        ["Mouse A", "Mouse", "PC Hub", "100", "2", "1", "2025-10-06 14:30:05"],
+        ["Mouse B", "Mouse", "PC Hub", "100", "2", "1", " 2025-10-06 "],
+        ["Mouse C", "Mouse", "PC Hub", "100", "2", "1", datetime(2025, 10, 6, 9, 15)],
+        ["Mouse D", "Mouse", "PC Hub", "100", "2", "1", date(2025, 10, 6)],
+    ) == ["2025-10-06 14:30:05", "2025-10-06 00:00:00", "2025-10-06 09:15:00", "2025-10-06 00:00:00"]
+
+
+def test_blank_date_supplied_defaults_to_now():
+    [supplied] = _import(["Mouse A", "Mouse", "PC Hub", "100", "2", "1", ""])
+    assert abs(datetime.strptime(supplied, "%Y-%m-%d %H:%M:%S") - datetime.now()).total_seconds() < 60
+
+
+@pytest.mark.parametrize("value", ["06/10/2025", "2025-13-01", "yesterday"])
+def test_bad_date_supplied_names_its_line(value):
+    with pytest.raises(ImportFailed, match=r"^Line 3: Date Supplied must be a date"):
+        _import(["Mouse A", "Mouse", "PC Hub", "100", "2", "1", "2025-10-06"],
+                ["Mouse B", "Mouse", "PC Hub", "100", "2", "1", value])
+
+
+def test_bad_number_names_its_line():
+    with pytest.raises(ImportFailed, match=r"^Line 2: Quantity must be a whole number"):
+        _import(["Mouse A", "Mouse", "PC Hub", "100", "2.5", "1", "2025-10-06"])
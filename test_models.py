@@ -0,0 +1,28 @@
+from array import array
+from PyQt6.QtCore import Qt
+from Models import ProductTableModel, INVENTORY_COLUMNS
+
+ROW = (1, "Mouse", "Peripheral", "PC Hub", 350, 20, 7000, 5, "2026-01-05")
+
+
+def _cell(model, row, column):
+    return model.data(model.index(row, column), Qt.ItemDataRole.DisplayRole)
+
+
+def test_forecast_columns_keep_numbers_and_show_null_blank():
+    model = ProductTableModel(INVENTORY_COLUMNS)
+    model.set_rows([ROW + (1.25, 14, 60), (2,) + ROW[1:] + (None, None, None)])
+    assert model.value(0, 9) == 1.25
+    assert model.value(0, 10) == 14
+    assert [_cell(model, 0, column) for column in (9, 10, 11)] == ["1.25", "14", "60"]
+    assert [_cell(model, 1, column) for column in (9, 10, 11)] == ["", "", ""]
+    assert model.text(1, 10) == ""
+
+
+def test_int_columns_stay_packed_until_a_null_arrives():
+    model = ProductTableModel(INVENTORY_COLUMNS)
+    model.set_rows([ROW + (1.25, 14, 60)])
+    assert isinstance(model._columns[10], array)
+    model.append_rows([(2,) + ROW[1:] + (None, None, None)])
+    assert model._columns[10] == [14, None]
+    assert _cell(model, 1, 10) == ""
@@ -0,0 +1,141 @@
+import os
+from datetime import date
+import pytest
+import PracStore
+from PracStore import StoreError, open_store
+
+DAY = date(2026, 1, 5)
+
+
+def _seeded(path, snapshot_every=PracStore.SNAPSHOT_EVERY):
+    store = open_store(str(path), snapshot_every)
+    store.add_supplier("S1", "PC Hub", "0917")
+    store.add_product("P1", "Widget", 10, 5, "S1")
+    store.add_product("P2", "Gadget", 20, 8, "S1")
+    return store
+
+
+def _journal(path):
+    return os.path.join(str(path), "journal.jsonl")
+
+
+def test_orders_are_found_by_id_and_delivered_once(tmp_path):
+    store = _seeded(tmp_path)
+    order_id = store.create_order("S1", "P1", 7, "2026-02-01", today=DAY)
+    assert store.order(order_id) == (1, "S1", "P1", 7, DAY, date(2026, 2, 1), "Pending")
+    store.mark_delivered(order_id)
+    assert store.products["P1"].quantity == 12
+    with pytest.raises(StoreError, match="already delivered"):
+        store.mark_delivered(order_id)
+    with pytest.raises(StoreError, match="not found"):
+        store.mark_delivered(2)
+    assert store.order(0) is None
+
+
+def test_rejects_bad_input(tmp_path):
+    store = _seeded(tmp_path)
+    with pytest.raises(StoreError, match="YYYY-MM-DD"):
+        store.create_order("S1", "P1", 1, "next week")
+    with pytest.raises(StoreError, match="Not enough stock"):
+        store.record_sale("P1", 6)
+    with pytest.raises(StoreError, match="already exists"):
+        store.add_product("P1", "Again", 1, 1)
+
+
+def test_reused_product_id_keeps_old_sales_apart(tmp_path):
+    store = _seeded(tmp_path)
+    store.record_sale("P1", 2, today=DAY)
+    store.delete_product("P1")
+    store.add_product("P1", "Widget2", 10, 5, "S1")
+    store.record_sale("P1", 1, today=DAY)
+    assert list(store.sales()) == [("Widget", 2, DAY), ("Widget2", 1, DAY)]
+    assert store.sales_by_product() == [("P1", "Widget", 2), ("P1", "Widget2", 1)]
+
+
+def test_order_for_deleted_product_is_not_credited_to_its_successor(tmp_path):
+    store = _seeded(tmp_path)
+    order_id = store.create_order("S1", "P1", 4, "2026-02-01")
+    store.delete_product("P1")
+    store.add_product("P1", "Widget2", 10, 5, "S1")
+    with pytest.raises(StoreError, match="no longer exists"):
+        store.mark_delivered(order_id)
+    assert store.products["P1"].quantity == 5
+
+
+def test_totals_of_same_named_products_stay_apart(tmp_path):
+    store = _seeded(tmp_path)
+    store.add_product("P3", "Widget", 10, 5, "S1")
+    store.record_sale("P1", 2)
+    store.record_sale("P3", 3)
+    store.record_sale("P1", 1)
+    assert store.sales_by_product() == [("P1", "Widget", 3), ("P3", "Widget", 3)]
+
+
+def test_renames_show_in_reports(tmp_path):
+    store = _seeded(tmp_path)
+    store.record_sale("P2", 1, today=DAY)
+    store.update_product("P2", name="Gadget Pro")
+    assert list(store.sales()) == [("Gadget Pro", 1, DAY)]
+
+
+def _state(store):
+    return (store._state(), {key: (p.name, p.price, p.quantity, p.supplier) for key, p in store.products.items()})
+
+
+def test_journal_replays_without_a_snapshot(tmp_path):
+    store = _seeded(tmp_path)
+    store.create_order("S1", "P2", 3, "2026-02-01", today=DAY)
+    store.mark_delivered(1)
+    store.record_sale("P2", 4, today=DAY)
+    expected = _state(store)
+    # No close(): as after a crash, only the journal is on disk
+    assert not os.path.exists(os.path.join(str(tmp_path), "snapshot.pickle"))
+    assert _state(open_store(str(tmp_path))) == expected
+
+
+def test_torn_last_line_is_dropped_and_truncated(tmp_path):
+    store = _seeded(tmp_path)
+    store.record_sale("P1", 1, today=DAY)
+    expected = _state(store)
+    store._journal.write('[5, "sale", "P1", 3')
+    store._journal.flush()
+
+    reopened = open_store(str(tmp_path))
+    assert _state(reopened) == expected
+    reopened.record_sale("P2", 2, today=DAY)
+    # The next entry starts on a line of its own, so it survives another restart
+    assert list(open_store(str(tmp_path)).sales()) == [("Widget", 1, DAY), ("Gadget", 2, DAY)]
+
+
+def test_close_snapshots_and_empties_the_journal(tmp_path):
+    store = _seeded(tmp_path)
+    store.record_sale("P1", 1, today=DAY)
+    expected = _state(store)
+    store.close()
+    assert os.path.getsize(_journal(tmp_path)) == 0
+    assert _state(open_store(str(tmp_path))) == expected
+
+
+def test_snapshot_every_folds_the_journal(tmp_path):
+    store = _seeded(tmp_path, snapshot_every=2)
+    assert os.path.exists(os.path.join(str(tmp_path), "snapshot.pickle"))
+    with open(_journal(tmp_path)) as f:
+        assert len(f.readlines()) == 1  # product P2, added after the snapshot taken at P1
+    store.record_sale("P1", 1, today=DAY)
+    assert os.path.getsize(_journal(tmp_path)) == 0
+    assert list(open_store(str(tmp_path)).sales()) == [("Widget", 1, DAY)]
+
+
+def test_entries_already_in_the_snapshot_are_skipped(tmp_path):
+    store = _seeded(tmp_path)
+    store.record_sale("P1", 2, today=DAY)
+    with open(_journal(tmp_path)) as f:
+        journal = f.read()
+    expected = _state(store)
+    store.close()
+    # Crash between writing the snapshot and emptying the journal
+    with open(_journal(tmp_path), "w") as f:
+        f.write(journal)
+    reopened = open_store(str(tmp_path))
+    assert _state(reopened) == expected
+    assert reopened.products["P1"].quantity == 3
@@ -0,0 +1,106 @@
+import pytest
+from Database import ConnectionPool
+from Reference import ReferenceCache
+
+
+class _Cursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.lastrowid = None
+
+    def execute(self, sql, params=()):
+        self.conn.statements.append(sql.split()[0])
+        if sql.startswith("INSERT INTO suppliers"):
+            self.lastrowid = 7
+
+    def fetchone(self):
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Connection:
+    def __init__(self):
+        self.statements = []
+
+    def cursor(self):
+        return _Cursor(self)
+
+    def begin(self):
+        self.statements.append("BEGIN")
+
+    def commit(self):
+        self.statements.append("COMMIT")
+
+    def rollback(self):
+        self.statements.append("ROLLBACK")
+
+
+def _cache():
+    pool = ConnectionPool()
+    conn = _Connection()
+    # Already checked out on this thread, so the pool never dials the server
+    pool._local.conn = conn
+    cache = ReferenceCache(pool)
+    cache._loaded_at["suppliers"] = float("inf")
+    cache._tables["suppliers"] = ((1, "PC Hub"),)
+    return pool, conn, cache
+
+
+def test_new_supplier_drops_the_cache_only_after_commit():
+    pool, conn, cache = _cache()
+    with pool.transaction(), conn.cursor() as cursor:
+        assert cache.resolve_supplier(cursor, "TechSource") == 7
+        assert "suppliers" in cache._loaded_at
+    assert conn.statements[-1] == "COMMIT"
+    assert "suppliers" not in cache._loaded_at
+
+
+def test_rolled_back_supplier_keeps_the_cache():
+    pool, conn, cache = _cache()
+    with pytest.raises(RuntimeError):
+        with pool.transaction(), conn.cursor() as cursor:
+            cache.resolve_supplier(cursor, "TechSource")
+            raise RuntimeError("product insert failed")
+    assert conn.statements[-1] == "ROLLBACK"
+    assert "suppliers" in cache._loaded_at
+    # The dropped callback does not fire with the next transaction
+    with pool.transaction():
+        pass
+    assert "suppliers" in cache._loaded_at
+
+
+def test_known_supplier_needs_no_query():
+    pool, conn, cache = _cache()
+    with pool.transaction(), conn.cursor() as cursor:
+        assert cache.resolve_supplier(cursor, " pc hub ") == 1
+    assert conn.statements == ["BEGIN", "COMMIT"]
+    assert "suppliers" in cache._loaded_at
+
+
+class _RacingPool:
+    """Returns canned rows and lets the test run code while the fetch is in flight."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.during_fetch = None
+
+    def run(self, fn, sql):
+        rows = self.results.pop(0)
+        if self.during_fetch:
+            self.during_fetch()
+            self.during_fetch = None
+        return rows
+
+
+def test_invalidate_during_a_fetch_keeps_its_rows_out_of_the_cache():
+    pool = _RacingPool(((1, "PC Hub"),), ((1, "PC Hub"), (7, "TechSource")))
+    cache = ReferenceCache(pool)
+    pool.during_fetch = lambda: cache.invalidate("suppliers")
+    assert cache.suppliers() == [(1, "PC Hub")]
+    assert cache.supplier_id("TechSource") == 7
+    assert cache.suppliers() == [(1, "PC Hub"), (7, "TechSource")]
@@ -0,0 +1,61 @@
+from datetime import date
+from Reports import EXPORT_REPORTS, count_report, fetch_report_page
+
+
+class _Cursor:
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, sql, params=()):
+        assert sql.count("%s") == len(params)
+        self.executed.append((" ".join(sql.split()), list(params)))
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        return (0,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Connection:
+    def __init__(self):
+        self.cursor_ = _Cursor()
+
+    def cursor(self):
+        return self.cursor_
+
+
+FILTERS = {"start": date(2020, 1, 1), "product": "mouse"}
+
+
+def test_report_pages_read_the_ledger_and_its_archive():
+    conn = _Connection()
+    fetch_report_page(conn, "stockin", FILTERS, after_id=900, limit=50)
+    [(sql, params)] = conn.cursor_.executed
+    assert "FROM stockin s" in sql and "FROM stockin_archive s" in sql
+    assert sql.count("ORDER BY s.StockInID DESC LIMIT %s") == 2
+    assert sql.endswith(") ORDER BY StockInID DESC LIMIT %s")
+    branch = [date(2020, 1, 1), "%mouse%", 900, 50]
+    assert params == branch + branch + [50]
+
+
+def test_report_counts_add_the_archive():
+    conn = _Connection()
+    count_report(conn, "stockout", FILTERS)
+    [(sql, params)] = conn.cursor_.executed
+    assert sql.startswith("SELECT (SELECT COUNT(*) FROM stockout s JOIN products p")
+    assert "+ (SELECT COUNT(*) FROM stockout_archive s JOIN products p" in sql
+    assert params == [date(2020, 1, 1), "%mouse%"] * 2
+
+
+def test_exports_include_archived_movements():
+    for report, table in (("Stock Ins", "stockin"), ("Stock Outs", "stockout")):
+        sql = EXPORT_REPORTS[report][1]
+        assert f"FROM {table} s" in sql and f"FROM {table}_archive s" in sql
+        assert "{table}" not in sql
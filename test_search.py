@@ -0,0 +1,106 @@
+from Search import ProductIndex, SearchController
+
+
+def _row(product_id, name, type_name="Mouse", supplier="PC Hub"):
+    return (product_id, name, type_name, supplier, 100, 1, 100, 1, "2025-10-06 12:00:00")
+
+
+def _ids(rows):
+    return [row[0] for row in rows]
+
+
+def _index():
+    index = ProductIndex()
+    index.add_many([
+        _row(1, "Logitech K120 Keyboard", "Keyboard"),
+        _row(2, "Razer DeathAdder Mouse"),
+        _row(12, "Logitech C270 Webcam", "Webcam", "TechSource"),
+        _row(21, "Intel Core i5 CPU", "CPU"),
+    ])
+    return index
+
+
+def test_ranks_exact_id_then_id_prefix_then_text():
+    index = _index()
+    assert _ids(index.search("1")) == [1, 12]
+    assert _ids(index.search("12")) == [12, 1]  # 12 by ID, 1 by "K120" in its name
+
+
+def test_name_prefix_before_supplier_match():
+    assert _ids(_index().search("logi")) == [1, 12]
+    assert _ids(_index().search("techsource")) == [12]
+
+
+def test_substring_inside_words_and_across_words():
+    index = _index()
+    assert _ids(index.search("eathadd")) == [2]
+    assert _ids(index.search("core i5")) == [21]
+    assert _ids(index.search("i5 core")) == []
+
+
+def test_upsert_replaces_old_tokens():
+    index = _index()
+    index.upsert(_row(2, "Razer Viper Mouse"))
+    assert _ids(index.search("deathadder")) == []
+    assert _ids(index.search("viper")) == [2]
+    assert len(index) == 4
+
+
+def test_upsert_adds_new_product():
+    index = _index()
+    index.upsert(_row(30, "HyperX Cloud Headset", "Headset"))
+    assert _ids(index.search("hyperx")) == [30]
+    assert _ids(index.search("3")) == [30]
+
+
+def test_remove_drops_product_from_every_lookup():
+    index = _index()
+    index.remove(12)
+    assert _ids(index.search("webcam")) == []
+    assert _ids(index.search("12")) == [1]
+    assert _ids(index.search("logitech")) == [1]
+    assert len(index) == 3
+
+
+def test_limit_and_blank_query():
+    index = _index()
+    assert len(index.search("o", limit=2)) == 2
+    assert index.search("   ") == []
+
+
+def _controller():
+    controller = SearchController(None, None)
+    tasks = []
+    controller.workers.start = tasks.append
+    return controller, tasks
+
+
+def test_only_the_newest_index_build_applies_the_log():
+    controller, tasks = _controller()
+    controller.load_index()
+    controller.index_upsert(_row(30, "Old Write Mouse"))
+    controller.load_index()
+    controller.index_upsert(_row(31, "New Write Mouse"))
+    first, second = (task.generation for task in tasks)
+
+    controller._on_index_built(first, _index())
+    assert controller.index is None
+    controller._on_index_built(second, _index())
+    assert _ids(controller.index.search("write")) == [31]
+    assert controller._index_log is None
+    # Once built, writes go straight to the index
+    controller.index_remove(31)
+    assert controller._index_log is None
+    assert controller.index.search("write") == []
+
+
+def test_failed_build_stops_logging():
+    controller, tasks = _controller()
+    controller.load_index()
+    controller.load_index()
+    controller._on_index_failed(tasks[0].generation)
+    assert controller._index_log == []
+    controller._on_index_failed(tasks[1].generation)
+    assert controller._index_log is None
+    controller.index_upsert(_row(30, "Mouse"))
+    assert controller._index_log is None and controller.index is None
@@ -0,0 +1,133 @@
+import pymysql
+import pytest
+import Stock
+from Stock import StockError, batch_totals
+
+
+def test_batch_totals_merges_repeats_in_first_seen_order():
+    assert list(batch_totals([(3, 2), ("1", 5), (3, 4)]).items()) == [(3, 6), (1, 5)]
+
+
+@pytest.mark.parametrize("quantity", [0, -1])
+def test_batch_totals_rejects_non_positive(quantity):
+    with pytest.raises(StockError, match="product 2"):
+        batch_totals([(1, 1), (2, quantity)])
+
+
+def test_check_batch_lists_every_missing_product():
+    with pytest.raises(StockError, match="retired: 2, 4"):
+        Stock._check_batch("stockin", {1: 1, 2: 1, 4: 1}, {1: 10, 2: None})
+
+
+def test_check_batch_stock_in_ignores_balances():
+    Stock._check_batch("stockin", {1: 50}, {1: 0})
+
+
+def test_check_batch_lists_every_short_product():
+    with pytest.raises(StockError) as error:
+        Stock._check_batch("stockout", {1: 5, 2: 3, 3: 9}, {1: 4, 2: 3, 3: 1})
+    message = str(error.value)
+    assert "1 (wants 5, 4 on hand)" in message
+    assert "3 (wants 9, 1 on hand)" in message
+    assert "2 (" not in message
+
+
+class _Cursor:
+    def __init__(self, on_hand, statements):
+        self.on_hand = on_hand
+        self.statements = statements
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        sql = " ".join(sql.split())
+        self.statements.append(sql)
+        self.rows = list(self.on_hand.items()) if "FOR UPDATE" in sql else []
+
+    def executemany(self, sql, seq):
+        self.statements.append(" ".join(sql.split()))
+
+    def fetchall(self):
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class _Connection:
+    def __init__(self, on_hand):
+        self.on_hand = on_hand
+        self.statements = []
+
+    def cursor(self):
+        return _Cursor(self.on_hand, self.statements)
+
+
+def test_short_batch_changes_nothing():
+    conn = _Connection({1: 10, 2: 1})
+    with pytest.raises(StockError, match="2 \\(wants 3, 1 on hand\\)"):
+        Stock.stock_out_batch(conn, 4, [(1, 2), (2, 3)])
+    assert not any(sql.startswith(("UPDATE", "INSERT INTO stockout", "INSERT INTO changes"))
+                   for sql in conn.statements)
+    # The session table is emptied even when the batch is refused
+    assert conn.statements[-1] == "DELETE FROM stock_batch"
+
+
+class _LostCursor(_Cursor):
+    """Loses the connection at the locking read, like a deadlock or dropped link would."""
+
+    def execute(self, sql, params=None):
+        if self.statements[-1:] == ["LOST"]:
+            self.statements.append("GONE")
+            raise pymysql.err.OperationalError(2006, "MySQL server has gone away")
+        if "FOR UPDATE" in sql:
+            self.statements.append("LOST")
+            raise pymysql.err.OperationalError(2013, "Lost connection to MySQL server during query")
+        super().execute(sql, params)
+
+
+def test_cleanup_failure_keeps_the_original_error():
+    conn = _Connection({1: 10})
+    conn.cursor = lambda: _LostCursor(conn.on_hand, conn.statements)
+    with pytest.raises(pymysql.err.OperationalError, match="during query"):
+        Stock.stock_in_batch(conn, 4, [(1, 2)])
+    assert conn.statements[-2:] == ["LOST", "GONE"]
+
+
+class _MoveCursor:
+    """Answers _move's balance UPDATE with ``changed`` rows and its follow-up SELECT with ``on_hand``."""
+
+    def __init__(self, changed, on_hand):
+        self.changed = changed
+        self.on_hand = on_hand
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self.rowcount = self.changed if sql.lstrip().startswith("UPDATE") else 1
+
+    def fetchone(self):
+        return None if self.on_hand is None else (self.on_hand,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class _MoveConnection:
+    def __init__(self, changed, on_hand):
+        self.cursor = lambda: _MoveCursor(changed, on_hand)
+
+
+@pytest.mark.parametrize("ledger, on_hand, message", [
+    ("stockout", 3, "Cannot issue more than current stock \\(3 on hand\\)"),
+    ("stockin", 3, "product 1 was not updated \\(0 rows changed\\)"),
+    ("stockin", None, "Product 1 no longer exists"),
+    ("stockout", None, "Product 1 no longer exists"),
+])
+def test_move_reports_why_the_balance_did_not_change(ledger, on_hand, message):
+    with pytest.raises(StockError, match=message):
+        Stock._move(_MoveConnection(0, on_hand), ledger, 1, 4, 5)